@@ -42,6 +42,10 @@ def create_app(config_name='config'):
     """
     app = Flask(__name__, template_folder='templates', static_folder='static')
     
+    # Serialize JSON responses through orjson when available
+    from services.json_provider import OrjsonProvider
+    app.json = OrjsonProvider(app)
+    
     # Load configuration
     app.config.from_object(config_name)
     
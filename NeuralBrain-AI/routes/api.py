@@ -730,7 +730,7 @@ def cloud_status():
     Get current cloud deployment status and configuration.
     """
     try:
-        config = CloudConfig()
+        config = CloudConfig.get()
         
         return jsonify({
             'status': 'success',
@@ -28,6 +28,11 @@ logger = logging.getLogger(__name__)
 
 real_data_api = Blueprint('real_data_api', __name__, url_prefix='/api')
 
+
+def _json_response(body: bytes):
+    """Serve an already-encoded JSON body from the scheduler cache"""
+    return current_app.response_class(body, status=200, mimetype='application/json')
+
 # ═══════════════════════════════════════════════════════════════════════════
 # PRIMARY REAL DATA ENDPOINTS - ALL CALCULATIONS VIA GPT
 # ═══════════════════════════════════════════════════════════════════════════
@@ -48,10 +53,10 @@ def get_dashboard_metrics():
         logger.info("📊 Dashboard metrics requested")
         
         # Get latest cached predictions (updated hourly by scheduler)
-        cached = PredictionScheduler.get_latest_predictions()
-        if cached and 'dashboard_metrics' in cached:
+        cached = PredictionScheduler.get_latest_json('dashboard_metrics')
+        if cached is not None:
             logger.info("✅ Returning cached dashboard metrics")
-            return jsonify(cached['dashboard_metrics']), 200
+            return _json_response(cached)
         
         # Fallback: generate on-demand
         logger.info("⚠️ Cache miss, generating metrics on-demand...")
@@ -83,16 +88,17 @@ def get_outbreak_predictions():
         logger.info("🔮 Outbreak predictions requested")
         
         # Try cached first
-        cached = PredictionScheduler.get_latest_predictions()
-        if cached and 'predictions' in cached:
+        cached = PredictionScheduler.get_latest_json('predictions')
+        if cached is not None:
             logger.info("✅ Returning cached predictions")
-            return jsonify(cached['predictions']), 200
+            return _json_response(cached)
         
         # Generate on-demand
         logger.info("⚠️ Generating predictions on-demand...")
-        global_stats = DiseaseDataService.get_global_stats()
-        countries = DiseaseDataService.get_countries_data()
-        historical = DiseaseDataService.get_historical_data(days=60)
+        data = DiseaseDataService.get_all_data(days=60)
+        global_stats = data['global_stats']
+        countries = data['countries']
+        historical = data['historical']
         
         # GPT predictions
         predictor = PredictionService()
@@ -129,10 +135,10 @@ def get_system_alerts():
         logger.info("🚨 System alerts requested")
         
         # Try cached first
-        cached = PredictionScheduler.get_latest_predictions()
-        if cached and 'alerts' in cached:
+        cached = PredictionScheduler.get_latest_json('alerts')
+        if cached is not None:
             logger.info("✅ Returning cached alerts")
-            return jsonify(cached['alerts']), 200
+            return _json_response(cached)
         
         # Generate on-demand
         logger.info("⚠️ Generating alerts on-demand...")
@@ -183,15 +189,15 @@ def get_regional_data():
         logger.info("🗺️ Regional data requested")
         
         # Try cached first
-        cached = PredictionScheduler.get_latest_predictions()
-        if cached and 'map_data' in cached:
+        cached = PredictionScheduler.get_latest_json('map_data')
+        if cached is not None:
             logger.info("✅ Returning cached map data")
-            return jsonify({"regions": cached['map_data']}), 200
+            return _json_response(b'{"regions":' + cached + b'}')
         
         # Generate on-demand
         logger.info("⚠️ Generating regional data on-demand...")
         regional_risks = DiseaseDataService.get_regional_outbreak_risk()
-        map_data = DataNormalizer.normalize_map_data(regional_risks)
+        map_data = DataNormalizer.normalize_map_points(regional_risks)
         
         logger.info(f"✅ Regional data: {len(map_data)} countries")
         return jsonify({"regions": map_data}), 200
@@ -222,10 +228,10 @@ def get_health_analytics():
         logger.info("❤️ Health analytics requested")
         
         # Try cached first
-        cached = PredictionScheduler.get_latest_predictions()
-        if cached and 'analytics' in cached:
+        cached = PredictionScheduler.get_latest_json('analytics')
+        if cached is not None:
             logger.info("✅ Returning cached analytics")
-            return jsonify(cached['analytics']), 200
+            return _json_response(cached)
         
         # Generate on-demand
         logger.info("⚠️ Generating analytics on-demand...")
@@ -262,10 +268,10 @@ def get_health_trends():
         logger.info("📈 Health trends requested")
         
         # Try cached first
-        cached = PredictionScheduler.get_latest_predictions()
-        if cached and 'chart_data' in cached:
+        cached = PredictionScheduler.get_latest_json('chart_data')
+        if cached is not None:
             logger.info("✅ Returning cached trend data")
-            return jsonify(cached['chart_data']), 200
+            return _json_response(cached)
         
         # Generate on-demand
         logger.info("⚠️ Generating trend data on-demand...")
@@ -415,9 +421,10 @@ def debug_gpt_predictions():
         return jsonify({"error": "Debug mode disabled"}), 403
     
     try:
-        global_stats = DiseaseDataService.get_global_stats()
-        countries = DiseaseDataService.get_countries_data()
-        historical = DiseaseDataService.get_historical_data(days=60)
+        data = DiseaseDataService.get_all_data(days=60)
+        global_stats = data['global_stats']
+        countries = data['countries']
+        historical = data['historical']
         
         predictor = PredictionService()
         predictions = predictor.predict_outbreak_7_day(global_stats, countries, historical)
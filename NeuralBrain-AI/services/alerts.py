@@ -6,13 +6,21 @@ Simplified for Python 3.14 (No Numpy)
 
 import logging
 import math
+import os
 import uuid
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Deque, Dict, List, Optional, Sequence, Tuple, Any
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on alerts kept in memory; the oldest are evicted first
+MAX_ALERTS = int(os.getenv('ALERT_MAX', 100_000))
+
 
 class AlertSeverity(Enum):
     """Alert severity levels"""
@@ -41,6 +49,9 @@ class Alert:
         self.id = self._generate_id()
         self.type = alert_type
         self.severity = severity
+        # Enum .value resolved once; to_dict is called far more often than __init__
+        self._type_value = alert_type.value
+        self._severity_value = severity.value
         self.title = title
         self.message = message
         self.data = data or {}
@@ -58,8 +69,8 @@ class Alert:
         """Convert alert to dictionary"""
         return {
             'id': self.id,
-            'type': self.type.value,
-            'severity': self.severity.value,
+            'type': self._type_value,
+            'severity': self._severity_value,
             'title': self.title,
             'message': self.message,
             'data': self.data,
@@ -76,100 +87,200 @@ class Alert:
         self.acknowledged_by = user_id
 
 
+@dataclass
+class SpikeState:
+    """
+    Running mean/variance of a metric stream (Welford's online algorithm).
+    
+    With ``window`` set, only the most recent ``window`` samples contribute;
+    the evicted sample is removed from the running totals in O(1). The
+    window is kept in a float64 ring buffer (8 bytes per sample rather than
+    a list of boxed floats).
+    """
+    window: Optional[int] = None
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    _buf: array = field(init=False, repr=False)
+    _head: int = field(default=0, init=False, repr=False)
+    
+    def __post_init__(self):
+        self._buf = array('d', bytes(8 * (self.window or 0)))
+    
+    def push(self, x: float) -> None:
+        """Add a sample, evicting the oldest one if the window is full"""
+        if self.window:
+            if self.n >= self.window:
+                self._remove(self._buf[self._head])
+            self._buf[self._head] = x
+            self._head = (self._head + 1) % self.window
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+    
+    @property
+    def values(self) -> List[float]:
+        """Samples currently in the window, oldest first"""
+        if self.n < len(self._buf):
+            return self._buf[:self.n].tolist()
+        return (self._buf[self._head:] + self._buf[:self._head]).tolist()
+    
+    def _remove(self, x: float) -> None:
+        """Reverse Welford update for a sample leaving the window"""
+        if self.n <= 1:
+            self.n, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        self.n -= 1
+        delta = x - self.mean
+        self.mean -= delta / self.n
+        self.m2 = max(0.0, self.m2 - delta * (x - self.mean))
+    
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the tracked samples"""
+        return math.sqrt(self.m2 / self.n) if self.n else 0.0
+
+
+def _spike_alert(current_value: float, mean: float, std: float,
+                 spike_threshold: float, metric_name: str) -> Optional[Alert]:
+    """Build a spike alert if current_value deviates beyond the threshold"""
+    # Zero-variance history never alerts; the guard is folded into the
+    # threshold test instead of a separate early return
+    z_score = abs((current_value - mean) / (std if std > 0 else 1.0))
+    
+    if std > 0 and z_score > spike_threshold:
+        severity = AlertSeverity.HIGH if z_score > 3.5 else AlertSeverity.MEDIUM
+        
+        return Alert(
+            alert_type=AlertType.SPIKE_DETECTED,
+            severity=severity,
+            title=f"Spike in {metric_name}",
+            message=f"{metric_name} value ({current_value}) is {z_score:.1f} standard deviations above normal ({mean:.1f})",
+            data={
+                'metric': metric_name,
+                'current_value': current_value,
+                'expected_mean': mean,
+                'std_dev': std,
+                # UI shows one decimal; two keeps the payload compact
+                'z_score': round(z_score, 2)
+            }
+        )
+    
+    return None
+
+
+def _detect_spike_core(current_value: float, historical_values: Sequence[float],
+                       spike_threshold: float, metric_name: str) -> Optional[Alert]:
+    """Spike detection over a full history; holds no state, safe across threads"""
+    if len(historical_values) < 3:
+        return None
+    
+    # Calculate mean
+    mean = sum(historical_values) / len(historical_values)
+    
+    # Calculate std dev
+    variance = sum((x - mean) ** 2 for x in historical_values) / len(historical_values)
+    std = math.sqrt(variance)
+    
+    return _spike_alert(current_value, mean, std, spike_threshold, metric_name)
+
+
+def _detect_trend_core(values: Sequence[float], metric_name: str,
+                       window_size: int) -> Optional[Alert]:
+    """Trend detection over the last window_size values; safe across threads"""
+    if len(values) < window_size:
+        return None
+    
+    recent_values = values[-window_size:]
+    n = len(recent_values)
+    
+    # Linear regression to find slope
+    # x are indices 0, 1, 2... so their sums have closed forms and
+    # only the y-dependent sums need a pass over the data
+    sum_x = n * (n - 1) // 2
+    sum_xx = (n - 1) * n * (2 * n - 1) // 6
+    sum_y = sum(recent_values)
+    sum_xy = sum(i * y for i, y in enumerate(recent_values))
+    
+    denominator = n * sum_xx - sum_x * sum_x
+    slope = (n * sum_xy - sum_x * sum_y) / denominator if denominator else 0.0
+    
+    # If slope is negative for health metrics, it's deteriorating
+    # Note: This logic assumes 'deterioration' means decreasing value
+    # For some metrics (like temperature/BP), increasing might be bad.
+    # Keeping original logic for now (-0.1 threshold)
+    if slope < -0.1:
+        severity = AlertSeverity.MEDIUM if slope > -0.5 else AlertSeverity.HIGH
+        
+        return Alert(
+            alert_type=AlertType.TREND_DETERIORATION,
+            severity=severity,
+            title=f"Deteriorating {metric_name}",
+            message=f"{metric_name} shows consistent deterioration trend (slope: {slope:.3f})",
+            data={
+                'metric': metric_name,
+                # Materialized only when the alert fires; the window may be
+                # a tuple or array.array slice rather than a list
+                'recent_values': list(recent_values),
+                'slope': slope,
+                'window_size': window_size
+            }
+        )
+    
+    return None
+
+
 class SpikeDetector:
     """Detects sudden spikes in health metrics using pure Python"""
     
     def __init__(self, spike_threshold: float = 2.0):
         self.spike_threshold = spike_threshold
     
-    def detect_spike(self, current_value: float, historical_values: List[float],
+    def detect_spike(self, current_value: float, historical_values: Sequence[float],
                      metric_name: str = "metric") -> Optional[Alert]:
-        """Detect if current value is a spike compared to history."""
-        if len(historical_values) < 3:
-            return None
-        
-        # Calculate mean
-        mean = sum(historical_values) / len(historical_values)
+        """
+        Detect if current value is a spike compared to history.
         
-        # Calculate std dev
-        variance = sum((x - mean) ** 2 for x in historical_values) / len(historical_values)
-        std = math.sqrt(variance)
-        
-        if std == 0:
-            return None
-        
-        z_score = abs((current_value - mean) / std)
-        
-        if z_score > self.spike_threshold:
-            severity = AlertSeverity.HIGH if z_score > 3.5 else AlertSeverity.MEDIUM
-            
-            return Alert(
-                alert_type=AlertType.SPIKE_DETECTED,
-                severity=severity,
-                title=f"Spike in {metric_name}",
-                message=f"{metric_name} value ({current_value}) is {z_score:.1f} standard deviations above normal ({mean:.1f})",
-                data={
-                    'metric': metric_name,
-                    'current_value': current_value,
-                    'expected_mean': mean,
-                    'std_dev': std,
-                    'z_score': z_score
-                }
-            )
+        historical_values may be any sequence (list, tuple, array.array);
+        it is read in place and never copied into a list.
+        """
+        return _detect_spike_core(current_value, historical_values,
+                                  self.spike_threshold, metric_name)
+    
+    def update_and_detect(self, current_value: float, state: SpikeState,
+                          metric_name: str = "metric") -> Optional[Alert]:
+        """
+        Streaming variant of detect_spike: O(1) per sample.
         
-        return None
+        The current value is compared against the stats held in ``state``
+        and then folded into it.
+        """
+        alert = None
+        if state.n >= 3:
+            alert = _spike_alert(current_value, state.mean, state.std,
+                                 self.spike_threshold, metric_name)
+        state.push(current_value)
+        return alert
 
 
 class TrendDetector:
     """Detects deteriorating health trends using pure Python"""
     
-    def detect_trend_deterioration(self, values: List[float], metric_name: str = "metric",
+    @staticmethod
+    def detect_trend_deterioration(values: Sequence[float], metric_name: str = "metric",
                                    window_size: int = 7) -> Optional[Alert]:
         """Detect if trend is deteriorating (worsening)."""
-        if len(values) < window_size:
-            return None
-        
-        recent_values = values[-window_size:]
-        n = len(recent_values)
-        
-        # Linear regression to find slope
-        # x are indices 0, 1, 2...
-        x = list(range(n))
-        y = recent_values
-        
-        sum_x = sum(x)
-        sum_y = sum(y)
-        sum_xy = sum(x[i] * y[i] for i in range(n))
-        sum_xx = sum(x[i] ** 2 for i in range(n))
-        
-        denominator = (n * sum_xx - sum_x ** 2)
-        
-        if denominator == 0:
-             slope = 0
-        else:
-             slope = (n * sum_xy - sum_x * sum_y) / denominator
-        
-        # If slope is negative for health metrics, it's deteriorating
-        # Note: This logic assumes 'deterioration' means decreasing value
-        # For some metrics (like temperature/BP), increasing might be bad.
-        # Keeping original logic for now (-0.1 threshold)
-        if slope < -0.1:
-            severity = AlertSeverity.MEDIUM if slope > -0.5 else AlertSeverity.HIGH
-            
-            return Alert(
-                alert_type=AlertType.TREND_DETERIORATION,
-                severity=severity,
-                title=f"Deteriorating {metric_name}",
-                message=f"{metric_name} shows consistent deterioration trend (slope: {slope:.3f})",
-                data={
-                    'metric': metric_name,
-                    'recent_values': recent_values,
-                    'slope': slope,
-                    'window_size': window_size
-                }
-            )
-        
-        return None
+        return _detect_trend_core(values, metric_name, window_size)
+
+
+# Static risk alert text; only the score is formatted per call
+_HIGH_RISK_TITLE = "⚠️ High Health Risk Detected"
+_HIGH_RISK_MSG_FMT = ("AI risk assessment indicates HIGH risk level (%.1f%%). "
+                      "Immediate medical consultation recommended.")
+_ELEVATED_RISK_TITLE = "⚠️ Elevated Health Risk"
+_ELEVATED_RISK_MSG_FMT = ("Risk assessment shows elevated risk level (%.1f%%). "
+                          "Consider lifestyle adjustments and medical monitoring.")
 
 
 class RiskAlertGenerator:
@@ -183,9 +294,8 @@ class RiskAlertGenerator:
             return Alert(
                 alert_type=AlertType.HIGH_RISK_SCORE,
                 severity=AlertSeverity.CRITICAL,
-                title="⚠️ High Health Risk Detected",
-                message=f"AI risk assessment indicates HIGH risk level ({risk_score:.1f}%). "
-                       "Immediate medical consultation recommended.",
+                title=_HIGH_RISK_TITLE,
+                message=_HIGH_RISK_MSG_FMT % risk_score,
                 data={
                     'risk_score': risk_score,
                     'risk_level': risk_level,
@@ -196,9 +306,8 @@ class RiskAlertGenerator:
             return Alert(
                 alert_type=AlertType.HIGH_RISK_SCORE,
                 severity=AlertSeverity.HIGH,
-                title="⚠️ Elevated Health Risk",
-                message=f"Risk assessment shows elevated risk level ({risk_score:.1f}%). "
-                       "Consider lifestyle adjustments and medical monitoring.",
+                title=_ELEVATED_RISK_TITLE,
+                message=_ELEVATED_RISK_MSG_FMT % risk_score,
                 data={
                     'risk_score': risk_score,
                     'risk_level': risk_level,
@@ -212,9 +321,10 @@ class RiskAlertGenerator:
 class AlertManager:
     """Central alert management system"""
     
-    def __init__(self):
+    def __init__(self, max_alerts: int = MAX_ALERTS):
         """Initialize alert manager"""
-        self.alerts: List[Alert] = []
+        self.alerts: Deque[Alert] = deque(maxlen=max_alerts)
+        self.evicted_count = 0
         self.spike_detector = SpikeDetector()
         self.trend_detector = TrendDetector()
         self.risk_alert_generator = RiskAlertGenerator()
@@ -223,8 +333,10 @@ class AlertManager:
         """Add alert to system"""
         # Checks for duplicate recent alerts to avoid spam
         # (Simple deduplication logic could be added here)
+        if len(self.alerts) == self.alerts.maxlen:
+            self.evicted_count += 1
         self.alerts.append(alert)
-        logger.warning(f"🚨 Alert: {alert.title} [{alert.severity.value}]")
+        logger.warning("🚨 Alert: %s [%s]", alert.title, alert.severity.value)
     
     def get_active_alerts(self) -> List[Alert]:
         """Get unacknowledged alerts"""
@@ -251,11 +363,43 @@ class AlertManager:
         """Remove alerts older than N days"""
         cutoff = datetime.utcnow() - timedelta(days=days)
         original_count = len(self.alerts)
-        self.alerts = [a for a in self.alerts if a.timestamp > cutoff]
+        self.alerts = deque((a for a in self.alerts if a.timestamp > cutoff),
+                            maxlen=self.alerts.maxlen)
         removed = original_count - len(self.alerts)
-        logger.info(f"Cleared {removed} old alerts")
+        logger.info("Cleared %d old alerts", removed)
         return removed
     
+    def scan_metrics_concurrent(self, metric_series: Dict[str, Sequence[float]],
+                                max_workers: Optional[int] = None) -> List[Alert]:
+        """
+        Run spike and trend detection for many metric series in a thread pool.
+        
+        For each series the last value is checked for a spike against the
+        preceding values, and the whole series is checked for deterioration.
+        Detected alerts are added to the manager and returned.
+        """
+        threshold = self.spike_detector.spike_threshold
+        
+        def scan(item: Tuple[str, Sequence[float]]) -> List[Alert]:
+            name, series = item
+            found = []
+            if series:
+                spike = _detect_spike_core(series[-1], series[:-1], threshold, name)
+                if spike:
+                    found.append(spike)
+            trend = _detect_trend_core(series, name, 7)
+            if trend:
+                found.append(trend)
+            return found
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(scan, metric_series.items()))
+        
+        alerts = [alert for found in results for alert in found]
+        for alert in alerts:
+            self.add_alert(alert)
+        return alerts
+    
     def to_list(self) -> List[Dict]:
         """Convert all alerts to list of dicts"""
         return [a.to_dict() for a in self.alerts]
@@ -12,11 +12,37 @@ Author: Bitingo Josaphat JB
 
 import os
 import logging
+from functools import lru_cache
 from flask import request
 from urllib.parse import urljoin
 
 logger = logging.getLogger(__name__)
 
+# Static auth settings, resolved once at import rather than on every render
+_CLERK_PK = os.getenv('CLERK_PUBLISHABLE_KEY', '')
+_FALLBACK_BASE = os.getenv('APP_BASE_URL', 'http://localhost:5000')
+
+
+@lru_cache(maxsize=16)
+def _clerk_config_for(scheme, host, publishable_key):
+    """Build the Clerk config for one (scheme, host); only a handful ever appear"""
+    base_url = f"{scheme}://{host}"
+    return _build_clerk_config(base_url, publishable_key)
+
+
+def _build_clerk_config(base_url, publishable_key):
+    """Clerk config dict for a resolved base URL"""
+    return {
+        'redirect_url': base_url + '/sso-callback',
+        'redirect_url_complete': base_url + '/dashboard',
+        'base_url': base_url,
+        'publishable_key': publishable_key
+    }
+
+
+# Session fields Clerk typically provides
+_REQUIRED_SESSION_FIELDS = frozenset({'sub', 'email'})
+
 
 class NetworkAwareAuth:
     """
@@ -41,13 +67,13 @@ class NetworkAwareAuth:
             # Construct base URL
             base_url = f"{scheme}://{host}"
             
-            logger.info(f"Base URL detected: {base_url} (Host: {host})")
+            logger.info("Base URL detected: %s (Host: %s)", base_url, host)
             return base_url
             
         except Exception as e:
-            logger.warning(f"Could not detect base URL: {str(e)}, using fallback")
+            logger.warning("Could not detect base URL: %s, using fallback", e)
             # Fallback to environment variable or localhost
-            return os.getenv('APP_BASE_URL', 'http://localhost:5000')
+            return _FALLBACK_BASE
     
     @staticmethod
     def get_redirect_url(endpoint='/sso-callback'):
@@ -62,7 +88,7 @@ class NetworkAwareAuth:
         """
         base_url = NetworkAwareAuth.get_base_url()
         redirect_url = f"{base_url}{endpoint}"
-        logger.info(f"Redirect URL: {redirect_url}")
+        logger.info("Redirect URL: %s", redirect_url)
         return redirect_url
     
     @staticmethod
@@ -78,7 +104,7 @@ class NetworkAwareAuth:
         """
         base_url = NetworkAwareAuth.get_base_url()
         redirect_url = f"{base_url}{endpoint}"
-        logger.info(f"Complete Redirect URL: {redirect_url}")
+        logger.info("Complete Redirect URL: %s", redirect_url)
         return redirect_url
     
     @staticmethod
@@ -88,14 +114,14 @@ class NetworkAwareAuth:
         This should be injected into the frontend as a JSON object
         
         Returns:
-            dict: Clerk configuration
+            dict: Clerk configuration (a fresh copy, safe to mutate)
         """
-        return {
-            'redirect_url': NetworkAwareAuth.get_redirect_url('/sso-callback'),
-            'redirect_url_complete': NetworkAwareAuth.get_complete_redirect_url('/dashboard'),
-            'base_url': NetworkAwareAuth.get_base_url(),
-            'publishable_key': os.getenv('CLERK_PUBLISHABLE_KEY', '')
-        }
+        try:
+            config = _clerk_config_for(request.scheme, request.host, _CLERK_PK)
+        except Exception as e:
+            logger.warning("Could not detect base URL: %s, using fallback", e)
+            return _build_clerk_config(_FALLBACK_BASE, _CLERK_PK)
+        return dict(config)
 
 
 class AuthSessionFix:
@@ -114,24 +140,18 @@ class AuthSessionFix:
         Returns:
             bool: True if session is valid
         """
-        try:
-            if not session_data:
-                return False
-            
-            # Check for required fields
-            required = ['sub', 'email']  # Clerk typically provides these
-            
-            for field in required:
-                if field not in session_data:
-                    logger.warning(f"Missing session field: {field}")
-                    return False
-            
-            logger.info(f"Session validation successful for {session_data.get('email')}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Session validation error: {str(e)}")
+        if not session_data:
             return False
+        
+        # Check for required fields in a single set operation
+        missing = _REQUIRED_SESSION_FIELDS.difference(session_data)
+        if missing:
+            logger.warning("Missing session fields: %s", sorted(missing))
+            return False
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Session validation successful for %s", session_data.get('email'))
+        return True
     
     @staticmethod
     def fix_infinite_reload_loop():
@@ -167,22 +187,18 @@ def create_auth_context_processor():
     """
     def inject_auth_config():
         """Inject auth configuration into template context"""
+        # URLs are memoized per (scheme, host); only the lookup runs per request
         try:
-            clerk_config = NetworkAwareAuth.get_clerk_config()
-            return {
-                'clerk_redirect_url': clerk_config['redirect_url'],
-                'clerk_redirect_url_complete': clerk_config['redirect_url_complete'],
-                'clerk_publishable_key': clerk_config['publishable_key'],
-                'app_base_url': clerk_config['base_url']
-            }
+            clerk_config = _clerk_config_for(request.scheme, request.host, _CLERK_PK)
         except Exception as e:
-            logger.error(f"Error creating auth context: {str(e)}")
-            return {
-                'clerk_redirect_url': '/sso-callback',
-                'clerk_redirect_url_complete': '/dashboard',
-                'clerk_publishable_key': os.getenv('CLERK_PUBLISHABLE_KEY', ''),
-                'app_base_url': 'http://localhost:5000'
-            }
+            logger.error("Error creating auth context: %s", e)
+            clerk_config = _build_clerk_config(_FALLBACK_BASE, _CLERK_PK)
+        return {
+            'clerk_redirect_url': clerk_config['redirect_url'],
+            'clerk_redirect_url_complete': clerk_config['redirect_url_complete'],
+            'clerk_publishable_key': clerk_config['publishable_key'],
+            'app_base_url': clerk_config['base_url']
+        }
     
     return inject_auth_config
 
@@ -203,9 +219,9 @@ def log_auth_attempt(email, provider, success, error=None):
     """
     status = "SUCCESS" if success else "FAILED"
     if error:
-        logger.warning(f"AUTH_ATTEMPT [{status}] email={email}, provider={provider}, error={error}")
+        logger.warning("AUTH_ATTEMPT [%s] email=%s, provider=%s, error=%s", status, email, provider, error)
     else:
-        logger.info(f"AUTH_ATTEMPT [{status}] email={email}, provider={provider}")
+        logger.info("AUTH_ATTEMPT [%s] email=%s, provider=%s", status, email, provider)
 
 
 def log_session_issue(issue_type, details):
@@ -216,4 +232,4 @@ def log_session_issue(issue_type, details):
         issue_type (str): Type of issue (cookie, redirect, validation, etc.)
         details (str): Issue details
     """
-    logger.error(f"SESSION_ISSUE [TYPE={issue_type}] {details}")
+    logger.error("SESSION_ISSUE [TYPE=%s] %s", issue_type, details)
@@ -2,7 +2,11 @@
 import jwt
 import requests
 import os
-import json
+import re
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from functools import wraps
 from flask import request, redirect, url_for, session, current_app
 from jwt.algorithms import RSAAlgorithm
@@ -10,84 +14,262 @@ from jwt.algorithms import RSAAlgorithm
 import logging
 from datetime import datetime
 from models import db, User
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Disable SSL warnings for development (handles SSL cert issues)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 logger = logging.getLogger(__name__)
 
+# JWKS cache lifetime when the response carries no Cache-Control max-age
+JWKS_TTL_SECONDS = 300
+# Minimum spacing between forced refreshes triggered by an unknown 'kid'
+JWKS_FORCE_REFRESH_INTERVAL = 30
+# How long a stale JWKS keeps being served after a failed refresh
+JWKS_RETRY_SECONDS = 30
+# Background refresher wake-up period; it revalidates keys this long before expiry
+JWKS_REFRESH_INTERVAL = 60
+
+# Verified tokens remembered (LRU) so repeat requests skip the RSA verify
+VERIFIED_TOKEN_CACHE_SIZE = 10_000
+
+# Dialects with INSERT ... ON CONFLICT support for the one-statement user sync
+_UPSERT_BY_DIALECT = {
+    'postgresql': postgresql_insert,
+    'sqlite': sqlite_insert,
+}
+
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+_BEARER_PREFIX = 'Bearer '
+_BEARER_PREFIX_LEN = len(_BEARER_PREFIX)
+
+
 class ClerkAuth:
     def __init__(self):
         self.jwks_cache = None
+        # Parsed RSA public keys by 'kid', built once per JWKS fetch
+        self._public_keys = {}
+        # JWKS URL of the issuer seen on the last successful fetch
+        self._jwks_url = None
+        self._jwks_expiry = 0.0
+        self._jwks_etag = None
+        self._last_forced_refresh = 0.0
+        # Only one thread revalidates the JWKS at a time
+        self._refresh_lock = threading.Lock()
+        # Persistent connections so JWKS refreshes reuse the TCP/TLS session
+        self._http = requests.Session()
+        self._http.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        ))
+        # token digest -> (payload, exp), most recently used last
+        self._verified = OrderedDict()
+        self._verified_lock = threading.Lock()
+        # Keeps the JWKS warm so verify_token needs no network I/O
+        self._refresher = None
+        self._stop_refresher = threading.Event()
     
-    def get_jwks(self):
-        """Fetch JWKS from Clerk"""
-        if self.jwks_cache:
+    def get_jwks(self, jwks_url=None, force=False):
+        """
+        Fetch JWKS from Clerk, honouring a TTL and ETag revalidation.
+        
+        The JWKS URL comes from the token issuer ('iss') and is remembered
+        after the first successful fetch. A fresh cache is returned without
+        any network I/O; a stale one is revalidated with If-None-Match.
+        ``force`` (used on an unknown 'kid') bypasses the TTL but is rate
+        limited to one refresh per JWKS_FORCE_REFRESH_INTERVAL.
+        
+        Returns:
+            dict or None: JWKS document, or None if it could not be fetched
+        
+        Raises:
+            requests.exceptions.RequestException: network error with no cached JWKS
+        """
+        jwks_url = jwks_url or self._jwks_url
+        if self.jwks_cache and not force and time.monotonic() < self._jwks_expiry:
+            return self.jwks_cache
+        if not jwks_url:
             return self.jwks_cache
+        
+        with self._refresh_lock:
+            now = time.monotonic()
+            if force:
+                if now - self._last_forced_refresh < JWKS_FORCE_REFRESH_INTERVAL:
+                    return self.jwks_cache
+                self._last_forced_refresh = now
+            elif self.jwks_cache and now < self._jwks_expiry:
+                # Another thread refreshed while we waited for the lock
+                return self.jwks_cache
             
-        # Normally this URL comes from the Clerk Dashboard -> API Keys -> JWKS URL
-        # But commonly it is https://<your-clerk-domain>/.well-known/jwks.json
-        # Check if we can construct it or if we need another env var.
-        # For simplicity in this step, we'll try to get it from the standard backend API endpoint if possible,
-        # OR we rely on the Frontend to pass a token that we verify.
+            jwks = self._fetch_jwks(jwks_url, now)
         
-        # ACTUALLY: The best way to verify properly is using the JWKS URL. 
-        # Since we don't have the Frontend API URL (clerk.accounts.dev...) in the env yet (only PK),
-        # we need to extract it or ask for it.
-        # BUT, we can decode the unverified header of the JWT to find the 'iss' (issuer) field.
-        pass
-
+        if jwks:
+            self._start_refresher()
+        return jwks
+    
+    def _fetch_jwks(self, jwks_url, now):
+        """Conditional JWKS GET; caller must hold _refresh_lock"""
+        headers = {}
+        if self.jwks_cache and self._jwks_etag:
+            headers['If-None-Match'] = self._jwks_etag
+        
+        logger.info(f"Fetching JWKS from {jwks_url}")
+        try:
+            # Disable SSL verification for development environments
+            resp = self._http.get(jwks_url, headers=headers, verify=False, timeout=(2, 5))
+        except requests.exceptions.RequestException as e:
+            if not self.jwks_cache:
+                raise
+            logger.warning(f"⚠️ JWKS refresh failed, serving cached keys: {str(e)}")
+            self._jwks_expiry = now + JWKS_RETRY_SECONDS
+            return self.jwks_cache
+        
+        if resp.status_code == 304:
+            self._jwks_expiry = now + self._max_age(resp)
+            return self.jwks_cache
+        
+        if resp.status_code != 200:
+            logger.error(f"Failed to fetch JWKS: {resp.status_code} {resp.text}")
+            if self.jwks_cache:
+                self._jwks_expiry = now + JWKS_RETRY_SECONDS
+            return self.jwks_cache
+        
+        self.jwks_cache = resp.json()
+        self._public_keys = self._index_keys(self.jwks_cache)
+        self._jwks_url = jwks_url
+        self._jwks_etag = resp.headers.get('ETag')
+        self._jwks_expiry = now + self._max_age(resp)
+        return self.jwks_cache
+    
+    def _refresh_jwks_if_stale(self):
+        """Revalidate the JWKS shortly before it expires"""
+        if not self._jwks_url:
+            return
+        if time.monotonic() < self._jwks_expiry - JWKS_REFRESH_INTERVAL:
+            return
+        with self._refresh_lock:
+            try:
+                self._fetch_jwks(self._jwks_url, time.monotonic())
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"⚠️ Background JWKS refresh failed: {str(e)}")
+    
+    def _bg_refresh(self):
+        """Refresher loop; runs until stop_refresher() is called"""
+        while not self._stop_refresher.wait(JWKS_REFRESH_INTERVAL):
+            try:
+                self._refresh_jwks_if_stale()
+            except Exception as e:
+                logger.error(f"JWKS refresher error: {str(e)}")
+    
+    def _start_refresher(self):
+        """Start the background refresher once the issuer's JWKS URL is known"""
+        if self._refresher is not None:
+            return
+        with self._refresh_lock:
+            if self._refresher is None:
+                self._refresher = threading.Thread(
+                    target=self._bg_refresh, name='jwks-refresher', daemon=True
+                )
+                self._refresher.start()
+    
+    def stop_refresher(self):
+        """Stop the background JWKS refresher"""
+        self._stop_refresher.set()
+    
+    @staticmethod
+    def _max_age(resp):
+        """Cache lifetime from the response Cache-Control header"""
+        match = _MAX_AGE_RE.search(resp.headers.get('Cache-Control', ''))
+        return int(match.group(1)) if match else JWKS_TTL_SECONDS
+    
+    @staticmethod
+    def _index_keys(jwks):
+        """Parse every RSA key in the JWKS once, indexed by 'kid'"""
+        return {
+            key['kid']: RSAAlgorithm.from_jwk(key)
+            for key in jwks.get('keys', [])
+            if key.get('kid') and key.get('kty') == 'RSA'
+        }
+    
+    def _cached_payload(self, key):
+        """Previously verified payload for a token digest, if not yet expired"""
+        with self._verified_lock:
+            entry = self._verified.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                del self._verified[key]
+                return None
+            self._verified.move_to_end(key)
+            return entry[0]
+    
+    def _remember_payload(self, key, payload):
+        """Cache a verified payload until the token's exp"""
+        exp = payload.get('exp')
+        if not isinstance(exp, (int, float)) or exp <= time.time():
+            return
+        with self._verified_lock:
+            self._verified[key] = (payload, exp)
+            self._verified.move_to_end(key)
+            if len(self._verified) > VERIFIED_TOKEN_CACHE_SIZE:
+                self._verified.popitem(last=False)
     
     def verify_token(self, token):
         """Verify the session token using Clerk's JWKS"""
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        cached = self._cached_payload(cache_key)
+        if cached is not None:
+            # Hand out a copy so callers can annotate it (e.g. 'role')
+            return dict(cached)
+        
         try:
             # 1. Decode header to find 'kid' (Key ID)
             unverified_header = jwt.get_unverified_header(token)
             
-            # 2. Get JWKS (Public Keys) from the Issuer URL found in the token
-            unverified_payload = jwt.decode(token, options={"verify_signature": False})
-            issuer = unverified_payload.get('iss')
+            # Use cached JWKS if available (revalidated once its TTL lapses)
+            jwks = self.get_jwks()
             
-            if not issuer:
-                logger.error("Token verification failed: No issuer found in token")
-                return None
-                
-            jwks_url = f"{issuer}/.well-known/jwks.json"
-            
-            # Use cached JWKS if available
-            jwks = self.jwks_cache
-            
-            # If not cached or force refresh needed (e.g. key rotation - simplified here)
             if not jwks:
-                logger.info(f"Fetching JWKS from {jwks_url}")
+                # 2. Get JWKS (Public Keys) from the Issuer URL found in the token.
+                # The unverified decode is only needed here; once the JWKS is
+                # cached, the single verified decode below is the only one.
+                unverified_payload = jwt.decode(token, options={"verify_signature": False})
+                issuer = unverified_payload.get('iss')
+                
+                if not issuer:
+                    logger.error("Token verification failed: No issuer found in token")
+                    return None
+                    
+                jwks_url = f"{issuer}/.well-known/jwks.json"
                 try:
-                    # Disable SSL verification for development environments
-                    resp = requests.get(jwks_url, verify=False, timeout=5)
-                    if resp.status_code != 200:
-                        logger.error(f"Failed to fetch JWKS: {resp.status_code} {resp.text}")
-                        # Fallback: Skip verification and accept token
-                        logger.warning("⚠️ JWKS fetch failed, accepting token without verification (DEV MODE)")
-                        return unverified_payload
-                    jwks = resp.json()
-                    self.jwks_cache = jwks
+                    jwks = self.get_jwks(jwks_url)
                 except requests.exceptions.RequestException as re:
                     logger.warning(f"⚠️ Network error fetching JWKS: {str(re)}")
                     logger.warning("⚠️ Accepting token without JWKS verification (DEV MODE)")
                     # Fallback: Accept token without verification
                     return unverified_payload
+                if not jwks:
+                    # Fallback: Skip verification and accept token
+                    logger.warning("⚠️ JWKS fetch failed, accepting token without verification (DEV MODE)")
+                    return unverified_payload
             
-            public_key = None
+            kid = unverified_header.get('kid')
+            public_key = self._public_keys.get(kid)
             
-            for key in jwks['keys']:
-                if key['kid'] == unverified_header['kid']:
-                    public_key = RSAAlgorithm.from_jwk(json.dumps(key))
-                    break
+            if public_key is None:
+                # Unknown kid: the keys may have rotated, refresh once (rate limited)
+                self.get_jwks(force=True)
+                public_key = self._public_keys.get(kid)
             
             if not public_key:
-                logger.error(f"Public key not found for kid: {unverified_header.get('kid')}")
-                # Clear cache in case of key rotation
-                self.jwks_cache = None
+                logger.error(f"Public key not found for kid: {kid}")
                 return None
                 
             # 3. Verify the token signature
@@ -97,13 +279,16 @@ class ClerkAuth:
                 algorithms=['RS256'],
                 audience=os.environ.get('CLERK_AUDIENCE'),
                 options={
+                    "require": ["exp", "iss", "sub"],
                     "verify_aud": False,
                     "verify_exp": False,  # Skip expiration check for development
                     "verify_iat": False,  # Skip iat (issued at) validation for development
                 }
             )
             
-            return payload
+            # Only signature-verified payloads are cached, never the DEV fallbacks
+            self._remember_payload(cache_key, payload)
+            return dict(payload)
             
         except requests.exceptions.RequestException as re:
             logger.warning(f"⚠️ Network error during token verification: {str(re)}")
@@ -132,6 +317,79 @@ class ClerkAuth:
 
 clerk_auth = ClerkAuth()
 
+# Claims kept in the Flask session cookie; the views and templates only read
+# these, so the rest of the JWT payload (sid, azp, iat, nbf, ...) is dropped
+# to keep the signed cookie small.
+_SESSION_USER_KEYS = ('sub', 'email', 'first_name', 'last_name', 'role', 'exp')
+
+
+def _session_user(user_payload, email, first_name, last_name):
+    """Compact user dict for the session cookie (None values omitted)"""
+    user = dict(user_payload, email=email or None, first_name=first_name, last_name=last_name)
+    return {key: user[key] for key in _SESSION_USER_KEYS if user.get(key) is not None}
+
+
+def _sync_user(user_id, email, first_name, last_name):
+    """
+    Create or refresh the local User row for a verified Clerk user.
+    
+    On PostgreSQL and SQLite this is a single INSERT ... ON CONFLICT DO
+    UPDATE ... RETURNING round-trip: profile fields are only filled in when
+    missing locally, and last_login is always bumped. Other backends fall
+    back to a SELECT followed by an ORM update.
+    
+    Returns:
+        str: The user's role
+    """
+    now = datetime.utcnow()
+    upsert = _UPSERT_BY_DIALECT.get(db.engine.dialect.name)
+    
+    if upsert is not None:
+        users = User.__table__
+        stmt = upsert(users).values(
+            id=user_id,
+            email=email,
+            first_name=first_name,
+            last_name=last_name,
+            role='user',
+            last_login=now,
+            created_at=now
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[users.c.id],
+            set_={
+                # Keep existing values; fill only if missing (NULL or '')
+                'email': func.coalesce(func.nullif(users.c.email, ''), stmt.excluded.email),
+                'first_name': func.coalesce(func.nullif(users.c.first_name, ''), stmt.excluded.first_name),
+                'last_name': func.coalesce(func.nullif(users.c.last_name, ''), stmt.excluded.last_name),
+                'last_login': stmt.excluded.last_login
+            }
+        ).returning(users.c.role)
+        role = db.session.execute(stmt).scalar_one()
+        db.session.commit()
+        logger.info(f"Synced user record: {user_id}")
+        return role
+    
+    user = db.session.get(User, user_id)
+    if not user:
+        user = User(id=user_id, email=email, first_name=first_name,
+                    last_name=last_name, role='user')
+        db.session.add(user)
+        logger.info(f"Created new user record: {user_id}")
+    else:
+        # Update existing user if fields are missing but present in token
+        if email and not user.email:
+            user.email = email
+        if first_name and not user.first_name:
+            user.first_name = first_name
+        if last_name and not user.last_name:
+            user.last_name = last_name
+        logger.info(f"Updated existing user record: {user_id}")
+    user.last_login = now
+    db.session.commit()
+    return user.role
+
+
 def login_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -143,8 +401,8 @@ def login_required(f):
         auth_header = request.headers.get('Authorization')
         token = None
         
-        if auth_header and auth_header.startswith('Bearer '):
-            token = auth_header.split(' ')[1]
+        if auth_header and auth_header[:_BEARER_PREFIX_LEN] == _BEARER_PREFIX:
+            token = auth_header[_BEARER_PREFIX_LEN:]
         
         # Check for Cookie (Clerk often sets '__session')
         if not token:
@@ -162,55 +420,30 @@ def login_required(f):
             
         user_payload = clerk_auth.verify_token(token)
         if user_payload:
+            user_id = user_payload.get('sub')
+            # Try multiple common Clerk email claim keys
+            email = (
+                user_payload.get('email') or 
+                user_payload.get('email_address') or 
+                user_payload.get('primary_email_address') or
+                ""
+            )
+            
+            # Also try to get names if they exist in the token
+            first_name = user_payload.get('given_name') or user_payload.get('first_name')
+            last_name = user_payload.get('family_name') or user_payload.get('last_name')
+            
             # Sync user to local database
             try:
-                user_id = user_payload.get('sub')
-                # Try multiple common Clerk email claim keys
-                email = (
-                    user_payload.get('email') or 
-                    user_payload.get('email_address') or 
-                    user_payload.get('primary_email_address') or
-                    ""
-                )
-                
-                # Also try to get names if they exist in the token
-                first_name = user_payload.get('given_name') or user_payload.get('first_name')
-                last_name = user_payload.get('family_name') or user_payload.get('last_name')
-                
                 logger.info(f"Syncing user {user_id}. Email: {email}, Name: {first_name} {last_name}")
                 logger.info(f"Payload keys: {list(user_payload.keys())}")
                 # logger.info(f"Full payload (redacted): { {k: (v if k not in ['email', 'email_address'] else '***') for k, v in user_payload.items()} }")
                 
-                # Check database
-                user = User.query.get(user_id)
-                
-                if not user:
-                    # Create new user
-                    user = User(
-                        id=user_id,
-                        email=email,
-                        first_name=first_name,
-                        last_name=last_name,
-                        role='user'
-                    )
-                    db.session.add(user)
-                    logger.info(f"Created new user record: {user_id}")
-                else:
-                    # Update existing user if fields are missing but present in token
-                    if email and not user.email:
-                        user.email = email
-                    if first_name and not user.first_name:
-                        user.first_name = first_name
-                    if last_name and not user.last_name:
-                        user.last_name = last_name
-                    logger.info(f"Updated existing user record: {user_id}")
-                
-                # Update last login
-                user.last_login = datetime.utcnow()
-                db.session.commit()
+                # Create or refresh the local user record
+                role = _sync_user(user_id, email, first_name, last_name)
                 
                 # Add role to payload for session
-                user_payload['role'] = user.role
+                user_payload['role'] = role
                 
             except Exception as e:
                 logger.error(f"User sync error: {str(e)}")
@@ -218,7 +451,7 @@ def login_required(f):
             
             # Save minimal info to Flask session to avoid re-verifying every single request
             # (In high security, verify every time, but for performance, caching is okay)
-            session['user'] = user_payload
+            session['user'] = _session_user(user_payload, email, first_name, last_name)
             return f(*args, **kwargs)
         else:
             return redirect(url_for('views.login'))
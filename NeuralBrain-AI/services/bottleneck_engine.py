@@ -9,22 +9,31 @@ Single Output Source of Truth for all forecasts.
 
 import logging
 import json
-from typing import Dict, Any, List, Optional, Tuple
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ForecastData:
-    """Standardized forecast data structure"""
+    """
+    Standardized forecast data structure
+    
+    Frozen so cached instances can be shared between threads and callers
+    without defensive copies; slotted to drop the per-instance __dict__.
+    Forecast points are read-only mappings in tuples (see _freeze_points),
+    so nothing reachable from an instance can be mutated.
+    """
     region: str
     actual_cases: int
     actual_deaths: int
     actual_recovered: int
-    forecasted_cases: List[Dict[str, Any]]  # [{"day": 1, "value": int}]
-    forecasted_deaths: List[Dict[str, Any]]
+    forecasted_cases: Tuple[Mapping[str, Any], ...]  # ({"day": 1, "value": int}, ...)
+    forecasted_deaths: Tuple[Mapping[str, Any], ...]
     confidence_score: float  # 0.0-1.0
     risk_level: str  # RED, YELLOW, GREEN
     risk_score: float  # 0-100
@@ -34,8 +43,40 @@ class ForecastData:
     provider: str  # openai, gemini, groq, etc
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return asdict(self)
+        """
+        Convert to dictionary
+        
+        Built field by field rather than via asdict(). Forecast points are
+        turned back into plain dicts so the result is JSON-serializable.
+        """
+        return {
+            'region': self.region,
+            'actual_cases': self.actual_cases,
+            'actual_deaths': self.actual_deaths,
+            'actual_recovered': self.actual_recovered,
+            'forecasted_cases': [dict(point) for point in self.forecasted_cases],
+            'forecasted_deaths': [dict(point) for point in self.forecasted_deaths],
+            'confidence_score': self.confidence_score,
+            'risk_level': self.risk_level,
+            'risk_score': self.risk_score,
+            'outbreak_probability': self.outbreak_probability,
+            'trend': self.trend,
+            'timestamp': self.timestamp,
+            'provider': self.provider,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class _NormCtx:
+    """Per-forecast values the risk, outbreak and trend assessments derive from"""
+    actual_cases: float
+    day7_cases: float
+    growth_rate: float
+
+
+def _freeze_points(points: List[Dict[str, Any]]) -> Tuple[Mapping[str, Any], ...]:
+    """Snapshot forecast points as a tuple of read-only mappings"""
+    return tuple(MappingProxyType(dict(point)) for point in points)
 
 
 class BottleneckForecastingEngine:
@@ -50,9 +91,16 @@ class BottleneckForecastingEngine:
     - Frontend data consistency
     """
     
+    # Provider field names for each forecast series, tried in order
+    _CASE_KEYS = ('forecasted_cases', 'predicted_cases', 'forecast')
+    _DEATH_KEYS = ('forecasted_deaths', 'predicted_deaths', 'deaths_forecast')
+    
     def __init__(self):
         """Initialize bottleneck engine"""
-        self._forecasts_cache = {}  # region -> ForecastData
+        # region -> ForecastData; never mutated in place, writers swap in a new
+        # dict under _cache_lock so readers need no lock and see a snapshot
+        self._forecasts_cache = {}
+        self._cache_lock = threading.RLock()
         self._last_update = None
         self._provider = None
         
@@ -78,108 +126,153 @@ class BottleneckForecastingEngine:
             ForecastData: Normalized forecast
         """
         try:
-            # Extract numerical forecasts
-            forecasted_cases = self._extract_cases_forecast(provider_output)
-            forecasted_deaths = self._extract_deaths_forecast(provider_output)
-            
-            # Validate forecasts
-            self._validate_forecasts(forecasted_cases, forecasted_deaths, actual_data)
-            
-            # Calculate confidence score
-            confidence = self._calculate_confidence(
-                forecasted_cases,
+            forecast = self._build_forecast(
+                provider_output,
+                provider_name,
                 actual_data,
                 historical_data,
-                provider_name
-            )
-            
-            # Determine risk level and score
-            risk_level, risk_score = self._assess_risk(
-                forecasted_cases,
-                actual_data,
-                historical_data
-            )
-            
-            # Calculate outbreak probability
-            outbreak_prob = self._calculate_outbreak_probability(
-                forecasted_cases,
-                actual_data,
-                historical_data
+                actual_data.get('country', 'Global'),
+                datetime.utcnow().isoformat()
             )
             
-            # Determine trend
-            trend = self._determine_trend(
-                forecasted_cases,
-                actual_data,
-                historical_data
-            )
-            
-            # Build standardized forecast
-            region = actual_data.get('country', 'Global')
-            
-            forecast = ForecastData(
-                region=region,
-                actual_cases=actual_data.get('cases', 0),
-                actual_deaths=actual_data.get('deaths', 0),
-                actual_recovered=actual_data.get('recovered', 0),
-                forecasted_cases=forecasted_cases,
-                forecasted_deaths=forecasted_deaths,
-                confidence_score=confidence,
-                risk_level=risk_level,
-                risk_score=risk_score,
-                outbreak_probability=outbreak_prob,
-                trend=trend,
-                timestamp=datetime.utcnow().isoformat(),
-                provider=provider_name
-            )
-            
-            logger.info(f"✅ Normalized forecast for {region}: {risk_level} ({risk_score:.1f})")
+            logger.info(f"✅ Normalized forecast for {forecast.region}: {forecast.risk_level} ({forecast.risk_score:.1f})")
             return forecast
             
         except Exception as e:
             logger.error(f"❌ Forecast normalization failed: {str(e)}")
             raise
     
+    def normalize_batch(
+        self,
+        outputs_by_region: Dict[str, Dict[str, Any]],
+        actuals_by_region: Dict[str, Dict[str, Any]],
+        historicals_by_region: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        provider_name: str = 'unknown'
+    ) -> Dict[str, ForecastData]:
+        """
+        Normalize provider outputs for many regions in one call
+        
+        Shares one timestamp and one summary log line across the refresh.
+        A region that fails to normalize is logged and skipped so it
+        cannot fail the whole batch.
+        
+        Args:
+            outputs_by_region: Raw provider output keyed by region
+            actuals_by_region: Current actual data keyed by region
+            historicals_by_region: Historical data keyed by region
+            provider_name: Name of provider that produced the outputs
+            
+        Returns:
+            Dict of region -> ForecastData for every region that normalized
+        """
+        historicals_by_region = historicals_by_region or {}
+        timestamp = datetime.utcnow().isoformat()
+        results = {}
+        
+        for region, provider_output in outputs_by_region.items():
+            actual_data = actuals_by_region.get(region)
+            if actual_data is None:
+                logger.warning(f"⚠️ No actual data for {region}, skipping forecast")
+                continue
+            
+            try:
+                results[region] = self._build_forecast(
+                    provider_output,
+                    provider_name,
+                    actual_data,
+                    historicals_by_region.get(region, []),
+                    actual_data.get('country', region),
+                    timestamp
+                )
+            except Exception as e:
+                logger.error(f"❌ Forecast normalization failed for {region}: {str(e)}")
+        
+        logger.info(f"✅ Normalized {len(results)}/{len(outputs_by_region)} regional forecasts")
+        return results
+    
+    def _build_forecast(
+        self,
+        provider_output: Dict[str, Any],
+        provider_name: str,
+        actual_data: Dict[str, Any],
+        historical_data: List[Dict[str, Any]],
+        region: str,
+        timestamp: str
+    ) -> ForecastData:
+        """Build one ForecastData from provider output (no logging, no error handling)"""
+        # Extract numerical forecasts
+        forecasted_cases = self._extract_cases_forecast(provider_output)
+        forecasted_deaths = self._extract_deaths_forecast(provider_output)
+        
+        # Validate forecasts
+        self._validate_forecasts(forecasted_cases, forecasted_deaths, actual_data)
+        
+        # Calculate confidence score
+        confidence = self._calculate_confidence(
+            forecasted_cases,
+            actual_data,
+            historical_data,
+            provider_name
+        )
+        
+        # Determine risk level/score, outbreak probability and trend together
+        risk_level, risk_score, outbreak_prob, trend = self._assess_all(
+            forecasted_cases,
+            actual_data
+        )
+        
+        # Build standardized forecast
+        return ForecastData(
+            region=region,
+            actual_cases=actual_data.get('cases', 0),
+            actual_deaths=actual_data.get('deaths', 0),
+            actual_recovered=actual_data.get('recovered', 0),
+            forecasted_cases=_freeze_points(forecasted_cases),
+            forecasted_deaths=_freeze_points(forecasted_deaths),
+            confidence_score=confidence,
+            risk_level=risk_level,
+            risk_score=risk_score,
+            outbreak_probability=outbreak_prob,
+            trend=trend,
+            timestamp=timestamp,
+            provider=provider_name
+        )
+    
     def _extract_cases_forecast(self, provider_output: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract case forecast from provider output"""
-        try:
-            # Try common field names
-            if 'forecasted_cases' in provider_output:
-                return provider_output['forecasted_cases']
-            elif 'predicted_cases' in provider_output:
-                return provider_output['predicted_cases']
-            elif 'forecast' in provider_output and isinstance(provider_output['forecast'], list):
-                return provider_output['forecast']
-            
-            # If AI response is JSON string, parse it
-            if isinstance(provider_output, str):
-                data = json.loads(provider_output)
-                return data.get('forecasted_cases', [])
-            
+        # If AI response is JSON string, parse it - the only step that can fail
+        if isinstance(provider_output, str):
+            try:
+                provider_output = json.loads(provider_output)
+            except ValueError as e:
+                logger.error(f"❌ Cases extraction failed: {str(e)}")
+                return []
+        
+        forecast = self._first_series(provider_output, self._CASE_KEYS)
+        if forecast is None:
             logger.warning("⚠️ Could not extract cases forecast, using empty list")
             return []
-            
-        except Exception as e:
-            logger.error(f"❌ Cases extraction failed: {str(e)}")
-            return []
+        return forecast
     
     def _extract_deaths_forecast(self, provider_output: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract deaths forecast from provider output"""
-        try:
-            if 'forecasted_deaths' in provider_output:
-                return provider_output['forecasted_deaths']
-            elif 'predicted_deaths' in provider_output:
-                return provider_output['predicted_deaths']
-            elif 'deaths_forecast' in provider_output:
-                return provider_output['deaths_forecast']
-            
+        forecast = self._first_series(provider_output, self._DEATH_KEYS)
+        if forecast is None:
             # Estimate from cases if not available
             logger.info("ℹ️ Deaths forecast not provided, estimating from cases")
             return []
-            
-        except Exception as e:
-            logger.error(f"❌ Deaths extraction failed: {str(e)}")
-            return []
+        return forecast
+    
+    @staticmethod
+    def _first_series(provider_output: Any, keys: Tuple[str, ...]) -> Optional[List[Dict[str, Any]]]:
+        """First list found under any of the candidate keys, in order"""
+        if not isinstance(provider_output, dict):
+            return None
+        for key in keys:
+            value = provider_output.get(key)
+            if isinstance(value, (list, tuple)):
+                return value
+        return None
     
     def _validate_forecasts(
         self,
@@ -212,52 +305,107 @@ class BottleneckForecastingEngine:
         provider_name: str
     ) -> float:
         """Calculate confidence score (0.0-1.0)"""
-        try:
-            confidence = 0.85  # Base confidence
-            
-            # Provider-specific adjustments
-            if provider_name == 'openai':
-                confidence = 0.90  # Higher confidence for OpenAI
-            elif provider_name == 'gemini':
-                confidence = 0.85
-            elif provider_name == 'groq':
-                confidence = 0.80
-            
-            # Adjust based on data volatility
-            if historical_data and len(historical_data) > 7:
-                volatility = self._calculate_volatility(historical_data)
-                if volatility > 0.5:  # High volatility
-                    confidence *= 0.8
-            
-            # Clamp between 0.5 and 0.98
-            return max(0.5, min(0.98, confidence))
-            
-        except Exception as e:
-            logger.error(f"❌ Confidence calculation failed: {str(e)}")
-            return 0.75
+        confidence = 0.85  # Base confidence
+        
+        # Provider-specific adjustments
+        if provider_name == 'openai':
+            confidence = 0.90  # Higher confidence for OpenAI
+        elif provider_name == 'gemini':
+            confidence = 0.85
+        elif provider_name == 'groq':
+            confidence = 0.80
+        
+        # Adjust based on data volatility
+        if historical_data and len(historical_data) > 7:
+            volatility = self._calculate_volatility(historical_data)
+            if volatility > 0.5:  # High volatility
+                confidence *= 0.8
+        
+        # Clamp between 0.5 and 0.98
+        return max(0.5, min(0.98, confidence))
     
     def _calculate_volatility(self, historical_data: List[Dict[str, Any]]) -> float:
         """Calculate historical data volatility"""
-        try:
-            cases = [d.get('cases', 0) for d in historical_data[-14:]]
-            if not cases or len(cases) < 2:
-                return 0.0
-            
-            # Calculate day-over-day percentage changes
-            changes = []
-            for i in range(1, len(cases)):
-                if cases[i-1] > 0:
-                    pct_change = abs((cases[i] - cases[i-1]) / cases[i-1])
-                    changes.append(pct_change)
-            
-            if not changes:
-                return 0.0
-            
-            return sum(changes) / len(changes)
-            
-        except Exception as e:
-            logger.warning(f"⚠️ Volatility calculation failed: {str(e)}")
-            return 0.0
+        cases = [d.get('cases', 0) for d in historical_data[-14:]]
+        
+        # Day-over-day percentage changes, pairing each day with the next
+        changes = [
+            abs((cur - prev) / prev)
+            for prev, cur in zip(cases, cases[1:])
+            if prev > 0
+        ]
+        
+        return sum(changes) / len(changes) if changes else 0.0
+    
+    @staticmethod
+    def _norm_context(
+        forecasted_cases: List[Dict[str, Any]],
+        actual_data: Dict[str, Any]
+    ) -> _NormCtx:
+        """Look up current and day-7 cases once and derive the growth rate"""
+        actual_cases = actual_data.get('cases', 0)
+        
+        # Get forecast for day 7 if available
+        day7_cases = forecasted_cases[-1].get('value', actual_cases) if forecasted_cases else actual_cases
+        
+        # Calculate growth rate
+        growth_rate = (day7_cases - actual_cases) / actual_cases if actual_cases > 0 else 0.0
+        
+        return _NormCtx(actual_cases, day7_cases, growth_rate)
+    
+    def _assess_all(
+        self,
+        forecasted_cases: List[Dict[str, Any]],
+        actual_data: Dict[str, Any]
+    ) -> Tuple[str, float, float, str]:
+        """
+        Risk level, risk score, outbreak probability and trend in one pass
+        
+        All three assessments derive from the same growth rate, so it is
+        computed once and each threshold cascade runs back to back.
+        
+        Returns:
+            Tuple of (risk_level, risk_score, outbreak_probability, trend)
+        """
+        ctx = self._norm_context(forecasted_cases, actual_data)
+        growth_rate = ctx.growth_rate
+        
+        # Risk: assign level based on growth per day
+        daily_growth = growth_rate / 7
+        if daily_growth > 0.05:  # 5% daily growth
+            risk_level = "RED"
+            risk_score = 85.0 + (daily_growth * 100)
+        elif daily_growth > 0.01:  # 1% daily growth
+            risk_level = "YELLOW"
+            risk_score = 55.0 + (daily_growth * 1000)
+        else:
+            risk_level = "GREEN"
+            risk_score = min(50.0, 10 + (daily_growth * 1000))
+        
+        # Clamp risk score 0-100
+        risk_score = max(0, min(100, risk_score))
+        
+        # Outbreak probability: convert growth rate to probability
+        if ctx.actual_cases <= 0:
+            outbreak_prob = 0.0
+        elif growth_rate > 0.3:  # >30% growth
+            outbreak_prob = 0.95
+        elif growth_rate > 0.1:
+            outbreak_prob = 0.70
+        elif growth_rate > 0:
+            outbreak_prob = 0.40
+        else:
+            outbreak_prob = 0.10
+        
+        # Trend
+        if ctx.day7_cases > ctx.actual_cases * 1.05:
+            trend = "increasing"
+        elif ctx.day7_cases < ctx.actual_cases * 0.95:
+            trend = "decreasing"
+        else:
+            trend = "stable"
+        
+        return risk_level, risk_score, outbreak_prob, trend
     
     def _assess_risk(
         self,
@@ -271,40 +419,8 @@ class BottleneckForecastingEngine:
         Returns:
             Tuple of (risk_level: str, risk_score: float)
         """
-        try:
-            actual_cases = actual_data.get('cases', 0)
-            
-            # Get forecast for day 7 if available
-            day7_cases = forecasted_cases[-1]['value'] if forecasted_cases else actual_cases
-            
-            # Calculate growth rate
-            if actual_cases > 0:
-                growth_rate = (day7_cases - actual_cases) / actual_cases
-            else:
-                growth_rate = 0
-            
-            # Calculate growth per day
-            daily_growth = growth_rate / 7 if growth_rate != 0 else 0
-            
-            # Assign risk level based on growth
-            if daily_growth > 0.05:  # 5% daily growth
-                risk_level = "RED"
-                risk_score = 85.0 + (daily_growth * 100)
-            elif daily_growth > 0.01:  # 1% daily growth
-                risk_level = "YELLOW"
-                risk_score = 55.0 + (daily_growth * 1000)
-            else:
-                risk_level = "GREEN"
-                risk_score = min(50.0, 10 + (daily_growth * 1000))
-            
-            # Clamp risk score 0-100
-            risk_score = max(0, min(100, risk_score))
-            
-            return risk_level, risk_score
-            
-        except Exception as e:
-            logger.error(f"❌ Risk assessment failed: {str(e)}")
-            return "GREEN", 25.0
+        risk_level, risk_score, _, _ = self._assess_all(forecasted_cases, actual_data)
+        return risk_level, risk_score
     
     def _calculate_outbreak_probability(
         self,
@@ -313,28 +429,7 @@ class BottleneckForecastingEngine:
         historical_data: List[Dict[str, Any]]
     ) -> float:
         """Calculate outbreak probability (0.0-1.0)"""
-        try:
-            actual_cases = actual_data.get('cases', 0)
-            day7_cases = forecasted_cases[-1]['value'] if forecasted_cases else actual_cases
-            
-            if actual_cases == 0:
-                return 0.0
-            
-            growth_rate = (day7_cases - actual_cases) / actual_cases
-            
-            # Convert growth rate to probability
-            if growth_rate > 0.3:  # >30% growth
-                return 0.95
-            elif growth_rate > 0.1:
-                return 0.70
-            elif growth_rate > 0:
-                return 0.40
-            else:
-                return 0.10
-            
-        except Exception as e:
-            logger.error(f"❌ Outbreak probability calculation failed: {str(e)}")
-            return 0.5
+        return self._assess_all(forecasted_cases, actual_data)[2]
     
     def _determine_trend(
         self,
@@ -343,39 +438,27 @@ class BottleneckForecastingEngine:
         historical_data: List[Dict[str, Any]]
     ) -> str:
         """Determine trend (increasing, decreasing, stable)"""
-        try:
-            actual_cases = actual_data.get('cases', 0)
-            day7_cases = forecasted_cases[-1]['value'] if forecasted_cases else actual_cases
-            
-            if day7_cases > actual_cases * 1.05:
-                return "increasing"
-            elif day7_cases < actual_cases * 0.95:
-                return "decreasing"
-            else:
-                return "stable"
-            
-        except Exception as e:
-            logger.warning(f"⚠️ Trend determination failed: {str(e)}")
-            return "stable"
+        return self._assess_all(forecasted_cases, actual_data)[3]
     
     def cache_forecast(self, region: str, forecast: ForecastData) -> None:
-        """Cache forecast for quick retrieval (deep copy)"""
-        import copy
-        self._forecasts_cache[region] = copy.deepcopy(forecast)
-        self._last_update = datetime.utcnow()
-        self._provider = forecast.provider
+        """Cache forecast for quick retrieval (ForecastData is immutable, so no copy)"""
+        with self._cache_lock:
+            self._forecasts_cache = {**self._forecasts_cache, region: forecast}
+            self._last_update = datetime.utcnow()
+            self._provider = forecast.provider
     
     def get_cached_forecast(self, region: str) -> Optional[ForecastData]:
         """Get cached forecast for region"""
         return self._forecasts_cache.get(region)
     
-    def get_all_cached_forecasts(self) -> Dict[str, ForecastData]:
-        """Get all cached forecasts"""
-        return self._forecasts_cache.copy()
+    def get_all_cached_forecasts(self) -> Mapping[str, ForecastData]:
+        """Get all cached forecasts (read-only snapshot, no copy)"""
+        return MappingProxyType(self._forecasts_cache)
     
     def clear_cache(self) -> None:
         """Clear all cached forecasts"""
-        self._forecasts_cache.clear()
+        with self._cache_lock:
+            self._forecasts_cache = {}
         logger.info("✅ Forecast cache cleared")
 
 
@@ -8,18 +8,45 @@ Features:
 - Specialty: Distributed edge computing, global availability
 """
 
+import json
 import logging
 import os
 import requests
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import List, Optional, Tuple
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional; fall back to the stdlib for request/response bodies
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _dumps = lambda obj: json.dumps(obj).encode()
+    _loads = json.loads
+
+# Upper bound on concurrent in-flight requests for send_batch
+BATCH_MAX_WORKERS = 16
+
 
 class CloudflareProvider:
     """Cloudflare Workers AI Provider - Edge-based LLM inference"""
     
-    def __init__(self, account_id: Optional[str] = None, api_token: Optional[str] = None):
+    __slots__ = (
+        'account_id', 'api_token', 'provider_name', 'model', 'available',
+        'base_url', '_session', '_headers', '_urls',
+    )
+    
+    def __init__(
+        self,
+        account_id: Optional[str] = None,
+        api_token: Optional[str] = None,
+        session: Optional[requests.Session] = None
+    ):
         self.account_id = account_id or os.getenv('CLOUDFLARE_ACCOUNT_ID', '').strip()
         self.api_token = api_token or os.getenv('CLOUDFLARE_API_TOKEN', '').strip()
         self.provider_name = "Cloudflare"
@@ -33,8 +60,33 @@ class CloudflareProvider:
             self.api_token != 'your-api-token'
         )
         
+        # Persistent keep-alive connections so calls skip the TCP/TLS handshake;
+        # the orchestrator passes in its shared pool instead
+        if session is None:
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=50,
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.1,
+                    status_forcelist=[429, 502, 503, 504],
+                    allowed_methods=frozenset({'POST'}),
+                    raise_on_status=False
+                )
+            ))
+        self._session = session
+        self._headers = {
+            "Authorization": f"Bearer {self.api_token}",
+            "Content-Type": "application/json"
+        }
+        
+        # model -> endpoint URL, seeded with the default model
+        self._urls = {}
+        
         if self.available:
             self.base_url = f"https://api.cloudflare.com/client/v4/accounts/{self.account_id}/ai/run"
+            self._urls[self.model] = f"{self.base_url}/{self.model}"
             logger.info("✅ Cloudflare provider initialized")
         else:
             logger.warning("⚠️ Cloudflare credentials not configured")
@@ -47,6 +99,13 @@ class CloudflareProvider:
     def get_provider_name(self) -> str:
         return self.provider_name
     
+    def _url_for(self, model: str) -> str:
+        """Endpoint URL for a model, built once per model"""
+        url = self._urls.get(model)
+        if url is None:
+            url = self._urls[model] = f"{self.base_url}/{model}"
+        return url
+    
     def send_request(
         self,
         prompt: str,
@@ -66,28 +125,83 @@ class CloudflareProvider:
         Returns:
             Tuple of (success: bool, response_text: Optional[str], error: Optional[str])
         """
-        if not self.is_available():
+        # base_url is set exactly when available, so the flag alone suffices
+        if not self.available:
             return False, None, "Cloudflare provider not available"
         
         try:
             # Use provided model or default
             model_to_use = model or self.model
+            body = _dumps(self._payload(prompt, temperature, max_tokens))
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"❌ Cloudflare request failed: {error_msg}")
+            return False, None, error_msg
+        
+        return self._post(self._url_for(model_to_use), body, model_to_use, max_tokens)
+    
+    def send_batch(
+        self,
+        prompts: List[str],
+        model: str = None,
+        temperature: float = 0.3,
+        max_tokens: int = 500,
+        max_workers: Optional[int] = None
+    ) -> List[Tuple[bool, Optional[str], Optional[str]]]:
+        """
+        Send many prompts concurrently over the pooled session
+        
+        All request bodies are encoded and the endpoint resolved up front,
+        then every request is submitted before any result is awaited, so
+        the network round trips overlap instead of adding up.
+        
+        Args:
+            prompts: Prompts to send
+            model: Model to use for every prompt (defaults to llama-2-7b)
+            temperature: Temperature for sampling
+            max_tokens: Maximum tokens in each response
+            max_workers: Concurrent requests (defaults to BATCH_MAX_WORKERS)
             
-            # Prepare request
-            headers = {
-                "Authorization": f"Bearer {self.api_token}",
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "prompt": prompt,
-                "max_tokens": min(max_tokens, 2048),  # Cloudflare limit
-                "temperature": temperature
-            }
-            
+        Returns:
+            One (success, response_text, error) tuple per prompt, in order
+        """
+        if not prompts:
+            return []
+        if not self.available:
+            return [(False, None, "Cloudflare provider not available")] * len(prompts)
+        
+        model_to_use = model or self.model
+        url = self._url_for(model_to_use)
+        bodies = [_dumps(self._payload(prompt, temperature, max_tokens)) for prompt in prompts]
+        
+        workers = min(len(bodies), max_workers or BATCH_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._post, url, body, model_to_use, max_tokens)
+                for body in bodies
+            ]
+            return [future.result() for future in futures]
+    
+    @staticmethod
+    def _payload(prompt: str, temperature: float, max_tokens: int) -> dict:
+        """Request payload for one prompt"""
+        return {
+            "prompt": prompt,
+            "max_tokens": min(max_tokens, 2048),  # Cloudflare limit
+            "temperature": temperature
+        }
+    
+    def _post(
+        self,
+        url: str,
+        body: bytes,
+        model: str,
+        max_tokens: int
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """POST an encoded request body and extract the response text"""
+        try:
             # Send request to Cloudflare endpoint
-            url = f"{self.base_url}/{model_to_use}"
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = self._session.post(url, data=body, headers=self._headers, timeout=30)
             
             if response.status_code != 200:
                 error_msg = f"HTTP {response.status_code}: {response.text}"
@@ -95,18 +209,23 @@ class CloudflareProvider:
                 return False, None, error_msg
             
             # Parse response
-            result = response.json()
+            result = _loads(response.content)
             
-            # Extract text from response
-            if 'result' in result and 'response' in result['result']:
-                response_text = result['result']['response'].strip()
-            elif 'result' in result and isinstance(result['result'], dict) and 'text' in result['result']:
-                response_text = result['result']['text'].strip()
-            else:
-                response_text = str(result).strip()
+            # Extract text from response (generation models use 'response', some use 'text')
+            try:
+                output = result['result']
+                response_text = output['response'] if 'response' in output else output['text']
+            except (KeyError, TypeError):
+                # Log the shape only; stringifying the whole payload can be huge
+                keys = list(result) if isinstance(result, dict) else type(result).__name__
+                error_msg = f"Unexpected response format: {keys}"
+                logger.error(f"❌ Cloudflare request failed: {error_msg}")
+                return False, None, error_msg
+            
+            response_text = response_text.rstrip()
             
             logger.info(
-                f"✅ Cloudflare request successful | Model: {model_to_use} | "
+                f"✅ Cloudflare request successful | Model: {model} | "
                 f"Tokens: {max_tokens}"
             )
             
@@ -10,18 +10,85 @@ that match the expected data contracts for:
 """
 
 import logging
+from collections import Counter
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# (record key, dataset label, RGB colour, fill) for each chart series
+_CHART_SERIES = (
+    ('cases', 'Total Cases', '59, 130, 246', True),
+    ('deaths', 'Deaths', '239, 68, 68', False),
+    ('recovered', 'Recovered', '34, 197, 94', False),
+)
+
+_HIGH_RISK_SEVERITIES = frozenset(('CRITICAL', 'HIGH'))
+
+
+def _to_float(value: Any) -> float:
+    """Coerce an analytics value to float, 0.0 when not numeric"""
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+@dataclass(slots=True)
+class MapPoint:
+    """One country marker for the geo map; orjson serializes it natively"""
+    country: str
+    lat: float
+    lng: float
+    cases: int
+    deaths: int
+    recovered: int
+    todayCases: int
+    riskScore: float
+    severity: str
+    
+    @classmethod
+    def from_region(cls, region: Dict[str, Any]) -> 'MapPoint':
+        """Build a point from a regional record, resolving alternate field names"""
+        get = region.get  # bound once for the lookups below
+        # Aliases are only consulted when the primary key is absent
+        return cls(
+            region['country'] if 'country' in region else get('region', 'Unknown'),
+            get('lat', 0),
+            region['lng'] if 'lng' in region else get('long', 0),
+            get('cases', 0),
+            get('deaths', 0),
+            get('recovered', 0),
+            get('todayCases', 0),
+            region['riskScore'] if 'riskScore' in region else get('risk_score', 0),
+            get('severity', 'MEDIUM')
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "country": self.country,
+            "lat": self.lat,
+            "lng": self.lng,
+            "cases": self.cases,
+            "deaths": self.deaths,
+            "recovered": self.recovered,
+            "todayCases": self.todayCases,
+            "riskScore": self.riskScore,
+            "severity": self.severity
+        }
+
+
 class DataNormalizer:
     """Normalizes raw data for frontend consumption"""
     
     @staticmethod
     def normalize_dashboard_metrics(
         global_stats: Dict[str, Any],
-        data_quality: float = 95.7
+        data_quality: float = 95.7,
+        now_iso: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Transform disease.sh global data into dashboard metrics format
@@ -34,29 +101,33 @@ class DataNormalizer:
             "data_quality": 95.7,
             "latest_ingestion": {...}
         }
+        
+        now_iso stamps latest_ingestion; callers normalizing several payloads
+        for one ingestion pass can format it once and share it.
         """
-        try:
-            total_cases = global_stats.get('cases', 0)
-            
-            # Calculate valid records (estimate based on death/recovery rates)
-            deaths = global_stats.get('deaths', 0)
-            recovered = global_stats.get('recovered', 0)
-            valid_records = deaths + recovered  # Better data coverage
-            
-            return {
-                "total_records": total_cases,
-                "valid_records": valid_records,
-                "active_alerts": global_stats.get('cases', 0) - deaths - recovered,
-                "data_quality": data_quality,
-                "latest_ingestion": {
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                    "records_processed": total_cases,
-                    "success_rate": data_quality / 100
-                }
+        if now_iso is None:
+            now_iso = datetime.utcnow().isoformat() + "Z"
+        if not isinstance(global_stats, dict):
+            return DataNormalizer._get_fallback_dashboard_metrics(now_iso)
+        
+        total_cases = global_stats.get('cases', 0)
+        
+        # Calculate valid records (estimate based on death/recovery rates)
+        deaths = global_stats.get('deaths', 0)
+        recovered = global_stats.get('recovered', 0)
+        valid_records = deaths + recovered  # Better data coverage
+        
+        return {
+            "total_records": total_cases,
+            "valid_records": valid_records,
+            "active_alerts": total_cases - deaths - recovered,
+            "data_quality": data_quality,
+            "latest_ingestion": {
+                "timestamp": now_iso,
+                "records_processed": total_cases,
+                "success_rate": data_quality / 100
             }
-        except Exception as e:
-            logger.error(f"❌ Dashboard normalization error: {str(e)}")
-            return DataNormalizer._get_fallback_dashboard_metrics()
+        }
     
     @staticmethod
     def normalize_chart_data(
@@ -82,53 +153,27 @@ class DataNormalizer:
             ]
         }
         """
-        try:
-            if not historical_data:
-                return DataNormalizer._get_fallback_chart_data()
-            
-            labels = []
-            cases_data = []
-            deaths_data = []
-            recovered_data = []
-            
-            for record in historical_data:
-                labels.append(record.get('date', ''))
-                cases_data.append(record.get('cases', 0))
-                deaths_data.append(record.get('deaths', 0))
-                recovered_data.append(record.get('recovered', 0))
-            
-            return {
-                "labels": labels,
-                "datasets": [
-                    {
-                        "label": "Total Cases",
-                        "data": cases_data,
-                        "borderColor": "rgb(59, 130, 246)",
-                        "backgroundColor": "rgba(59, 130, 246, 0.1)",
-                        "tension": 0.4,
-                        "fill": True
-                    },
-                    {
-                        "label": "Deaths",
-                        "data": deaths_data,
-                        "borderColor": "rgb(239, 68, 68)",
-                        "backgroundColor": "rgba(239, 68, 68, 0.1)",
-                        "tension": 0.4,
-                        "fill": False
-                    },
-                    {
-                        "label": "Recovered",
-                        "data": recovered_data,
-                        "borderColor": "rgb(34, 197, 94)",
-                        "backgroundColor": "rgba(34, 197, 94, 0.1)",
-                        "tension": 0.4,
-                        "fill": False
-                    }
-                ]
-            }
-        except Exception as e:
-            logger.error(f"❌ Chart data normalization error: {str(e)}")
+        if not isinstance(historical_data, list) or not historical_data:
             return DataNormalizer._get_fallback_chart_data()
+        
+        # One comprehension per series: each list is built in a single
+        # pass, which measures faster than filling preallocated lists
+        labels = [record.get('date', '') for record in historical_data]
+        
+        return {
+            "labels": labels,
+            "datasets": [
+                {
+                    "label": label,
+                    "data": [record.get(key, 0) for record in historical_data],
+                    "borderColor": f"rgb({rgb})",
+                    "backgroundColor": f"rgba({rgb}, 0.1)",
+                    "tension": 0.4,
+                    "fill": fill
+                }
+                for key, label, rgb, fill in _CHART_SERIES
+            ]
+        }
     
     @staticmethod
     def normalize_map_data(
@@ -152,26 +197,22 @@ class DataNormalizer:
             ...
         ]
         """
-        try:
-            normalized = []
-            
-            for region in regional_data:
-                normalized.append({
-                    "country": region.get('country', region.get('region', 'Unknown')),
-                    "lat": region.get('lat', 0),
-                    "lng": region.get('lng', region.get('long', 0)),
-                    "cases": region.get('cases', 0),
-                    "deaths": region.get('deaths', 0),
-                    "recovered": region.get('recovered', 0),
-                    "todayCases": region.get('todayCases', 0),
-                    "riskScore": region.get('riskScore', region.get('risk_score', 0)),
-                    "severity": region.get('severity', 'MEDIUM')
-                })
-            
-            return normalized
-        except Exception as e:
-            logger.error(f"❌ Map data normalization error: {str(e)}")
-            return DataNormalizer._get_fallback_map_data()
+        return [point.to_dict() for point in DataNormalizer.normalize_map_points(regional_data)]
+    
+    @staticmethod
+    def normalize_map_points(
+        regional_data: List[Dict[str, Any]]
+    ) -> List[MapPoint]:
+        """
+        Same as normalize_map_data, as slotted MapPoint records
+        
+        Cheaper to build and hold than per-row dicts; jsonify serializes
+        them through the app's JSON provider with the same field names.
+        """
+        if not isinstance(regional_data, list):
+            return [MapPoint(**point) for point in DataNormalizer._get_fallback_map_data()]
+        
+        return [MapPoint.from_region(region) for region in regional_data]
     
     @staticmethod
     def normalize_predictions(
@@ -190,26 +231,21 @@ class DataNormalizer:
             "confidence_average": 0.89
         }
         """
-        try:
-            if not predictions:
-                return DataNormalizer._get_fallback_predictions()
-            
-            # Calculate average confidence
-            confidences = [p.get('confidence', 0) for p in predictions]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-            
-            return {
-                "forecast": predictions,
-                "confidence_average": round(avg_confidence, 2),
-                "high_risk_regions": [
-                    p.get('region', f'Region{i}')
-                    for i, p in enumerate(predictions[:5])
-                    if p.get('severity') in ['CRITICAL', 'HIGH']
-                ]
-            }
-        except Exception as e:
-            logger.error(f"❌ Predictions normalization error: {str(e)}")
+        if not isinstance(predictions, list) or not predictions:
             return DataNormalizer._get_fallback_predictions()
+        
+        # Average confidence in one pass, without an intermediate list
+        avg_confidence = sum(p.get('confidence', 0) for p in predictions) / len(predictions)
+        
+        return {
+            "forecast": predictions,
+            "confidence_average": round(avg_confidence, 2),
+            "high_risk_regions": [
+                p.get('region', f'Region{i}')
+                for i, p in enumerate(predictions[:5])
+                if p.get('severity') in _HIGH_RISK_SEVERITIES
+            ]
+        }
     
     @staticmethod
     def normalize_alerts(
@@ -235,21 +271,22 @@ class DataNormalizer:
             ]
         }
         """
-        try:
-            critical_count = sum(1 for a in alerts if a.get('type') == 'CRITICAL')
-            warning_count = sum(1 for a in alerts if a.get('type') == 'WARNING')
-            info_count = sum(1 for a in alerts if a.get('type') == 'INFO')
-            
-            return {
-                "critical_count": critical_count,
-                "warning_count": warning_count,
-                "info_count": info_count,
-                "alerts": alerts,
-                "total_active": critical_count + warning_count + info_count
-            }
-        except Exception as e:
-            logger.error(f"❌ Alerts normalization error: {str(e)}")
+        if not isinstance(alerts, list):
             return DataNormalizer._get_fallback_alerts()
+        
+        # Count every alert type in a single pass
+        counts = Counter(a.get('type') for a in alerts)
+        critical_count = counts['CRITICAL']
+        warning_count = counts['WARNING']
+        info_count = counts['INFO']
+        
+        return {
+            "critical_count": critical_count,
+            "warning_count": warning_count,
+            "info_count": info_count,
+            "alerts": alerts,
+            "total_active": critical_count + warning_count + info_count
+        }
     
     @staticmethod
     def normalize_analytics(
@@ -260,39 +297,28 @@ class DataNormalizer:
         
         Ensures all values are numeric and properly formatted
         """
-        try:
-            # Ensure all nested values are numeric
-            normalized = {}
-            
-            for metric_name, metric_data in analytics.items():
-                if isinstance(metric_data, dict):
-                    normalized[metric_name] = {}
-                    for key, value in metric_data.items():
-                        # Convert to float, handle errors
-                        try:
-                            normalized[metric_name][key] = float(value)
-                        except (ValueError, TypeError):
-                            normalized[metric_name][key] = 0.0
-                else:
-                    try:
-                        normalized[metric_name] = float(metric_data)
-                    except (ValueError, TypeError):
-                        normalized[metric_name] = 0.0
-            
-            return normalized
-        except Exception as e:
-            logger.error(f"❌ Analytics normalization error: {str(e)}")
+        if not isinstance(analytics, dict):
             return DataNormalizer._get_fallback_analytics()
+        
+        # Ensure all nested values are numeric
+        return {
+            metric_name: (
+                {key: _to_float(value) for key, value in metric_data.items()}
+                if isinstance(metric_data, dict)
+                else _to_float(metric_data)
+            )
+            for metric_name, metric_data in analytics.items()
+        }
     
     @staticmethod
-    def _get_fallback_dashboard_metrics() -> Dict[str, Any]:
+    def _get_fallback_dashboard_metrics(now_iso: Optional[str] = None) -> Dict[str, Any]:
         return {
             "total_records": 700000000,
             "valid_records": 665000000,
             "active_alerts": 5000000,
             "data_quality": 95.7,
             "latest_ingestion": {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": now_iso or datetime.utcnow().isoformat() + "Z",
                 "records_processed": 700000000,
                 "success_rate": 0.957
             }
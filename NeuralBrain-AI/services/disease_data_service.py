@@ -22,13 +22,117 @@ CRITICAL FIXES:
 
 import requests
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Optional, Tuple
 import json
 import time
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional; its JSONDecodeError subclasses the stdlib one
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+
+# Longest Retry-After the adapter will honour; the fetch runs on the
+# scheduler thread, so a rate-limited API must not park it indefinitely
+MAX_RETRY_AFTER = 5  # seconds
+
+
+class _CappedRetry(Retry):
+    """Retry policy that honours Retry-After only up to MAX_RETRY_AFTER"""
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, MAX_RETRY_AFTER)
+
+
+def _risk_score(cases: float, deaths: float, population: float) -> float:
+    """Outbreak risk (0-100) from case rate per 100k and case fatality rate"""
+    if population <= 0:
+        return 0.0
+    case_rate = cases / population * 100000
+    death_rate = deaths / cases * 100 if cases > 0 else 0.0
+    return min(100, case_rate / 10 + death_rate * 2)
+
+
+def _data_status(fetch_status: str) -> str:
+    """Staleness label for a successful fetch: FRESH off the wire, else CACHED"""
+    return 'FRESH' if fetch_status == 'SUCCESS' else 'CACHED'
+
+
+def _copy_payload(data: Any) -> Any:
+    """One-level copy of an API payload so callers can stamp metadata on it"""
+    if isinstance(data, list):
+        return [dict(item) if isinstance(item, dict) else item for item in data]
+    if isinstance(data, dict):
+        return dict(data)
+    return data
+
+
+# Fallback payloads, built once at import; accessors hand out copies
+# because callers stamp data_status/data_error onto the items
+_FALLBACK_GLOBAL_STATS = {
+    'cases': 765432100,
+    'deaths': 7654321,
+    'recovered': 698765432,
+    'todayCases': 250000,
+    'todayDeaths': 2500,
+    'todayRecovered': 200000,
+    'active': 59012347,
+    'data_status': 'FALLBACK',
+    'data_error': 'API_UNAVAILABLE'
+}
+
+_FALLBACK_COUNTRIES_DATA = (
+    {'country': 'USA', 'cases': 103000000, 'deaths': 1100000, 'population': 331000000, 'countryInfo': {'lat': 37.0902, 'long': -95.7129}},
+    {'country': 'India', 'cases': 45000000, 'deaths': 520000, 'population': 1380000000, 'countryInfo': {'lat': 20.5937, 'long': 78.9629}},
+    {'country': 'Brazil', 'cases': 34000000, 'deaths': 680000, 'population': 212000000, 'countryInfo': {'lat': -14.2350, 'long': -51.9253}},
+    {'country': 'France', 'cases': 32000000, 'deaths': 160000, 'population': 65000000, 'countryInfo': {'lat': 46.2276, 'long': 2.2137}},
+    {'country': 'Germany', 'cases': 33000000, 'deaths': 150000, 'population': 83000000, 'countryInfo': {'lat': 51.1657, 'long': 10.4515}},
+    {'country': 'UK', 'cases': 24000000, 'deaths': 200000, 'population': 67000000, 'countryInfo': {'lat': 55.3781, 'long': -3.4360}},
+    {'country': 'Italy', 'cases': 22000000, 'deaths': 180000, 'population': 60000000, 'countryInfo': {'lat': 41.8719, 'long': 12.5674}},
+    {'country': 'Japan', 'cases': 21000000, 'deaths': 95000, 'population': 125000000, 'countryInfo': {'lat': 36.2048, 'long': 138.2529}},
+    {'country': 'Canada', 'cases': 15000000, 'deaths': 45000, 'population': 38000000, 'countryInfo': {'lat': 56.1304, 'long': -106.3468}},
+    {'country': 'Spain', 'cases': 14000000, 'deaths': 110000, 'population': 47000000, 'countryInfo': {'lat': 40.4637, 'long': -3.7492}},
+)
+
+_FALLBACK_REGIONAL_RISKS = (
+    {'country': 'USA', 'cases': 103000000, 'deaths': 1100000, 'riskScore': 85.5},
+    {'country': 'India', 'cases': 45000000, 'deaths': 520000, 'riskScore': 72.3},
+    {'country': 'Brazil', 'cases': 34000000, 'deaths': 680000, 'riskScore': 78.9},
+    {'country': 'France', 'cases': 32000000, 'deaths': 160000, 'riskScore': 65.2},
+    {'country': 'Germany', 'cases': 33000000, 'deaths': 150000, 'riskScore': 62.8},
+)
+
+
+@lru_cache(maxsize=4)
+def _fallback_history(days: int, today: date) -> Tuple[Dict[str, Any], ...]:
+    """Synthetic trend ending today; keyed on the date so it rolls over daily"""
+    base_date = today - timedelta(days=days)
+    base_ordinal = base_date.toordinal()
+    
+    # Simulate realistic trend (slight growth) with plain integer steps
+    return tuple(
+        {
+            'date': date.fromordinal(base_ordinal + i).strftime('%m/%d/%Y'),
+            'cases': cases,
+            'deaths': int(cases * 0.01)
+        }
+        for i, cases in enumerate(range(600000000, 600000000 + days * 2700000, 2700000))
+    )
+
+
 class DiseaseDataService:
     """Fetches real-time disease data from disease.sh API"""
     
@@ -36,90 +140,116 @@ class DiseaseDataService:
     TIMEOUT = 10
     MAX_RETRIES = 3
     RETRY_DELAY = 1  # seconds (exponential backoff)
+    CACHE_TTL = 300  # seconds; disease.sh refreshes at most every 10 minutes
     
     # Track data freshness
     _last_fetch_time = None
     _last_fetch_status = "NOT_ATTEMPTED"
     _last_successful_fetch = None
     
+    # endpoint -> (time.monotonic() fetched, UTC datetime fetched, payload);
+    # entries older than CACHE_TTL are refetched
+    _cache: Dict[str, tuple] = {}
+    _cache_lock = threading.RLock()
+    
+    # Shared keep-alive session, created on first request
+    _session = None
+    _session_lock = threading.Lock()
+    
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Pooled HTTP session reused across calls (skips per-call TCP/TLS setup)"""
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    session = requests.Session()
+                    # urllib3 handles retries and backoff on the pooled connection
+                    retry = _CappedRetry(
+                        total=cls.MAX_RETRIES - 1,
+                        backoff_factor=cls.RETRY_DELAY,
+                        status_forcelist=(429, 500, 502, 503, 504),
+                        allowed_methods=frozenset(['GET']),
+                        raise_on_status=False
+                    )
+                    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+                    session.headers['User-Agent'] = 'NeuralBrain-AI/1.0'
+                    cls._session = session
+        return cls._session
+    
+    @staticmethod
+    def _fetch_failed(status: str) -> Tuple[None, str, None]:
+        """Record a failed fetch for get_data_status() and return (None, status, None)"""
+        DiseaseDataService._last_fetch_status = status
+        return None, status, None
+    
     @staticmethod
-    def _make_request_with_retry(endpoint: str, max_retries: int = MAX_RETRIES) -> Optional[Dict]:
+    def _make_request_with_retry(endpoint: str) -> Tuple[Optional[Any], str, Optional[datetime]]:
         """
-        Make HTTP request with exponential backoff retry
+        Make HTTP request; the session adapter retries with exponential backoff
+        
+        The status and fetch time are returned with the data rather than
+        read back from class attributes, which concurrent fetches overwrite.
         
         Returns:
-            Response JSON on success
-            None on complete failure (logs error)
+            (response JSON, "SUCCESS", fetched_at) on a network fetch
+            (response JSON, "CACHED", fetched_at) when served from the cache
+            (None, failure status, None) on complete failure (logs error)
         """
-        url = f"{DiseaseDataService.BASE_URL}{endpoint}"
+        with DiseaseDataService._cache_lock:
+            cached = DiseaseDataService._cache.get(endpoint)
+        if cached is not None and cached[0] + DiseaseDataService.CACHE_TTL > time.monotonic():
+            logger.debug(f"📦 Cache hit for {endpoint}")
+            return _copy_payload(cached[2]), "CACHED", cached[1]
         
-        for attempt in range(max_retries):
-            try:
-                logger.info(f"🔄 Fetching {endpoint} (attempt {attempt + 1}/{max_retries})")
-                
-                response = requests.get(
-                    url,
-                    timeout=DiseaseDataService.TIMEOUT,
-                    headers={'User-Agent': 'NeuralBrain-AI/1.0'}
-                )
-                
-                # CRITICAL: Validate HTTP status
-                if response.status_code != 200:
-                    logger.warning(f"⚠️ HTTP {response.status_code} from {endpoint}")
-                    
-                    if attempt < max_retries - 1:
-                        wait_time = DiseaseDataService.RETRY_DELAY * (2 ** attempt)
-                        logger.info(f"⏳ Retry in {wait_time}s...")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        logger.error(f"❌ Failed after {max_retries} retries: HTTP {response.status_code}")
-                        DiseaseDataService._last_fetch_status = f"FAILED_HTTP_{response.status_code}"
-                        return None
-                
-                # Parse JSON
-                data = response.json()
-                
-                # Track successful fetch
-                DiseaseDataService._last_fetch_time = datetime.utcnow()
-                DiseaseDataService._last_fetch_status = "SUCCESS"
-                DiseaseDataService._last_successful_fetch = data
-                
-                logger.info(f"✅ Successfully fetched {endpoint}")
-                return data
-                
-            except requests.Timeout:
-                logger.warning(f"⏱️ Timeout on {endpoint} (attempt {attempt + 1})")
-                if attempt < max_retries - 1:
-                    time.sleep(DiseaseDataService.RETRY_DELAY * (2 ** attempt))
-                    continue
-                else:
-                    logger.error(f"❌ Timeout after {max_retries} attempts")
-                    DiseaseDataService._last_fetch_status = "TIMEOUT"
-                    return None
-                    
-            except requests.ConnectionError as e:
-                logger.warning(f"🌐 Connection error on {endpoint}: {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(DiseaseDataService.RETRY_DELAY * (2 ** attempt))
-                    continue
-                else:
-                    logger.error(f"❌ Connection failed after {max_retries} attempts")
-                    DiseaseDataService._last_fetch_status = "CONNECTION_ERROR"
-                    return None
-                    
-            except json.JSONDecodeError:
-                logger.error(f"❌ Invalid JSON from {endpoint}")
-                DiseaseDataService._last_fetch_status = "INVALID_JSON"
-                return None
-                
-            except Exception as e:
-                logger.error(f"❌ Unexpected error on {endpoint}: {str(e)}")
-                DiseaseDataService._last_fetch_status = f"ERROR_{type(e).__name__}"
-                return None
+        url = f"{DiseaseDataService.BASE_URL}{endpoint}"
         
-        DiseaseDataService._last_fetch_status = "MAX_RETRIES_EXCEEDED"
-        return None
+        try:
+            logger.info(f"🔄 Fetching {endpoint}")
+            
+            response = DiseaseDataService._get_session().get(
+                url,
+                timeout=DiseaseDataService.TIMEOUT
+            )
+            
+            # CRITICAL: Validate HTTP status
+            if response.status_code != 200:
+                logger.error(f"❌ Failed after retries: HTTP {response.status_code} from {endpoint}")
+                return DiseaseDataService._fetch_failed(f"FAILED_HTTP_{response.status_code}")
+            
+            # Parse the raw bytes; skips requests' charset detection
+            data = _loads(response.content)
+            
+            # Track successful fetch
+            fetched_at = datetime.utcnow()
+            DiseaseDataService._last_fetch_time = fetched_at
+            DiseaseDataService._last_fetch_status = "SUCCESS"
+            DiseaseDataService._last_successful_fetch = data
+            with DiseaseDataService._cache_lock:
+                DiseaseDataService._cache[endpoint] = (time.monotonic(), fetched_at, data)
+            
+            logger.info(f"✅ Successfully fetched {endpoint}")
+            return _copy_payload(data), "SUCCESS", fetched_at
+            
+        except requests.Timeout:
+            logger.error(f"❌ Timeout on {endpoint} after retries")
+            return DiseaseDataService._fetch_failed("TIMEOUT")
+            
+        except requests.ConnectionError as e:
+            # Once the adapter's retries run out, read timeouts surface as a
+            # ConnectionError wrapping MaxRetryError(reason=ReadTimeoutError)
+            if e.args and isinstance(getattr(e.args[0], 'reason', None), ReadTimeoutError):
+                logger.error(f"❌ Timeout on {endpoint} after retries")
+                return DiseaseDataService._fetch_failed("TIMEOUT")
+            logger.error(f"❌ Connection failed on {endpoint} after retries: {str(e)}")
+            return DiseaseDataService._fetch_failed("CONNECTION_ERROR")
+            
+        except json.JSONDecodeError:
+            logger.error(f"❌ Invalid JSON from {endpoint}")
+            return DiseaseDataService._fetch_failed("INVALID_JSON")
+            
+        except Exception as e:
+            logger.error(f"❌ Unexpected error on {endpoint}: {str(e)}")
+            return DiseaseDataService._fetch_failed(f"ERROR_{type(e).__name__}")
     
     @staticmethod
     def get_global_stats() -> Dict[str, Any]:
@@ -141,19 +271,19 @@ class DiseaseDataService:
         try:
             logger.info("📊 Fetching global COVID-19 stats from disease.sh...")
             
-            data = DiseaseDataService._make_request_with_retry('/all')
+            data, status, fetched_at = DiseaseDataService._make_request_with_retry('/all')
             
             if data is None:
                 logger.error("❌ Global stats fetch FAILED - using fallback")
                 fallback = DiseaseDataService._get_fallback_global_stats()
                 fallback['data_status'] = 'FALLBACK'
-                fallback['data_error'] = DiseaseDataService._last_fetch_status
+                fallback['data_error'] = status
                 return fallback
             
             # Add metadata
-            data['data_status'] = 'FRESH'
-            data['data_timestamp'] = DiseaseDataService._last_fetch_time.isoformat() if DiseaseDataService._last_fetch_time else None
-            data['data_age_seconds'] = 0
+            data['data_status'] = _data_status(status)
+            data['data_timestamp'] = fetched_at.isoformat()
+            data['data_age_seconds'] = int((datetime.utcnow() - fetched_at).total_seconds())
             
             logger.info(f"✅ Global stats: {data.get('cases', 0):,} total cases")
             return data
@@ -166,38 +296,45 @@ class DiseaseDataService:
             return fallback
     
     @staticmethod
-    def get_countries_data() -> List[Dict[str, Any]]:
+    def get_countries_data(limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         GET /countries - Per-country statistics with coordinates
         
+        limit keeps only the top countries by cases; the rest are dropped
+        before metadata is stamped on.
+        
         Returns list of:
         {
             "country": "USA",
             "countryInfo": {"_id": 840, "iso2": "US", "iso3": "USA", "lat": 37.0902, "long": -95.7129},
             "cases": 103000000,
             "deaths": 1100000,
-            "data_status": "FRESH" | "FALLBACK"
+            "data_status": "FRESH" | "CACHED" | "FALLBACK"
         }
         """
         try:
             logger.info("🌍 Fetching per-country COVID-19 data...")
             
-            data = DiseaseDataService._make_request_with_retry('/countries')
+            data, status, fetched_at = DiseaseDataService._make_request_with_retry('/countries')
             
             if data is None:
                 logger.error("❌ Countries data fetch FAILED - using fallback")
                 fallback = DiseaseDataService._get_fallback_countries_data()
                 for item in fallback:
                     item['data_status'] = 'FALLBACK'
+                    item['data_error'] = status
                 return fallback
             
-            # Sort by cases descending
-            data_sorted = sorted(data, key=lambda x: x.get('cases', 0), reverse=True)
+            # Sort by cases descending, in place: data is already our own copy
+            data.sort(key=lambda item: item.get('cases', 0), reverse=True)
+            data_sorted = data if limit is None else data[:limit]
             
             # Add metadata
+            data_status = _data_status(status)
+            ts = fetched_at.isoformat()
             for item in data_sorted:
-                item['data_status'] = 'FRESH'
-                item['data_timestamp'] = DiseaseDataService._last_fetch_time.isoformat() if DiseaseDataService._last_fetch_time else None
+                item['data_status'] = data_status
+                item['data_timestamp'] = ts
             
             logger.info(f"✅ Retrieved data for {len(data_sorted)} countries")
             return data_sorted
@@ -222,19 +359,20 @@ class DiseaseDataService:
             "date": "12/31/2024",
             "cases": 700000000,
             "deaths": 7000000,
-            "data_status": "FRESH" | "FALLBACK"
+            "data_status": "FRESH" | "CACHED" | "FALLBACK"
         }, ...]
         """
         try:
             logger.info(f"📈 Fetching {days}-day historical data...")
             
-            data = DiseaseDataService._make_request_with_retry(f'/historical/all?lastdays={days}')
+            data, status, fetched_at = DiseaseDataService._make_request_with_retry(f'/historical/all?lastdays={days}')
             
             if data is None:
                 logger.error(f"❌ Historical data fetch FAILED - using fallback")
                 fallback = DiseaseDataService._get_fallback_historical_data(days)
                 for item in fallback:
                     item['data_status'] = 'FALLBACK'
+                    item['data_error'] = status
                 return fallback
             
             # Transform format if needed
@@ -249,15 +387,24 @@ class DiseaseDataService:
                 
                 # Get all unique dates from cases data (primary source)
                 if isinstance(cases_data, dict):
-                    for date_str, case_count in cases_data.items():
-                        result.append({
+                    dates = list(cases_data)
+                    deaths = DiseaseDataService._aligned_values(deaths_data, dates)
+                    recovered = DiseaseDataService._aligned_values(recovered_data, dates)
+                    data_status = _data_status(status)
+                    ts = fetched_at.isoformat()
+                    
+                    result = [
+                        {
                             'date': date_str,
                             'cases': case_count,
-                            'deaths': deaths_data.get(date_str, 0),
-                            'recovered': recovered_data.get(date_str, 0),
-                            'data_status': 'FRESH',
-                            'data_timestamp': DiseaseDataService._last_fetch_time.isoformat() if DiseaseDataService._last_fetch_time else None
-                        })
+                            'deaths': death_count,
+                            'recovered': recovered_count,
+                            'data_status': data_status,
+                            'data_timestamp': ts
+                        }
+                        for date_str, case_count, death_count, recovered_count
+                        in zip(dates, cases_data.values(), deaths, recovered)
+                    ]
             
             logger.info(f"✅ Retrieved {len(result)} days of historical data")
             return result
@@ -270,35 +417,58 @@ class DiseaseDataService:
                 item['data_error'] = str(e)
             return fallback
     
+    @staticmethod
+    def _aligned_values(series: Any, dates: List[str]) -> List[Any]:
+        """Values of a date-keyed series in the order of dates, 0 where missing"""
+        if not isinstance(series, dict):
+            return [0] * len(dates)
+        # disease.sh returns every series over the same dates; zip them directly
+        if list(series) == dates:
+            return list(series.values())
+        return [series.get(date_str, 0) for date_str in dates]
+    
+    @staticmethod
+    def get_all_data(days: int = 60) -> Dict[str, Any]:
+        """
+        Fetch global stats, countries and historical data concurrently
+        
+        The three endpoints are independent, so wall time is the slowest
+        fetch instead of the sum. Each result keeps its own fallback.
+        
+        Returns:
+            {"global_stats": {...}, "countries": [...], "historical": [...]}
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            global_stats = executor.submit(DiseaseDataService.get_global_stats)
+            countries = executor.submit(DiseaseDataService.get_countries_data)
+            historical = executor.submit(DiseaseDataService.get_historical_data, days)
+            
+            return {
+                'global_stats': global_stats.result(),
+                'countries': countries.result(),
+                'historical': historical.result(),
+            }
+    
     @staticmethod
     def get_regional_outbreak_risk() -> List[Dict[str, Any]]:
         """Calculate regional outbreak risk from countries data"""
         try:
-            countries = DiseaseDataService.get_countries_data()
+            countries = DiseaseDataService.get_countries_data(limit=20)
             
-            risks = []
-            for country in countries[:20]:  # Top 20 countries
-                cases = country.get('cases', 0)
-                deaths = country.get('deaths', 0)
-                population = country.get('population', 1)
-                
-                # Risk score calculation
-                if population > 0:
-                    case_rate = (cases / population) * 100000 if population > 0 else 0
-                    death_rate = (deaths / cases * 100) if cases > 0 else 0
-                else:
-                    case_rate = 0
-                    death_rate = 0
-                
-                risk_score = min(100, (case_rate / 10) + (death_rate * 2))
-                
-                risks.append({
+            risks = [
+                {
                     'country': country.get('country', 'Unknown'),
-                    'cases': cases,
-                    'deaths': deaths,
-                    'riskScore': round(risk_score, 1),
+                    'cases': country.get('cases', 0),
+                    'deaths': country.get('deaths', 0),
+                    'riskScore': round(_risk_score(
+                        country.get('cases', 0),
+                        country.get('deaths', 0),
+                        country.get('population', 1)
+                    ), 1),
                     'data_status': country.get('data_status', 'UNKNOWN')
-                })
+                }
+                for country in countries[:20]  # Top 20 countries
+            ]
             
             logger.info(f"✅ Calculated outbreak risk for {len(risks)} regions")
             return risks
@@ -307,6 +477,12 @@ class DiseaseDataService:
             logger.error(f"❌ Error calculating regional risk: {str(e)}")
             return DiseaseDataService._get_fallback_regional_risks()
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached API responses"""
+        with DiseaseDataService._cache_lock:
+            DiseaseDataService._cache.clear()
+    
     @staticmethod
     def get_data_status() -> Dict[str, Any]:
         """Return current data fetch status"""
@@ -324,62 +500,19 @@ class DiseaseDataService:
     @staticmethod
     def _get_fallback_global_stats() -> Dict[str, Any]:
         """Fallback global stats (realistic data)"""
-        return {
-            'cases': 765432100,
-            'deaths': 7654321,
-            'recovered': 698765432,
-            'todayCases': 250000,
-            'todayDeaths': 2500,
-            'todayRecovered': 200000,
-            'active': 59012347,
-            'data_status': 'FALLBACK',
-            'data_error': 'API_UNAVAILABLE'
-        }
+        return dict(_FALLBACK_GLOBAL_STATS)
     
     @staticmethod
     def _get_fallback_countries_data() -> List[Dict[str, Any]]:
         """Fallback countries data (top 10 countries)"""
-        return [
-            {'country': 'USA', 'cases': 103000000, 'deaths': 1100000, 'population': 331000000, 'countryInfo': {'lat': 37.0902, 'long': -95.7129}},
-            {'country': 'India', 'cases': 45000000, 'deaths': 520000, 'population': 1380000000, 'countryInfo': {'lat': 20.5937, 'long': 78.9629}},
-            {'country': 'Brazil', 'cases': 34000000, 'deaths': 680000, 'population': 212000000, 'countryInfo': {'lat': -14.2350, 'long': -51.9253}},
-            {'country': 'France', 'cases': 32000000, 'deaths': 160000, 'population': 65000000, 'countryInfo': {'lat': 46.2276, 'long': 2.2137}},
-            {'country': 'Germany', 'cases': 33000000, 'deaths': 150000, 'population': 83000000, 'countryInfo': {'lat': 51.1657, 'long': 10.4515}},
-            {'country': 'UK', 'cases': 24000000, 'deaths': 200000, 'population': 67000000, 'countryInfo': {'lat': 55.3781, 'long': -3.4360}},
-            {'country': 'Italy', 'cases': 22000000, 'deaths': 180000, 'population': 60000000, 'countryInfo': {'lat': 41.8719, 'long': 12.5674}},
-            {'country': 'Japan', 'cases': 21000000, 'deaths': 95000, 'population': 125000000, 'countryInfo': {'lat': 36.2048, 'long': 138.2529}},
-            {'country': 'Canada', 'cases': 15000000, 'deaths': 45000, 'population': 38000000, 'countryInfo': {'lat': 56.1304, 'long': -106.3468}},
-            {'country': 'Spain', 'cases': 14000000, 'deaths': 110000, 'population': 47000000, 'countryInfo': {'lat': 40.4637, 'long': -3.7492}},
-        ]
+        return [dict(item) for item in _FALLBACK_COUNTRIES_DATA]
     
     @staticmethod
     def _get_fallback_historical_data(days: int = 60) -> List[Dict[str, Any]]:
         """Fallback historical data (realistic trend)"""
-        result = []
-        base_date = datetime.utcnow() - timedelta(days=days)
-        base_cases = 600000000
-        
-        for i in range(days):
-            current_date = base_date + timedelta(days=i)
-            # Simulate realistic trend (slight growth)
-            cases = int(base_cases + (i * 2700000))
-            deaths = int(cases * 0.01)
-            
-            result.append({
-                'date': current_date.strftime('%m/%d/%Y'),
-                'cases': cases,
-                'deaths': deaths
-            })
-        
-        return result
+        return [dict(item) for item in _fallback_history(days, datetime.utcnow().date())]
     
     @staticmethod
     def _get_fallback_regional_risks() -> List[Dict[str, Any]]:
         """Fallback regional risks"""
-        return [
-            {'country': 'USA', 'cases': 103000000, 'deaths': 1100000, 'riskScore': 85.5},
-            {'country': 'India', 'cases': 45000000, 'deaths': 520000, 'riskScore': 72.3},
-            {'country': 'Brazil', 'cases': 34000000, 'deaths': 680000, 'riskScore': 78.9},
-            {'country': 'France', 'cases': 32000000, 'deaths': 160000, 'riskScore': 65.2},
-            {'country': 'Germany', 'cases': 33000000, 'deaths': 150000, 'riskScore': 62.8},
-        ]
+        return [dict(item) for item in _FALLBACK_REGIONAL_RISKS]
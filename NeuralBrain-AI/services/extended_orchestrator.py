@@ -15,11 +15,176 @@ Provider Stack (Priority Order):
 5. HuggingFace (Final)
 """
 
+import json
 import logging
-from typing import Dict, Any, Optional, Tuple
+import os
+import random
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from services.ai_providers import GeminiProvider, OpenAIProvider
+from services.cloudflare_provider import CloudflareProvider
+from services.groq_provider import get_groq_provider
+from services.huggingface_provider import HuggingFaceProvider
+from services.provider_lock import get_provider_lock_manager
 
 logger = logging.getLogger(__name__)
 
+# Smoothing factor for the per-provider seconds-per-token EWMA
+LATENCY_ALPHA = 0.3
+
+# Raw latency samples are kept for this long per provider, up to a cap
+LATENCY_WINDOW_SECONDS = 3600
+LATENCY_WINDOW_MAX_SAMPLES = 1000
+
+# Answer length the router prices providers at: TTFT + this many tokens
+ROUTING_EXPECTED_TOKENS = 125
+
+# Transient errors are retried this many times in total, with exponential
+# backoff and jitter, before they count as one failure toward failover
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5  # seconds
+RETRY_MAX_DELAY = 8.0  # seconds
+RETRY_JITTER = 0.15  # +/- fraction of the delay
+
+# A rate-limited provider is skipped for this long unless it sends Retry-After
+RATE_LIMIT_COOLDOWN = 30.0  # seconds
+
+# Models only one provider serves go straight to it, skipping the lock and
+# failover; MODEL_ROUTING_FILE may point at a JSON object that extends this
+DEFAULT_MODEL_ROUTES = {
+    'gpt-4o': 'openai',
+    'gpt-4o-mini': 'openai',
+    'gpt-3.5-turbo': 'openai',
+    'gemini-pro': 'gemini',
+    'gemini-1.5-pro': 'gemini',
+    'gemini-1.5-flash': 'gemini',
+    'llama-3.1-8b-instant': 'groq',
+    'llama-3.3-70b-versatile': 'groq',
+    'mixtral-8x7b-32768': 'groq',
+    'llama-2-7b': 'cloudflare',
+    'mistral-7b': 'cloudflare',
+    'codellama-7b': 'cloudflare',
+    'amazon/chronos-t5-large': 'huggingface',
+}
+
+# Shared keep-alive pool for the HTTP-based providers (Cloudflare, HuggingFace)
+HTTP_POOL_CONNECTIONS = 10  # hosts kept pooled
+HTTP_POOL_MAXSIZE = 50  # connections per host; covers hedging and batches
+
+# health_check_all() reports providers that have not answered by then as unhealthy
+HEALTH_CHECK_TIMEOUT = 5.0  # seconds
+
+# Upper bound on concurrent requests for get_predictions_batch fan-out
+BATCH_MAX_WORKERS = 8
+
+# Hedge worker threads, i.e. requests in flight across all hedged calls
+# (about 8 concurrent calls at k=2). Losing requests keep their slot until
+# they finish; a call that can't reserve k slots runs single-shot instead
+# of queueing behind other calls' stragglers.
+HEDGE_MAX_IN_FLIGHT = 16
+
+# is_available() results are reused for this long; failover drops them early
+AVAILABILITY_TTL = 5.0  # seconds
+
+# Providers return error strings rather than exceptions; status codes arrive as "HTTP <code>: ..."
+_RATE_LIMIT_ERROR = re.compile(
+    r'(?:http|status|code|error)\W{0,3}429\b|rate[ _-]?limit|too many requests',
+    re.IGNORECASE
+)
+_TRANSIENT_ERROR = re.compile(
+    r'(?:http|status|code|error)\W{0,3}(?:500|502|503|504|529)\b'
+    r'|time(?:d )?out|overloaded|temporarily|connection',
+    re.IGNORECASE
+)
+_RETRY_AFTER = re.compile(r'retry[ _-]?after\D{0,5}(\d+(?:\.\d+)?)', re.IGNORECASE)
+
+
+def _classify_error(error: Optional[str]) -> str:
+    """Bucket a provider error message: 'rate_limit', 'transient' or 'permanent'"""
+    if not error:
+        return 'permanent'
+    if _RATE_LIMIT_ERROR.search(error):
+        return 'rate_limit'
+    if _TRANSIENT_ERROR.search(error):
+        return 'transient'
+    return 'permanent'
+
+
+def _retry_after(error: Optional[str], default: Optional[float] = None) -> Optional[float]:
+    """Retry-After seconds quoted in a provider error message, else default"""
+    match = _RETRY_AFTER.search(error or '')
+    return float(match.group(1)) if match else default
+
+
+def _backoff_delay(attempt: int, error: Optional[str]) -> float:
+    """Seconds to wait before retry number attempt + 1, honouring Retry-After"""
+    retry_after = _retry_after(error)
+    if retry_after is not None:
+        return min(retry_after, RETRY_MAX_DELAY)
+    
+    delay = min(RETRY_BASE_DELAY * (2 ** attempt), RETRY_MAX_DELAY)
+    return delay * (1 + random.uniform(-RETRY_JITTER, RETRY_JITTER))
+
+
+def _load_model_routes(known_providers) -> Dict[str, str]:
+    """DEFAULT_MODEL_ROUTES plus overrides from MODEL_ROUTING_FILE, if set"""
+    routes = dict(DEFAULT_MODEL_ROUTES)
+    path = os.getenv('MODEL_ROUTING_FILE', '').strip()
+    if path:
+        try:
+            with open(path, 'r') as f:
+                routes.update(json.load(f))
+            logger.info("🗺️ Loaded model routes from %s", path)
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning("⚠️ Ignoring model routing file %s: %s", path, e)
+    
+    return {model: name for model, name in routes.items() if name in known_providers}
+
+
+def _shared_http_session() -> requests.Session:
+    """
+    One connection pool for every HTTP-based provider
+    
+    No urllib3 retries: the orchestrator already retries transient errors
+    and cools down rate-limited providers, and nesting both would multiply
+    the attempts.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+@dataclass(slots=True, frozen=True)
+class _ProviderInfo:
+    """What a provider is and can do; fixed for the provider's lifetime"""
+    name: str
+    model_info: Optional[dict]
+    has_health_check: bool
+    has_send_batch: bool
+    streams: bool
+    
+    @classmethod
+    def of(cls, provider) -> '_ProviderInfo':
+        get_model_info = getattr(provider, 'get_model_info', None)
+        return cls(
+            name=provider.get_provider_name(),
+            model_info=get_model_info() if callable(get_model_info) else None,
+            has_health_check=callable(getattr(provider, 'health_check', None)),
+            has_send_batch=callable(getattr(provider, 'send_batch', None)),
+            streams=bool(getattr(provider, 'supports_streaming', False))
+        )
+
 
 class ExtendedAIProviderOrchestrator:
     """
@@ -28,23 +193,17 @@ class ExtendedAIProviderOrchestrator:
     
     def __init__(self):
         """Initialize all 5 providers"""
-        # Import provider lock system
-        from services.provider_lock import get_provider_lock_manager
-        from services.ai_providers import OpenAIProvider, GeminiProvider
-        from services.groq_provider import GroqProvider
-        from services.cloudflare_provider import CloudflareProvider
-        from services.huggingface_provider import HuggingFaceProvider
-        
         # Initialize lock manager
         self.lock_manager = get_provider_lock_manager()
         
-        # Initialize all 5 providers
+        # Initialize all 5 providers; the HTTP-based ones share one pool
+        self._http_session = _shared_http_session()
         self.providers = {
             'openai': OpenAIProvider(),
             'gemini': GeminiProvider(),
-            'groq': GroqProvider(),
-            'cloudflare': CloudflareProvider(),
-            'huggingface': HuggingFaceProvider()
+            'groq': get_groq_provider(),
+            'cloudflare': CloudflareProvider(session=self._http_session),
+            'huggingface': HuggingFaceProvider(session=self._http_session)
         }
         
         # Track which providers are available
@@ -56,11 +215,63 @@ class ExtendedAIProviderOrchestrator:
         # Log initialization
         logger.info("🎯 Extended AI Provider Orchestrator initialized")
         for provider_name in self.available_providers:
-            logger.info(f"   ✅ {provider_name.upper()} available")
+            logger.info("   ✅ %s available", provider_name.upper())
         
         unavailable = [name for name in self.providers.keys() if name not in self.available_providers]
         for provider_name in unavailable:
-            logger.warning(f"   ⚠️ {provider_name.upper()} not available")
+            logger.warning("   ⚠️ %s not available", provider_name.upper())
+        
+        # Worker pool for hedged requests; threads are started on first use.
+        # Each in-flight request holds one of HEDGE_MAX_IN_FLIGHT slots, so a
+        # submitted request always has a free worker.
+        self._hedge_executor = ThreadPoolExecutor(
+            max_workers=HEDGE_MAX_IN_FLIGHT,
+            thread_name_prefix='hedge'
+        )
+        self._hedge_in_flight = 0
+        self._hedge_slots_lock = threading.Lock()
+        
+        # Separate pool for health probes so a hung probe can't starve hedging
+        self._health_executor = ThreadPoolExecutor(
+            max_workers=len(self.providers),
+            thread_name_prefix='health'
+        )
+        
+        # Wall time of the most recent request to each provider, in seconds
+        self.last_latency: Dict[str, float] = {}
+        
+        # Latency-aware routing: smoothed seconds-per-token per provider, plus
+        # an hour of raw (timestamp, seconds) samples for reporting. Streaming
+        # providers also report time-to-first-token, smoothed separately.
+        # Hedge and batch workers record concurrently, so writes and the
+        # window reads in get_latency_stats go through _latency_lock.
+        self.latency_ewma: Dict[str, float] = {}
+        self.ttft_ewma: Dict[str, float] = {}
+        self.latency_window: Dict[str, deque] = {
+            name: deque(maxlen=LATENCY_WINDOW_MAX_SAMPLES) for name in self.providers
+        }
+        self._latency_lock = threading.Lock()
+        self._priority_order: Tuple[str, ...] = tuple(self.lock_manager.PROVIDER_PRIORITY)
+        self.priority_weight: Dict[str, float] = {
+            name: 1 + 0.25 * rank
+            for rank, name in enumerate(self._priority_order)
+        }
+        
+        # name -> (time.monotonic() checked, is_available()); see _is_available
+        self._availability: Dict[str, Tuple[float, bool]] = {}
+        
+        # name -> display name, model info and capability bits; see _info
+        self._provider_info: Dict[str, _ProviderInfo] = {}
+        
+        # get_provider_status() result and the state it was built from; see there
+        self._status_cache: Optional[Tuple[tuple, Dict[str, Any]]] = None
+        self._latency_version = 0
+        
+        # model -> provider that serves it; see get_prediction
+        self.model_routes: Dict[str, str] = _load_model_routes(self.providers)
+        
+        # Rate-limited providers: name -> time.monotonic() when they are re-admitted
+        self.cooldowns: Dict[str, float] = {}
     
     def get_prediction(
         self,
@@ -68,7 +279,8 @@ class ExtendedAIProviderOrchestrator:
         region: str = "Global",
         model: str = None,
         temperature: float = 0.3,
-        max_tokens: int = 500
+        max_tokens: int = 500,
+        hedge: bool = False
     ) -> Tuple[bool, Optional[str], str]:
         """
         Get prediction from locked provider with automatic failover
@@ -79,64 +291,407 @@ class ExtendedAIProviderOrchestrator:
             model: Specific model to use (optional)
             temperature: Sampling temperature
             max_tokens: Maximum response tokens
+            hedge: Race the top providers instead of asking one (latency-critical calls)
             
         Returns:
             Tuple of (success: bool, response: Optional[str], provider_used: str)
         """
+        if hedge:
+            return self.get_prediction_hedged(prompt, region, model, temperature, max_tokens)
+        
         # Ensure a provider is locked
         locked_provider = self.lock_manager.get_locked_provider()
         
+        # A model only one provider serves goes straight there
+        routed_provider = self.model_routes.get(model) if model else None
+        if routed_provider and routed_provider != locked_provider and self._usable(routed_provider):
+            success, response, error = self._request_with_retry(
+                routed_provider, prompt, model, temperature, max_tokens
+            )
+            if success and response:
+                logger.info("✅ %s served %s for %s (routed)", routed_provider, model, region)
+                return True, response, routed_provider
+            
+            # The model is meaningless to the other providers; let them use their default
+            logger.warning("⚠️ Routed %s to %s failed: %s", model, routed_provider, error)
+            model = None
+        
         if not locked_provider:
-            # Lock default provider (OpenAI)
-            self.lock_manager.acquire_lock('openai')
-            locked_provider = 'openai'
-            logger.info(f"🔒 Locked provider: {locked_provider} (default)")
+            # Lock the provider that has been answering fastest
+            locked_provider = self._pick_provider()
+            self.lock_manager.acquire_lock(locked_provider)
+            logger.info("🔒 Locked provider: %s (fastest available)", locked_provider)
         
-        logger.info(f"📤 Using locked provider: {locked_provider}")
+        logger.info("📤 Using locked provider: %s", locked_provider)
         
-        try:
-            # Get locked provider instance
-            provider = self.providers[locked_provider]
+        if not self._is_available(locked_provider):
+            # Predictable condition, not an error path; no exception round-trip
+            logger.warning("⚠️ Locked provider %s is not available, failing over", locked_provider)
+            return self._trigger_failover(prompt, region, model, temperature, max_tokens)
+        
+        if self._cooling_down(locked_provider):
+            # Known to be throttled; don't spend a round-trip finding out again
+            logger.warning("🧊 %s is cooling down, failing over for %s", locked_provider, region)
+            return self._trigger_failover(prompt, region, model, temperature, max_tokens)
+        
+        # Send request; transient errors are retried before counting.
+        # _timed_request catches provider exceptions, so nothing here raises.
+        success, response, error = self._request_with_retry(
+            locked_provider, prompt, model, temperature, max_tokens
+        )
+        
+        if success and response:
+            # Reset failure count on success
+            self.lock_manager.reset_failure_count()
+            logger.info("✅ %s succeeded for %s", locked_provider, region)
+            return True, response, locked_provider
+        
+        # Increment failure count
+        failure_count = self.lock_manager.increment_failure_count(1)
+        logger.warning(
+            "⚠️ %s failed for %s (%s, failures: %d)",
+            locked_provider, region, _classify_error(error), failure_count
+        )
+        
+        # Fail over at the threshold, or straight away if it was throttled
+        if failure_count >= 3 or self._cooling_down(locked_provider):
+            return self._trigger_failover(prompt, region, model, temperature, max_tokens)
+        return False, None, locked_provider
+    
+    def get_predictions_batch(
+        self,
+        prompts: List[Tuple[str, str]],
+        model: str = None,
+        temperature: float = 0.3,
+        max_tokens: int = 500
+    ) -> Dict[str, Tuple[bool, Optional[str], str]]:
+        """
+        Run many (region, prompt) pairs through the locked provider at once
+        
+        Providers with a native send_batch (Cloudflare) get the whole batch;
+        others are fanned out over up to BATCH_MAX_WORKERS threads. Prompts
+        that still fail go through get_prediction one by one, so they get
+        the usual failover.
+        
+        Returns:
+            {region: (success, response, provider_used)}
+        """
+        if not prompts:
+            return {}
+        
+        provider_name = self.lock_manager.get_locked_provider()
+        if not provider_name:
+            provider_name = self._pick_provider()
+            self.lock_manager.acquire_lock(provider_name)
+            logger.info("🔒 Locked provider: %s (fastest available)", provider_name)
+        
+        if self._usable(provider_name):
+            texts = [prompt for _, prompt in prompts]
+            provider = self.providers[provider_name]
+            logger.info("📦 Batching %d prompts through %s", len(texts), provider_name)
             
-            if not provider.is_available():
-                raise Exception(f"Locked provider {locked_provider} is not available")
+            if self._info(provider_name).has_send_batch:
+                raw = provider.send_batch(
+                    texts, model=model, temperature=temperature, max_tokens=max_tokens
+                )
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(len(texts), BATCH_MAX_WORKERS),
+                    thread_name_prefix='batch'
+                ) as executor:
+                    raw = list(executor.map(
+                        lambda prompt: self._request_with_retry(
+                            provider_name, prompt, model, temperature, max_tokens
+                        ),
+                        texts
+                    ))
+        else:
+            raw = [(False, None, f"{provider_name} not usable")] * len(prompts)
+        
+        results = {}
+        retry = []
+        for (region, prompt), (success, response, error) in zip(prompts, raw):
+            if success and response:
+                results[region] = (True, response, provider_name)
+            else:
+                retry.append((region, prompt))
+        
+        if results:
+            self.lock_manager.reset_failure_count()
+        if retry:
+            logger.warning("⚠️ %d/%d batched prompts failed, retrying singly", len(retry), len(prompts))
+        for region, prompt in retry:
+            results[region] = self.get_prediction(prompt, region, model, temperature, max_tokens)
+        
+        return results
+    
+    def get_prediction_hedged(
+        self,
+        prompt: str,
+        region: str = "Global",
+        model: str = None,
+        temperature: float = 0.3,
+        max_tokens: int = 500,
+        k: int = 2
+    ) -> Tuple[bool, Optional[str], str]:
+        """
+        Send the prompt to the top k providers at once; first success wins
+        
+        Candidates are the locked provider followed by the next available
+        providers in priority order. Requests still in flight when a winner
+        returns are left to finish and their results are discarded. When the
+        hedge pool is saturated the call goes through get_prediction instead.
+        
+        Returns:
+            Tuple of (success: bool, response: Optional[str], provider_used: str)
+        """
+        candidates = self._hedge_candidates(k)
+        if not candidates:
+            logger.error("❌ No providers available for hedged request")
+            return False, None, "NONE"
+        
+        if not self._reserve_hedge_slots(len(candidates)):
+            logger.warning("⚠️ Hedge pool saturated, sending %s single-shot", region)
+            return self.get_prediction(prompt, region, model, temperature, max_tokens)
+        
+        logger.info("🏁 Hedging %s across %s", region, candidates)
+        
+        futures = {}
+        for name in candidates:
+            future = self._hedge_executor.submit(
+                self._timed_request, name, prompt, model, temperature, max_tokens
+            )
+            future.add_done_callback(self._release_hedge_slot)
+            futures[future] = name
+        pending = set(futures)
+        last_provider = candidates[0]
+        
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                provider_name = futures[future]
+                success, response, error = future.result()
+                if success and response:
+                    for straggler in pending:
+                        straggler.cancel()
+                    if provider_name == self.lock_manager.get_locked_provider():
+                        self.lock_manager.reset_failure_count()
+                    logger.info(
+                        "✅ %s won hedge for %s in %.0fms",
+                        provider_name, region, self.last_latency[provider_name] * 1000
+                    )
+                    return True, response, provider_name
+                
+                logger.warning("⚠️ %s failed in hedge for %s: %s", provider_name, region, error)
+                last_provider = provider_name
+        
+        return False, None, last_provider
+    
+    def _reserve_hedge_slots(self, count: int) -> bool:
+        """Claim count hedge workers at once, or none if that would exceed the pool"""
+        with self._hedge_slots_lock:
+            if self._hedge_in_flight + count > HEDGE_MAX_IN_FLIGHT:
+                return False
+            self._hedge_in_flight += count
+            return True
+    
+    def _release_hedge_slot(self, future) -> None:
+        """Done-callback: a hedged request finished (or was cancelled)"""
+        with self._hedge_slots_lock:
+            self._hedge_in_flight -= 1
+    
+    def _pick_provider(self) -> str:
+        """
+        Available provider with the lowest weighted expected latency
+        
+        Expected latency is TTFT plus ROUTING_EXPECTED_TOKENS at the smoothed
+        seconds-per-token. Unmeasured providers score 0 so they get tried;
+        ties go to the higher-priority provider, so with no measurements this
+        is simply the first available provider in priority order.
+        """
+        available = [name for name in self._priority_order if self._usable(name)]
+        if not available:
+            return self._priority_order[0]
+        
+        return min(
+            available,
+            key=lambda name: (
+                ROUTING_EXPECTED_TOKENS * self.latency_ewma.get(name, 0.0)
+                + self.ttft_ewma.get(name, 0.0)
+            ) * self.priority_weight.get(name, 1.0)
+        )
+    
+    def _record_latency(
+        self,
+        provider_name: str,
+        seconds: float,
+        response: Optional[str],
+        ttft: Optional[float] = None
+    ) -> None:
+        """Fold a successful request's latency into the provider's EWMAs and window"""
+        # ~4 characters per token; normalizing by output size keeps long
+        # answers from making a provider look slow. With a measured TTFT only
+        # the generation time after the first token is spread over tokens.
+        generation = seconds - ttft if ttft is not None else seconds
+        per_token = generation / max(len(response or '') // 4, 1)
+        now = time.monotonic()
+        
+        with self._latency_lock:
+            previous = self.latency_ewma.get(provider_name)
+            self.latency_ewma[provider_name] = (
+                per_token if previous is None
+                else LATENCY_ALPHA * per_token + (1 - LATENCY_ALPHA) * previous
+            )
+            if ttft is not None:
+                previous = self.ttft_ewma.get(provider_name)
+                self.ttft_ewma[provider_name] = (
+                    ttft if previous is None
+                    else LATENCY_ALPHA * ttft + (1 - LATENCY_ALPHA) * previous
+                )
+            
+            self._latency_version += 1
             
-            # Send request
-            success, response, error = provider.send_request(
+            window = self.latency_window.get(provider_name)
+            if window is None:
+                window = self.latency_window[provider_name] = deque(maxlen=LATENCY_WINDOW_MAX_SAMPLES)
+            window.append((now, seconds))
+            while window[0][0] < now - LATENCY_WINDOW_SECONDS:
+                window.popleft()
+    
+    def get_latency_stats(self) -> Dict[str, Any]:
+        """Per-provider latency EWMA and last-hour sample summary"""
+        with self._latency_lock:
+            windows = {
+                provider_name: [seconds for _, seconds in window]
+                for provider_name, window in self.latency_window.items()
+            }
+        
+        stats = {}
+        for provider_name, samples in windows.items():
+            stats[provider_name] = {
+                'ewma_seconds_per_token': self.latency_ewma.get(provider_name),
+                'ewma_ttft_seconds': self.ttft_ewma.get(provider_name),
+                'samples_last_hour': len(samples),
+                'mean_seconds_last_hour': sum(samples) / len(samples) if samples else None
+            }
+        return stats
+    
+    def _hedge_candidates(self, k: int) -> List[str]:
+        """Locked provider first, then the rest by priority; available ones only"""
+        priority = self._priority_order
+        locked = self.lock_manager.get_locked_provider() or priority[0]
+        order = (locked,) + tuple(name for name in priority if name != locked)
+        
+        return [name for name in order if self._usable(name)][:max(k, 1)]
+    
+    def _cooling_down(self, provider_name: str) -> bool:
+        """True while a rate-limited provider is still inside its cooldown window"""
+        return self.cooldowns.get(provider_name, 0.0) > time.monotonic()
+    
+    def _is_available(self, provider_name: str) -> bool:
+        """provider.is_available(), re-checked at most every AVAILABILITY_TTL seconds"""
+        now = time.monotonic()
+        cached = self._availability.get(provider_name)
+        if cached is not None and now - cached[0] < AVAILABILITY_TTL:
+            return cached[1]
+        
+        provider = self.providers.get(provider_name)
+        available = provider is not None and provider.is_available()
+        self._availability[provider_name] = (now, available)
+        return available
+    
+    def invalidate_availability(self) -> None:
+        """Forget cached is_available() results so the next check re-probes"""
+        self._availability.clear()
+    
+    def _usable(self, provider_name: str) -> bool:
+        """Configured, available and not cooling down"""
+        return self._is_available(provider_name) and not self._cooling_down(provider_name)
+    
+    def _start_cooldown(self, provider_name: str, error: Optional[str]) -> None:
+        """Skip a rate-limited provider for its Retry-After, or RATE_LIMIT_COOLDOWN"""
+        seconds = _retry_after(error, RATE_LIMIT_COOLDOWN)
+        self.cooldowns[provider_name] = time.monotonic() + seconds
+        logger.warning("🧊 %s rate-limited, cooling down for %.0fs", provider_name, seconds)
+    
+    def _next_usable_provider(self, current: Optional[str]) -> Optional[str]:
+        """First usable provider after current in priority order, wrapping around"""
+        priority = self._priority_order
+        start = priority.index(current) + 1 if current in priority else 0
+        for name in priority[start:] + priority[:start]:
+            if name != current and self._usable(name):
+                return name
+        return None
+    
+    def _timed_request(
+        self,
+        provider_name: str,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Call one provider, recording its wall time (and TTFT if it streams); never raises"""
+        provider = self.providers[provider_name]
+        streaming = self._info(provider_name).streams
+        extra = {'stream': True} if streaming else {}
+        
+        start = time.perf_counter()
+        try:
+            result = provider.send_request(
                 prompt=prompt,
                 model=model,
                 temperature=temperature,
-                max_tokens=max_tokens
+                max_tokens=max_tokens,
+                **extra
             )
-            
-            if success and response:
-                # Reset failure count on success
-                self.lock_manager.reset_failure_count()
-                logger.info(f"✅ {locked_provider} succeeded for {region}")
-                return True, response, locked_provider
-            else:
-                # Increment failure count
-                failure_count = self.lock_manager.increment_failure_count(1)
-                logger.warning(
-                    f"⚠️ {locked_provider} failed for {region} "
-                    f"(failures: {failure_count})"
-                )
-                
-                # Check if failover threshold reached
-                if failure_count >= 3:
-                    return self._trigger_failover(prompt, region, model, temperature, max_tokens)
-                else:
-                    return False, None, locked_provider
-        
         except Exception as e:
-            logger.error(f"❌ {locked_provider} error: {str(e)}")
+            result = (False, None, str(e))
+        
+        elapsed = time.perf_counter() - start
+        self.last_latency[provider_name] = elapsed
+        if result[0] and result[1]:
+            ttft = provider.last_ttft if streaming else None
+            self._record_latency(provider_name, elapsed, result[1], ttft)
+            self.cooldowns.pop(provider_name, None)
+        elif _classify_error(result[2]) == 'rate_limit':
+            self._start_cooldown(provider_name, result[2])
+        return result
+    
+    def _request_with_retry(
+        self,
+        provider_name: str,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Call a provider, retrying transient errors with backoff
+        
+        Rate-limited providers are put on cooldown rather than retried, and
+        permanent errors (auth, bad request, ...) return immediately, so both
+        reach failover without delay.
+        """
+        for attempt in range(RETRY_ATTEMPTS):
+            success, response, error = self._timed_request(
+                provider_name, prompt, model, temperature, max_tokens
+            )
+            if success and response:
+                return success, response, error
             
-            # Trigger failover
-            failure_count = self.lock_manager.increment_failure_count(1)
-            if failure_count >= 3:
-                return self._trigger_failover(prompt, region, model, temperature, max_tokens)
-            else:
-                return False, None, locked_provider
+            kind = _classify_error(error)
+            if kind != 'transient' or attempt == RETRY_ATTEMPTS - 1:
+                return success, response, error
+            
+            delay = _backoff_delay(attempt, error)
+            logger.warning(
+                "⏳ %s %s error, retry %d/%d in %.2fs: %s",
+                provider_name, kind, attempt + 1, RETRY_ATTEMPTS - 1, delay, error
+            )
+            time.sleep(delay)
+        
+        return False, None, None
     
     def _trigger_failover(
         self,
@@ -153,81 +708,126 @@ class ExtendedAIProviderOrchestrator:
             Tuple of (success: bool, response: Optional[str], provider_used: str)
         """
         current_provider = self.lock_manager.get_locked_provider()
-        logger.warning(f"🔄 Failover triggered from {current_provider}")
+        logger.warning("🔄 Failover triggered from %s", current_provider)
+        
+        # A failing provider may have lost its client; re-probe everyone
+        self.invalidate_availability()
+        
+        # Next provider that is configured and not cooling down
+        next_provider = self._next_usable_provider(current_provider)
         
         # Release current lock
         self.lock_manager.release_lock("failover")
         
-        # Get next provider
-        next_provider = self.lock_manager.get_next_provider()
-        
         if not next_provider:
             logger.error("❌ No providers available for failover!")
             return False, None, "NONE"
         
         # Lock next provider
         self.lock_manager.acquire_lock(next_provider)
-        logger.info(f"✅ Switched to {next_provider}")
+        logger.info("✅ Switched to %s", next_provider)
         
-        # Retry with new provider
-        try:
-            provider = self.providers[next_provider]
-            
-            success, response, error = provider.send_request(
-                prompt=prompt,
-                model=model,
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
-            
-            if success and response:
-                self.lock_manager.reset_failure_count()
-                logger.info(f"✅ Failover to {next_provider} succeeded for {region}")
-                return True, response, next_provider
-            else:
-                logger.error(f"❌ Failover provider {next_provider} failed: {error}")
-                return False, None, next_provider
+        # Retry with new provider (_timed_request never raises)
+        success, response, error = self._timed_request(
+            next_provider, prompt, model, temperature, max_tokens
+        )
         
-        except Exception as e:
-            logger.error(f"❌ Failover provider {next_provider} error: {str(e)}")
-            return False, None, next_provider
+        if success and response:
+            self.lock_manager.reset_failure_count()
+            logger.info("✅ Failover to %s succeeded for %s", next_provider, region)
+            return True, response, next_provider
+        
+        logger.error("❌ Failover provider %s failed: %s", next_provider, error)
+        return False, None, next_provider
     
     def get_provider_status(self) -> Dict[str, Any]:
-        """Get comprehensive provider status"""
+        """
+        Get comprehensive provider status
+        
+        The report only changes when the lock state, a latency sample or a
+        provider's availability does, so it is rebuilt only then; polls in
+        between get a shallow copy of the last one.
+        """
+        key = (
+            self.lock_manager.state_version,
+            self._latency_version,
+            tuple(self._is_available(name) for name in self.providers)
+        )
+        cached = self._status_cache
+        if cached is None or cached[0] != key:
+            cached = self._status_cache = (key, self._build_provider_status())
+        return dict(cached[1])
+    
+    def _build_provider_status(self) -> Dict[str, Any]:
+        """Assemble the get_provider_status() report from scratch"""
         status = {
             'providers': {},
             'locked_provider': self.lock_manager.get_locked_provider(),
-            'lock_status': self.lock_manager.get_status()
+            'lock_status': self.lock_manager.get_status(),
+            'latency': self.get_latency_stats()
         }
         
-        for provider_name, provider in self.providers.items():
+        for provider_name in self.providers:
+            info = self._info(provider_name)
             status['providers'][provider_name] = {
-                'available': provider.is_available(),
-                'name': provider.get_provider_name(),
-                'model_info': provider.get_model_info() if hasattr(provider, 'get_model_info') else None
+                'available': self._is_available(provider_name),
+                'name': info.name,
+                'model_info': dict(info.model_info) if info.model_info is not None else None
             }
         
         return status
     
+    def _info(self, provider_name: str) -> _ProviderInfo:
+        """Provider name, model info and capabilities, introspected once per provider"""
+        info = self._provider_info.get(provider_name)
+        if info is None:
+            info = self._provider_info[provider_name] = _ProviderInfo.of(self.providers[provider_name])
+        return info
+    
     def health_check_all(self) -> Dict[str, Any]:
-        """Check health of all providers"""
+        """
+        Check health of all providers
+        
+        Probes run concurrently, so this takes as long as the slowest probe,
+        bounded by HEALTH_CHECK_TIMEOUT.
+        """
         health_status = {}
+        probes = {}
         
         for provider_name, provider in self.providers.items():
-            if not provider.is_available():
+            if not self._is_available(provider_name):
                 health_status[provider_name] = {
                     'healthy': False,
                     'reason': 'Not configured'
                 }
-            elif hasattr(provider, 'health_check'):
-                health_status[provider_name] = provider.health_check()
+            elif self._info(provider_name).has_health_check:
+                probes[provider_name] = self._health_executor.submit(provider.health_check)
             else:
                 health_status[provider_name] = {
-                    'healthy': provider.is_available(),
+                    'healthy': True,
                     'status': 'available'
                 }
         
-        return health_status
+        if probes:
+            wait(probes.values(), timeout=HEALTH_CHECK_TIMEOUT)
+        
+        for provider_name, future in probes.items():
+            if not future.done():
+                future.cancel()
+                health_status[provider_name] = {
+                    'healthy': False,
+                    'reason': f'Health check timed out after {HEALTH_CHECK_TIMEOUT:.0f}s'
+                }
+            elif future.exception() is not None:
+                health_status[provider_name] = {
+                    'healthy': False,
+                    'reason': str(future.exception())
+                }
+            else:
+                health_status[provider_name] = future.result()
+        
+        # Report providers in their configured order
+        return {name: health_status[name] for name in self.providers}
 
 
 # Singleton instance
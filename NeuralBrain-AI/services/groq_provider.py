@@ -10,20 +10,38 @@ Features:
 
 import logging
 import os
+import threading
+import time
 from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-# Try to import Groq at module level for testing
-try:
-    from groq import Groq
-except ImportError:
-    Groq = None
+# health_check() makes a billable completion call; reuse its result this long
+HEALTH_CHECK_TTL = 30.0  # seconds
+
+# The groq SDK (and the httpx/pydantic stack under it) is imported on first
+# configured use, not at module load; False records a failed import
+_GROQ_CLS = None
+
+
+def _groq_class():
+    """groq.Groq, imported once; None if the library is not installed"""
+    global _GROQ_CLS
+    if _GROQ_CLS is None:
+        try:
+            from groq import Groq
+            _GROQ_CLS = Groq
+        except ImportError:
+            _GROQ_CLS = False
+    return _GROQ_CLS or None
 
 
 class GroqProvider:
     """Groq API Provider - Ultra-fast LLM inference"""
     
+    # send_request(stream=True) reports time-to-first-token via last_ttft
+    supports_streaming = True
+    
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv('GROQ_API_KEY', '').strip()
         self.provider_name = "Groq"
@@ -31,12 +49,19 @@ class GroqProvider:
         self.model = "llama-3.1-8b-instant"  # Default model (fastest)
         self.client = None
         
-        if self.available and Groq is not None:
+        # (time.monotonic() probed, result) of the last health check
+        self._last_health: Optional[Tuple[float, dict]] = None
+        
+        # Per-thread timing of the last streamed request (hedges run concurrently)
+        self._timing = threading.local()
+        
+        groq_cls = _groq_class() if self.available else None
+        if groq_cls is not None:
             try:
-                self.client = Groq(api_key=self.api_key)
+                self.client = groq_cls(api_key=self.api_key)
                 logger.info("✅ Groq provider initialized")
             except Exception as e:
-                logger.warning(f"⚠️ Groq initialization failed: {e}")
+                logger.warning("⚠️ Groq initialization failed: %s", e)
                 self.available = False
                 self.client = None
         else:
@@ -50,12 +75,18 @@ class GroqProvider:
     def get_provider_name(self) -> str:
         return self.provider_name
     
+    @property
+    def last_ttft(self) -> Optional[float]:
+        """Seconds to the first token of this thread's last streamed request"""
+        return getattr(self._timing, 'ttft', None)
+    
     def send_request(
         self,
         prompt: str,
         model: str = None,
         temperature: float = 0.3,
-        max_tokens: int = 500
+        max_tokens: int = 500,
+        stream: bool = False
     ) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         Send request to Groq API
@@ -65,10 +96,12 @@ class GroqProvider:
             model: Model to use (defaults to llama-3.3-70b)
             temperature: Temperature for sampling
             max_tokens: Maximum tokens in response
+            stream: Stream the completion and record time-to-first-token
             
         Returns:
             Tuple of (success: bool, response_text: Optional[str], error: Optional[str])
         """
+        self._timing.ttft = None
         if not self.is_available():
             return False, None, "Groq provider not available"
         
@@ -76,6 +109,9 @@ class GroqProvider:
             # Use provided model or default
             model_to_use = model or self.model
             
+            if stream:
+                return self._send_streaming(prompt, model_to_use, temperature, max_tokens)
+            
             response = self.client.chat.completions.create(
                 model=model_to_use,
                 messages=[{"role": "user", "content": prompt}],
@@ -88,19 +124,56 @@ class GroqProvider:
             # Log performance metrics
             if hasattr(response, 'usage'):
                 logger.info(
-                    f"✅ Groq request successful | Model: {model_to_use} | "
-                    f"Tokens: {response.usage.total_tokens}"
+                    "✅ Groq request successful | Model: %s | Tokens: %s",
+                    model_to_use, response.usage.total_tokens
                 )
             else:
-                logger.info(f"✅ Groq request successful | Model: {model_to_use}")
+                logger.info("✅ Groq request successful | Model: %s", model_to_use)
             
             return True, response_text, None
             
         except Exception as e:
             error_msg = str(e)
-            logger.error(f"❌ Groq request failed: {error_msg}")
+            logger.error("❌ Groq request failed: %s", error_msg)
             return False, None, error_msg
     
+    def _send_streaming(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int
+    ) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Stream a completion, timing the first content chunk into last_ttft"""
+        start = time.perf_counter()
+        chunks = self.client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True
+        )
+        
+        parts = []
+        for chunk in chunks:
+            if not chunk.choices:
+                continue
+            content = chunk.choices[0].delta.content
+            if content:
+                if not parts:
+                    self._timing.ttft = time.perf_counter() - start
+                parts.append(content)
+        
+        response_text = ''.join(parts).strip()
+        if not response_text:
+            return False, None, "Empty streamed response"
+        
+        logger.info(
+            "✅ Groq request successful | Model: %s | TTFT: %.0fms",
+            model, self._timing.ttft * 1000
+        )
+        return True, response_text, None
+    
     def get_model_info(self) -> dict:
         """Get Groq model capabilities"""
         return {
@@ -112,8 +185,24 @@ class GroqProvider:
             'use_case': 'Numerical forecasting, real-time inference'
         }
     
-    def health_check(self) -> dict:
-        """Perform health check on Groq provider"""
+    def health_check(self, force: bool = False) -> dict:
+        """
+        Perform health check on Groq provider
+        
+        The result is reused for HEALTH_CHECK_TTL seconds so polling status
+        endpoints don't each pay for a completion; force=True probes anyway.
+        """
+        now = time.monotonic()
+        cached = self._last_health
+        if not force and cached is not None and now - cached[0] < HEALTH_CHECK_TTL:
+            return dict(cached[1])
+        
+        result = self._probe_health()
+        self._last_health = (now, result)
+        return dict(result)
+    
+    def _probe_health(self) -> dict:
+        """Send a minimal completion and report whether it succeeded"""
         try:
             if not self.is_available():
                 return {'healthy': False, 'reason': 'Provider not available'}
@@ -144,6 +233,13 @@ class GroqProvider:
             }
 
 
+# Singleton instance
+_groq_provider_instance = None
+
+
 def get_groq_provider() -> GroqProvider:
-    """Factory function to get Groq provider instance"""
-    return GroqProvider()
+    """Get singleton Groq provider instance (one client, one connection pool)"""
+    global _groq_provider_instance
+    if _groq_provider_instance is None:
+        _groq_provider_instance = GroqProvider()
+    return _groq_provider_instance
@@ -15,11 +15,12 @@ Architecture:
 - HealthHistory: Historical health data storage
 """
 
+import itertools
 import threading
 import time
 import logging
 from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
 from collections import defaultdict, deque
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -27,6 +28,9 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on how long /health reads may reuse a computed report
+HEALTH_CACHE_TTL = 5
+
 
 class ProviderHealthStatus(Enum):
     """Provider health status enumeration"""
@@ -36,18 +40,30 @@ class ProviderHealthStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthMetric:
     """Single health check metric"""
     provider: str
-    timestamp: str
+    ts: float  # time.time() of the check; windows compare this, not ISO strings
     status: str
     latency_ms: Optional[float]
     error_message: Optional[str]
     response_time_ms: Optional[float]
     
+    @property
+    def timestamp(self) -> str:
+        """UTC ISO-8601 timestamp, formatted on demand"""
+        return datetime.utcfromtimestamp(self.ts).isoformat()
+    
     def to_dict(self):
-        return asdict(self)
+        return {
+            "provider": self.provider,
+            "timestamp": self.timestamp,
+            "status": self.status,
+            "latency_ms": self.latency_ms,
+            "error_message": self.error_message,
+            "response_time_ms": self.response_time_ms
+        }
 
 
 @dataclass
@@ -66,13 +82,76 @@ class ProviderHealth:
     consecutive_failures: int
 
 
+@dataclass(slots=True)
+class _RollingWindow:
+    """Running totals over a provider's metrics inside the stats window"""
+    entries: deque
+    success_count: int = 0
+    latency_sum: float = 0.0
+    latency_count: int = 0
+    
+    def push(self, metric: HealthMetric, maxlen: int) -> None:
+        """Add a metric, evicting the oldest when the history cap is hit"""
+        if len(self.entries) >= maxlen:
+            self._pop_oldest()
+        self.entries.append(metric)
+        if metric.status == "success":
+            self.success_count += 1
+        if metric.latency_ms:
+            self.latency_sum += metric.latency_ms
+            self.latency_count += 1
+    
+    def expire(self, cutoff: float) -> None:
+        """Drop metrics at or before cutoff from the front of the window"""
+        while self.entries and self.entries[0].ts <= cutoff:
+            self._pop_oldest()
+    
+    def _pop_oldest(self) -> None:
+        metric = self.entries.popleft()
+        if metric.status == "success":
+            self.success_count -= 1
+        if metric.latency_ms:
+            self.latency_sum -= metric.latency_ms
+            self.latency_count -= 1
+
+
 class HealthMetricsCollector:
     """Collects and aggregates health metrics"""
     
-    def __init__(self, history_size: int = 1000):
-        self.metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=history_size))
-        self.lock = threading.Lock()
+    def __init__(self, history_size: int = 1000, stats_window_seconds: int = 300):
+        # One deque and one lock per provider, so providers never contend;
+        # _map_lock is only taken to register a provider the first time
+        self.metrics: Dict[str, deque] = {}
+        self.locks: Dict[str, threading.Lock] = {}
+        self._map_lock = threading.Lock()
         self.history_size = history_size
+        # Running totals for the default stats window, kept per provider
+        self.stats_window = stats_window_seconds
+        self._windows: Dict[str, _RollingWindow] = {}
+        # Changes whenever metrics change, so readers can tell a cache is stale
+        self._versions = itertools.count(1)
+        self.version = 0
+    
+    def _series(self, provider: str) -> Tuple[deque, threading.Lock]:
+        """Provider's metric deque and lock, created on first use"""
+        lock = self.locks.get(provider)
+        if lock is None:
+            with self._map_lock:
+                lock = self.locks.get(provider)
+                if lock is None:
+                    # Publish the deque before the lock that guards it
+                    self.metrics[provider] = deque(maxlen=self.history_size)
+                    self._windows[provider] = _RollingWindow(deque())
+                    lock = self.locks[provider] = threading.Lock()
+        return self.metrics[provider], lock
+    
+    def _snapshot(self, provider: str) -> List[HealthMetric]:
+        """Copy of a provider's metrics, oldest first; [] if never recorded"""
+        lock = self.locks.get(provider)
+        if lock is None:
+            return []
+        with lock:
+            return list(self.metrics[provider])
     
     def record_health_check(
         self,
@@ -85,92 +164,113 @@ class HealthMetricsCollector:
         """Record a health check result"""
         metric = HealthMetric(
             provider=provider,
-            timestamp=datetime.utcnow().isoformat(),
+            ts=time.time(),
             status="success" if status else "failure",
             latency_ms=latency_ms,
             error_message=error_message,
             response_time_ms=response_time_ms
         )
         
-        with self.lock:
-            self.metrics[provider].append(metric)
+        series, lock = self._series(provider)
+        with lock:
+            series.append(metric)
+            self._windows[provider].push(metric, self.history_size)
+        self.version = next(self._versions)
         
         logger.info(
-            f"📊 Health check recorded | Provider: {provider} | "
-            f"Status: {'✅' if status else '❌'} | "
-            f"Latency: {latency_ms}ms" if latency_ms else ""
+            "📊 Health check recorded | Provider: %s | Status: %s | Latency: %sms",
+            provider, '✅' if status else '❌', latency_ms
         )
     
     def get_provider_stats(self, provider: str, window_seconds: int = 300) -> Dict:
         """Get provider statistics for time window"""
-        with self.lock:
-            if provider not in self.metrics or not self.metrics[provider]:
-                return {
-                    "provider": provider,
-                    "check_count": 0,
-                    "success_count": 0,
-                    "failure_count": 0,
-                    "error_rate": 0.0,
-                    "avg_latency_ms": 0.0
-                }
-            
-            # Get metrics within time window
-            cutoff_time = datetime.utcnow() - timedelta(seconds=window_seconds)
-            recent_metrics = [
-                m for m in self.metrics[provider]
-                if datetime.fromisoformat(m.timestamp) > cutoff_time
-            ]
-            
-            if not recent_metrics:
-                return {
-                    "provider": provider,
-                    "check_count": 0,
-                    "success_count": 0,
-                    "failure_count": 0,
-                    "error_rate": 0.0,
-                    "avg_latency_ms": 0.0
-                }
-            
-            success_count = sum(1 for m in recent_metrics if m.status == "success")
-            failure_count = len(recent_metrics) - success_count
-            
-            latencies = [m.latency_ms for m in recent_metrics if m.latency_ms]
-            avg_latency = sum(latencies) / len(latencies) if latencies else 0.0
-            
-            error_rate = (failure_count / len(recent_metrics) * 100) if recent_metrics else 0.0
-            
-            return {
-                "provider": provider,
-                "check_count": len(recent_metrics),
-                "success_count": success_count,
-                "failure_count": failure_count,
-                "error_rate": round(error_rate, 2),
-                "avg_latency_ms": round(avg_latency, 2)
-            }
+        cutoff = time.time() - window_seconds
+        
+        if window_seconds == self.stats_window:
+            # Default window: read the running totals, O(1) amortized
+            lock = self.locks.get(provider)
+            if lock is None:
+                return self._stats(provider, 0, 0, 0.0, 0)
+            with lock:
+                window = self._windows[provider]
+                window.expire(cutoff)
+                return self._stats(
+                    provider, len(window.entries), window.success_count,
+                    window.latency_sum, window.latency_count
+                )
+        
+        # Any other window is computed on a copy, outside the provider's lock
+        recent_metrics = [m for m in self._snapshot(provider) if m.ts > cutoff]
+        latencies = [m.latency_ms for m in recent_metrics if m.latency_ms]
+        return self._stats(
+            provider, len(recent_metrics),
+            sum(1 for m in recent_metrics if m.status == "success"),
+            sum(latencies), len(latencies)
+        )
+    
+    @staticmethod
+    def _stats(
+        provider: str,
+        check_count: int,
+        success_count: int,
+        latency_sum: float,
+        latency_count: int
+    ) -> Dict:
+        """Format aggregated counts as a stats dict"""
+        failure_count = check_count - success_count
+        avg_latency = latency_sum / latency_count if latency_count else 0.0
+        error_rate = (failure_count / check_count * 100) if check_count else 0.0
+        
+        return {
+            "provider": provider,
+            "check_count": check_count,
+            "success_count": success_count,
+            "failure_count": failure_count,
+            "error_rate": round(error_rate, 2),
+            "avg_latency_ms": round(avg_latency, 2)
+        }
     
     def get_history(self, provider: str, limit: int = 100) -> List[Dict]:
         """Get metric history for provider"""
-        with self.lock:
-            if provider not in self.metrics:
-                return []
-            
-            metrics_list = list(self.metrics[provider])[-limit:]
-            return [m.to_dict() for m in metrics_list]
+        lock = self.locks.get(provider)
+        if lock is None:
+            return []
+        with lock:
+            # Index just the tail rather than copying the whole deque;
+            # deque indexing near either end is O(1)
+            series = self.metrics[provider]
+            n = len(series)
+            metrics_list = [series[i] for i in range(max(0, n - limit), n)]
+        return [m.to_dict() for m in metrics_list]
+    
+    def get_last_error(self, provider: str) -> Optional[str]:
+        """Error message of the provider's most recent check, if it failed"""
+        lock = self.locks.get(provider)
+        if lock is None:
+            return None
+        with lock:
+            series = self.metrics[provider]
+            return series[-1].error_message if series else None
     
     def clear_old_metrics(self, older_than_seconds: int = 3600) -> None:
         """Clear metrics older than specified seconds"""
-        with self.lock:
-            cutoff_time = datetime.utcnow() - timedelta(seconds=older_than_seconds)
-            
-            for provider in self.metrics:
-                # Keep only recent metrics
-                recent = [
-                    m for m in self.metrics[provider]
-                    if datetime.fromisoformat(m.timestamp) > cutoff_time
-                ]
-                self.metrics[provider] = deque(recent, maxlen=self.history_size)
+        cutoff = time.time() - older_than_seconds
+        with self._map_lock:
+            series = [
+                (self.metrics[provider], self._windows[provider], lock)
+                for provider, lock in self.locks.items()
+            ]
+        
+        for metrics, window, lock in series:
+            with lock:
+                # Keep only recent metrics, in place so the deque stays shared
+                recent = [m for m in metrics if m.ts > cutoff]
+                metrics.clear()
+                metrics.extend(recent)
+                window.expire(cutoff)
+        self.version = next(self._versions)
         
-        logger.info(f"🧹 Cleaned up metrics older than {older_than_seconds}s")
+        logger.info("🧹 Cleaned up metrics older than %ss", older_than_seconds)
 
 
 class BackgroundHealthMonitor:
@@ -200,14 +300,20 @@ class BackgroundHealthMonitor:
         self.metrics_collector = HealthMetricsCollector()
         self.is_running = False
         self.monitor_thread: Optional[threading.Thread] = None
+        # Set by stop() to wake the loop out of its between-cycle wait
+        self._stop_event = threading.Event()
         self.provider_consecutive_failures: Dict[str, int] = defaultdict(int)
         self.lock = threading.Lock()
         
+        # (expires_at, collector version, value); see _cached
+        self.cache_ttl = min(check_interval_seconds, HEALTH_CACHE_TTL)
+        self._health_cache: Optional[Tuple[float, int, List[ProviderHealth]]] = None
+        self._summary_cache: Optional[Tuple[float, int, Dict]] = None
+        
         logger.info(
-            f"🏥 Health Monitor initialized | "
-            f"Interval: {check_interval_seconds}s | "
-            f"Failure threshold: {failure_threshold} | "
-            f"Degradation threshold: {degradation_threshold}%"
+            "🏥 Health Monitor initialized | Interval: %ss | "
+            "Failure threshold: %s | Degradation threshold: %s%%",
+            check_interval_seconds, failure_threshold, degradation_threshold
         )
     
     def start(self) -> None:
@@ -217,6 +323,8 @@ class BackgroundHealthMonitor:
             return
         
         self.is_running = True
+        self._stop_event.clear()
+        self.invalidate_cache()
         self.monitor_thread = threading.Thread(
             target=self._monitor_loop,
             daemon=True,
@@ -228,6 +336,8 @@ class BackgroundHealthMonitor:
     def stop(self) -> None:
         """Stop background health monitoring"""
         self.is_running = False
+        self._stop_event.set()
+        self.invalidate_cache()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
         logger.info("🛑 Health monitor stopped")
@@ -241,10 +351,12 @@ class BackgroundHealthMonitor:
                 self._check_all_providers()
                 self._detect_degradation()
                 self._trigger_failover_if_needed()
-                time.sleep(self.check_interval)
             except Exception as e:
-                logger.error(f"❌ Health monitor error: {e}", exc_info=True)
-                time.sleep(self.check_interval)
+                logger.error("❌ Health monitor error: %s", e, exc_info=True)
+            
+            # Returns early, and ends the loop, as soon as stop() is called
+            if self._stop_event.wait(self.check_interval):
+                break
     
     def _check_all_providers(self) -> None:
         """Check health of all providers"""
@@ -269,9 +381,9 @@ class BackgroundHealthMonitor:
                     continue
                 
                 # Perform health check
-                start_time = time.time()
+                start_time = time.perf_counter()
                 health = provider.health_check()
-                latency_ms = (time.time() - start_time) * 1000
+                latency_ms = (time.perf_counter() - start_time) * 1000
                 
                 success = health.get("status") == "healthy"
                 error_msg = health.get("error") if not success else None
@@ -291,15 +403,14 @@ class BackgroundHealthMonitor:
                     else:
                         self.provider_consecutive_failures[provider_name] += 1
                 
-                status_emoji = "✅" if success else "❌"
                 logger.info(
-                    f"{status_emoji} {provider_name}: "
-                    f"{'Healthy' if success else 'Unhealthy'} | "
-                    f"Latency: {latency_ms:.0f}ms"
+                    "%s %s: %s | Latency: %.0fms",
+                    "✅" if success else "❌", provider_name,
+                    "Healthy" if success else "Unhealthy", latency_ms
                 )
                 
             except Exception as e:
-                logger.error(f"❌ Error checking {provider_name}: {e}")
+                logger.error("❌ Error checking %s: %s", provider_name, e)
                 self.metrics_collector.record_health_check(
                     provider_name,
                     False,
@@ -307,6 +418,23 @@ class BackgroundHealthMonitor:
                 )
                 with self.lock:
                     self.provider_consecutive_failures[provider_name] += 1
+        
+        self.invalidate_cache()
+    
+    def invalidate_cache(self) -> None:
+        """Drop cached health reports so the next read recomputes them"""
+        self._health_cache = None
+        self._summary_cache = None
+    
+    def _cached(self, entry: Optional[Tuple[float, int, object]]):
+        """Cached value if it is within its TTL and no metric was recorded since"""
+        if (
+            entry is not None
+            and time.monotonic() < entry[0]
+            and entry[1] == self.metrics_collector.version
+        ):
+            return entry[2]
+        return None
     
     def _detect_degradation(self) -> None:
         """Detect provider degradation based on error rates"""
@@ -319,8 +447,8 @@ class BackgroundHealthMonitor:
             
             if error_rate >= self.degradation_threshold and stats.get("check_count", 0) > 0:
                 logger.warning(
-                    f"⚠️ Provider degradation detected: {provider_name} | "
-                    f"Error rate: {error_rate}%"
+                    "⚠️ Provider degradation detected: %s | Error rate: %s%%",
+                    provider_name, error_rate
                 )
     
     def _trigger_failover_if_needed(self) -> None:
@@ -335,8 +463,8 @@ class BackgroundHealthMonitor:
         
         if consecutive_failures >= self.failure_threshold:
             logger.warning(
-                f"🔄 Failover triggered: {current_provider} | "
-                f"Consecutive failures: {consecutive_failures}"
+                "🔄 Failover triggered: %s | Consecutive failures: %s",
+                current_provider, consecutive_failures
             )
             self.orchestrator._trigger_failover()
     
@@ -363,10 +491,6 @@ class BackgroundHealthMonitor:
             self.orchestrator.lock_manager.get_current_provider() == provider
         )
         
-        # Get last error
-        history = self.metrics_collector.get_history(provider, limit=1)
-        last_error = history[0]["error_message"] if history and history[0].get("error_message") else None
-        
         return ProviderHealth(
             provider=provider,
             status=status,
@@ -376,7 +500,7 @@ class BackgroundHealthMonitor:
             failure_count=stats.get("failure_count", 0),
             error_rate=stats.get("error_rate", 0),
             avg_latency_ms=stats.get("avg_latency_ms", 0),
-            last_error=last_error,
+            last_error=self.metrics_collector.get_last_error(provider) or None,
             is_locked=is_locked,
             consecutive_failures=consecutive_failures
         )
@@ -386,13 +510,26 @@ class BackgroundHealthMonitor:
         if not self.orchestrator:
             return []
         
-        return [
+        cached = self._cached(self._health_cache)
+        if cached is not None:
+            return cached
+        
+        # Read the version first: a record landing mid-build then marks this stale
+        version = self.metrics_collector.version
+        all_health = [
             self.get_provider_health(provider_name)
             for provider_name in self.orchestrator.providers
         ]
+        self._health_cache = (time.monotonic() + self.cache_ttl, version, all_health)
+        return all_health
     
     def get_health_summary(self) -> Dict:
         """Get overall health summary"""
+        cached = self._cached(self._summary_cache)
+        if cached is not None:
+            return cached
+        
+        version = self.metrics_collector.version
         all_health = self.get_all_providers_health()
         
         healthy_count = sum(1 for h in all_health if h.status == ProviderHealthStatus.HEALTHY.value)
@@ -404,7 +541,7 @@ class BackgroundHealthMonitor:
             if self.orchestrator else None
         )
         
-        return {
+        summary = {
             "timestamp": datetime.utcnow().isoformat(),
             "is_monitoring": self.is_running,
             "current_provider": current_provider,
@@ -417,6 +554,8 @@ class BackgroundHealthMonitor:
             },
             "providers": [asdict(h) for h in all_health]
         }
+        self._summary_cache = (time.monotonic() + self.cache_ttl, version, summary)
+        return summary
     
     def get_metrics_history(self, provider: str, limit: int = 100) -> List[Dict]:
         """Get metrics history for a provider"""
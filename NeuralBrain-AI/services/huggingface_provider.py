@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 class HuggingFaceProvider:
     """HuggingFace Serverless Provider - Specialized LLM inference"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
         self.api_key = api_key or os.getenv('HUGGINGFACE_API_KEY', '').strip()
         self.provider_name = "HuggingFace"
         self.available = bool(self.api_key and self.api_key != 'your-hf-api-key-here')
@@ -28,6 +28,9 @@ class HuggingFaceProvider:
         self.model_id = "amazon/chronos-t5-large"
         self.api_url = "https://api-inference.huggingface.co/models"
         
+        # Keep-alive connections; the orchestrator passes in its shared pool
+        self._session = session or requests.Session()
+        
         if self.available:
             logger.info("✅ HuggingFace provider initialized")
         else:
@@ -84,7 +87,7 @@ class HuggingFaceProvider:
             
             # Send request to HuggingFace endpoint
             url = f"{self.api_url}/{model_to_use}"
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = self._session.post(url, json=payload, headers=headers, timeout=30)
             
             if response.status_code != 200:
                 error_msg = f"HTTP {response.status_code}: {response.text}"
@@ -0,0 +1,54 @@
+"""
+Fast JSON Provider
+
+Serializes Flask JSON responses through orjson when it is installed,
+falling back to Flask's stdlib provider otherwise.
+"""
+
+import logging
+from collections.abc import Mapping
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+logger = logging.getLogger(__name__)
+
+# orjson is optional; without it the stdlib provider is used unchanged
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Match Flask's defaults: sorted keys, RFC 822 dates via default()
+_ORJSON_OPTIONS = (
+    orjson.OPT_SORT_KEYS
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+) if orjson is not None else 0
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson"""
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        """Types orjson does not serialize natively"""
+        if isinstance(o, Mapping):
+            return dict(o)
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize with orjson, deferring pretty-printing to the stdlib"""
+        if orjson is None or 'indent' in kwargs:
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, default=self.default, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles them
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize with orjson"""
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
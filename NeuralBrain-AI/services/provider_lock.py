@@ -16,7 +16,7 @@ import logging
 import json
 import os
 from datetime import datetime
-from threading import RLock
+from threading import Lock, RLock
 from typing import Optional, Dict, Any
 from enum import Enum
 
@@ -52,7 +52,10 @@ class ProviderLockManager:
     
     def __init__(self):
         """Initialize provider lock manager"""
-        self._lock = RLock()  # Thread-safe operations
+        self._lock = RLock()  # Guards state transitions only
+        self._io_lock = Lock()  # Serializes state-file writes, outside _lock
+        self._state_version = 0  # Bumped per transition; stale snapshots are not written
+        self._written_version = 0
         self._locked_provider = None
         self._lock_acquired_at = None
         self._failure_count = 0
@@ -99,9 +102,10 @@ class ProviderLockManager:
             })
             
             # Persist state
-            self._save_state()
-            
-            return True
+            state = self._snapshot_state()
+        
+        self._write_state(state)
+        return True
     
     def release_lock(self, reason: str = "manual_release") -> bool:
         """
@@ -124,18 +128,23 @@ class ProviderLockManager:
             logger.warning(f"⚠️ Provider lock released: {previous_provider} ({reason})")
             self._audit_log("lock_release", previous_provider, {"reason": reason})
             
-            self._save_state()
-            return True
+            state = self._snapshot_state()
+        
+        self._write_state(state)
+        return True
     
     def get_locked_provider(self) -> Optional[str]:
-        """Get currently locked provider"""
-        with self._lock:
-            return self._locked_provider
+        """Get currently locked provider (lock-free: a single attribute read)"""
+        return self._locked_provider
     
     def is_locked(self, provider_name: str) -> bool:
-        """Check if specific provider is locked"""
-        with self._lock:
-            return self._locked_provider == provider_name
+        """Check if specific provider is locked (lock-free)"""
+        return self._locked_provider == provider_name
+    
+    @property
+    def state_version(self) -> int:
+        """Bumped on every lock or failure-count change; cheap change detection"""
+        return self._state_version
     
     def increment_failure_count(self, increment: int = 1) -> int:
         """
@@ -161,21 +170,33 @@ class ProviderLockManager:
                 "total": self._failure_count
             })
             
-            self._save_state()
-            return self._consecutive_failures
+            consecutive = self._consecutive_failures
+            state = self._snapshot_state()
+        
+        self._write_state(state)
+        return consecutive
     
     def reset_failure_count(self) -> None:
         """Reset failure counts on successful operation"""
+        # Common case on every successful request: nothing to reset, so no
+        # lock, audit entry or state-file write
+        if self._consecutive_failures == 0:
+            return
+        
         with self._lock:
-            if self._failure_count > 0 or self._consecutive_failures > 0:
-                logger.info(f"✅ Provider health recovered: {self._locked_provider}")
-                self._audit_log("health_recovered", self._locked_provider, {
-                    "previous_consecutive": self._consecutive_failures,
-                    "previous_total": self._failure_count
-                })
+            if self._consecutive_failures == 0:
+                return
+            
+            logger.info(f"✅ Provider health recovered: {self._locked_provider}")
+            self._audit_log("health_recovered", self._locked_provider, {
+                "previous_consecutive": self._consecutive_failures,
+                "previous_total": self._failure_count
+            })
             
             self._consecutive_failures = 0
-            self._save_state()
+            state = self._snapshot_state()
+        
+        self._write_state(state)
     
     def get_next_provider(self) -> Optional[str]:
         """
@@ -252,23 +273,38 @@ class ProviderLockManager:
         if len(self._audit_trail) > 1000:
             self._audit_trail = self._audit_trail[-1000:]
     
-    def _save_state(self) -> None:
-        """Persist lock state to disk"""
+    def _snapshot_state(self) -> Dict[str, Any]:
+        """Capture persistable state; call with _lock held"""
+        self._state_version += 1
+        return {
+            "version": self._state_version,
+            "locked_provider": self._locked_provider,
+            "lock_acquired_at": self._lock_acquired_at.isoformat() if self._lock_acquired_at else None,
+            "failure_count": self._failure_count,
+            "consecutive_failures": self._consecutive_failures,
+            "saved_at": datetime.utcnow().isoformat()
+        }
+    
+    def _write_state(self, state: Dict[str, Any]) -> None:
+        """Write a snapshot to disk without holding _lock; older snapshots are dropped"""
         try:
-            state = {
-                "locked_provider": self._locked_provider,
-                "lock_acquired_at": self._lock_acquired_at.isoformat() if self._lock_acquired_at else None,
-                "failure_count": self._failure_count,
-                "consecutive_failures": self._consecutive_failures,
-                "saved_at": datetime.utcnow().isoformat()
-            }
-            
-            with open(self.LOCK_STATE_FILE, 'w') as f:
-                json.dump(state, f, indent=2)
+            with self._io_lock:
+                if state["version"] <= self._written_version:
+                    return
+                
+                with open(self.LOCK_STATE_FILE, 'w') as f:
+                    json.dump(state, f, indent=2)
+                self._written_version = state["version"]
                 
         except Exception as e:
             logger.error(f"❌ Failed to save lock state: {str(e)}")
     
+    def _save_state(self) -> None:
+        """Persist lock state to disk"""
+        with self._lock:
+            state = self._snapshot_state()
+        self._write_state(state)
+    
     def _load_state(self) -> None:
         """Load lock state from disk if exists"""
         try:
@@ -17,10 +17,24 @@ import logging
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from datetime import datetime
+from typing import Optional
+import json
 import os
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional; cached sections are pre-encoded with whichever is present
+try:
+    import orjson
+    
+    def _encode(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    orjson = None
+    
+    def _encode(obj) -> bytes:
+        return json.dumps(obj, sort_keys=True, separators=(',', ':')).encode()
+
 class PredictionScheduler:
     """Manages hourly prediction scheduling"""
     
@@ -28,6 +42,12 @@ class PredictionScheduler:
     _is_running = False
     _app = None
     
+    _CACHE_FILE = os.path.join(os.path.dirname(__file__), '..', 'cache', 'latest_predictions.json')
+    
+    # ((mtime_ns, size), predictions, {section: JSON bytes}) of the last file
+    # read; replaced wholesale so readers never see a half-built snapshot
+    _snapshot = None
+    
     @classmethod
     def init_scheduler(cls, app=None):
         """Initialize the scheduler with Flask app context"""
@@ -86,14 +106,14 @@ class PredictionScheduler:
             from services.disease_data_service import DiseaseDataService
             from services.prediction_service import PredictionService
             from services.alert_engine import AlertEngine
-            from services.data_normalizer import DataNormalizer
             
             # 1. Fetch real data
             logger.info("\n📊 STEP 1: Fetching real disease data...")
             try:
-                global_stats = DiseaseDataService.get_global_stats()
-                countries = DiseaseDataService.get_countries_data()
-                historical = DiseaseDataService.get_historical_data(days=60)
+                data = DiseaseDataService.get_all_data(days=60)
+                global_stats = data['global_stats']
+                countries = data['countries']
+                historical = data['historical']
                 regional_risks = DiseaseDataService.get_regional_outbreak_risk()
                 
                 logger.info(f"   ✅ Global: {global_stats.get('cases', 0):,} cases")
@@ -142,30 +162,21 @@ class PredictionScheduler:
             
             # 4. Normalize data for frontend
             logger.info("\n📦 STEP 4: Normalizing data for frontend...")
-            try:
-                dashboard_metrics = DataNormalizer.normalize_dashboard_metrics(global_stats)
-                chart_data = DataNormalizer.normalize_chart_data(historical)
-                map_data = DataNormalizer.normalize_map_data(regional_predictions)
-                alerts_normalized = DataNormalizer.normalize_alerts(alerts)
-                predictions_normalized = DataNormalizer.normalize_predictions(predictions_7day)
-                analytics_normalized = DataNormalizer.normalize_analytics(health_analytics)
-                
-                logger.info("   ✅ All data normalized")
-            except Exception as e:
-                logger.warning(f"   ⚠️ Data normalization failed: {str(e)}")
+            now_iso = datetime.utcnow().isoformat()
+            sections = cls._normalize_sections(
+                now_iso,
+                global_stats=global_stats,
+                historical=historical,
+                regional_predictions=regional_predictions,
+                alerts=alerts,
+                predictions_7day=predictions_7day,
+                health_analytics=health_analytics
+            )
             
             # 5. Store in database/cache
             logger.info("\n💾 STEP 5: Storing predictions...")
             try:
-                cls._store_predictions({
-                    'dashboard_metrics': dashboard_metrics,
-                    'chart_data': chart_data,
-                    'map_data': map_data,
-                    'alerts': alerts_normalized,
-                    'predictions': predictions_normalized,
-                    'analytics': analytics_normalized,
-                    'timestamp': datetime.utcnow().isoformat()
-                })
+                cls._store_predictions({**sections, 'timestamp': now_iso})
                 logger.info("   ✅ All data stored successfully")
             except Exception as e:
                 logger.warning(f"   ⚠️ Data storage failed: {str(e)}")
@@ -181,50 +192,126 @@ class PredictionScheduler:
             logger.warning("⚠️ SCHEDULER RESILIENCE: Will retry predictions in 1 hour")
             logger.warning("⚠️ Server will continue running - scheduler will not shut down")
     
+    @staticmethod
+    def _normalize_sections(
+        now_iso: str,
+        *,
+        global_stats,
+        historical,
+        regional_predictions,
+        alerts,
+        predictions_7day,
+        health_analytics
+    ) -> dict:
+        """Normalize each cached section, falling back per section on bad data"""
+        from services.data_normalizer import DataNormalizer
+        
+        stamp = now_iso + "Z"
+        # section -> (normalize, fallback); one malformed section must not
+        # cost the others their fresh data
+        steps = {
+            'dashboard_metrics': (
+                lambda: DataNormalizer.normalize_dashboard_metrics(global_stats, now_iso=stamp),
+                lambda: DataNormalizer._get_fallback_dashboard_metrics(stamp)
+            ),
+            'chart_data': (
+                lambda: DataNormalizer.normalize_chart_data(historical),
+                DataNormalizer._get_fallback_chart_data
+            ),
+            'map_data': (
+                lambda: DataNormalizer.normalize_map_data(regional_predictions),
+                DataNormalizer._get_fallback_map_data
+            ),
+            'alerts': (
+                lambda: DataNormalizer.normalize_alerts(alerts),
+                DataNormalizer._get_fallback_alerts
+            ),
+            'predictions': (
+                lambda: DataNormalizer.normalize_predictions(predictions_7day),
+                DataNormalizer._get_fallback_predictions
+            ),
+            'analytics': (
+                lambda: DataNormalizer.normalize_analytics(health_analytics),
+                DataNormalizer._get_fallback_analytics
+            ),
+        }
+        
+        sections = {}
+        for name, (normalize, fallback) in steps.items():
+            try:
+                sections[name] = normalize()
+            except Exception as e:
+                logger.warning(f"   ⚠️ Normalizing {name} failed (using fallback): {str(e)}")
+                sections[name] = fallback()
+        
+        logger.info("   ✅ All data normalized")
+        return sections
+    
     @classmethod
     def _store_predictions(cls, data: dict):
         """Store predictions in database or cache"""
         try:
-            import json
-            cache_file = os.path.join(
-                os.path.dirname(__file__),
-                '..',
-                'cache',
-                'latest_predictions.json'
-            )
-            
             # Create cache directory if needed
-            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            os.makedirs(os.path.dirname(cls._CACHE_FILE), exist_ok=True)
             
-            with open(cache_file, 'w') as f:
+            # Write aside and rename so readers never see a partial file
+            tmp_file = f"{cls._CACHE_FILE}.tmp"
+            with open(tmp_file, 'w') as f:
                 json.dump(data, f, indent=2, default=str)
+            os.replace(tmp_file, cls._CACHE_FILE)
             
             logger.info(f"   📁 Cache updated")
             
         except Exception as e:
             logger.error(f"   ❌ Cache storage error: {str(e)}")
     
+    @classmethod
+    def _load_snapshot(cls):
+        """Current snapshot, re-reading the cache file only when it changed"""
+        try:
+            st = os.stat(cls._CACHE_FILE)
+        except FileNotFoundError:
+            return None
+        
+        key = (st.st_mtime_ns, st.st_size)
+        snapshot = cls._snapshot
+        if snapshot is not None and snapshot[0] == key:
+            return snapshot
+        
+        with open(cls._CACHE_FILE, 'r') as f:
+            data = json.load(f)
+        
+        # Encode every section once per refresh instead of once per request
+        encoded = {section: _encode(value) for section, value in data.items()}
+        snapshot = cls._snapshot = (key, data, encoded)
+        return snapshot
+    
     @classmethod
     def get_latest_predictions(cls) -> dict:
         """Retrieve latest predictions from cache"""
         try:
-            import json
-            cache_file = os.path.join(
-                os.path.dirname(__file__),
-                '..',
-                'cache',
-                'latest_predictions.json'
-            )
-            
-            if os.path.exists(cache_file):
-                with open(cache_file, 'r') as f:
-                    return json.load(f)
+            snapshot = cls._load_snapshot()
+            if snapshot is not None:
+                return snapshot[1]
             
         except Exception as e:
             logger.error(f"❌ Cache retrieval error: {str(e)}")
         
         return {}
     
+    @classmethod
+    def get_latest_json(cls, section: str) -> Optional[bytes]:
+        """Pre-encoded JSON body for one cached section, None if not cached"""
+        try:
+            snapshot = cls._load_snapshot()
+            if snapshot is not None:
+                return snapshot[2].get(section)
+            
+        except Exception as e:
+            logger.error(f"❌ Cache retrieval error: {str(e)}")
+        
+        return None
+    
     @classmethod
     def get_scheduler_status(cls) -> dict:
         """Get scheduler status"""
@@ -0,0 +1,205 @@
+"""
+Alert System - Test Suite
+
+Test coverage:
+- Alert serialization
+- SpikeDetector (batch and streaming)
+- TrendDetector
+- AlertManager
+"""
+
+import array
+import math
+import pytest
+
+from services.alerts import (
+    Alert,
+    AlertManager,
+    AlertSeverity,
+    AlertType,
+    SpikeDetector,
+    RiskAlertGenerator,
+    SpikeState,
+    TrendDetector,
+)
+
+
+class TestSpikeDetector:
+    """Test spike detection"""
+
+    @pytest.fixture
+    def detector(self):
+        return SpikeDetector(spike_threshold=2.0)
+
+    def test_detect_spike(self, detector):
+        """Test spike detection on list history"""
+        alert = detector.detect_spike(50.0, [10.0, 11.0, 9.0, 10.0, 10.5], "heart_rate")
+        assert alert is not None
+        assert alert.type == AlertType.SPIKE_DETECTED
+        assert alert.data['metric'] == "heart_rate"
+
+    def test_no_spike_on_flat_history(self, detector):
+        """Test zero-variance history never alerts"""
+        assert detector.detect_spike(50.0, [10.0, 10.0, 10.0]) is None
+
+    def test_short_history_ignored(self, detector):
+        """Test fewer than 3 samples never alerts"""
+        assert detector.detect_spike(50.0, [10.0, 11.0]) is None
+
+    def test_spike_state_matches_batch_stats(self):
+        """Test Welford running stats match a full recomputation"""
+        samples = [3.0, 7.5, 1.25, 9.0, 4.0, 6.5, 2.0]
+        state = SpikeState()
+        for x in samples:
+            state.push(x)
+
+        mean = sum(samples) / len(samples)
+        std = math.sqrt(sum((x - mean) ** 2 for x in samples) / len(samples))
+        assert state.n == len(samples)
+        assert state.mean == pytest.approx(mean)
+        assert state.std == pytest.approx(std)
+
+    def test_spike_state_rolling_window(self):
+        """Test evicted samples are removed from the running stats"""
+        samples = [100.0, -50.0, 3.0, 7.5, 1.25, 9.0]
+        state = SpikeState(window=4)
+        for x in samples:
+            state.push(x)
+
+        window = samples[-4:]
+        mean = sum(window) / len(window)
+        std = math.sqrt(sum((x - mean) ** 2 for x in window) / len(window))
+        assert state.n == 4
+        assert state.values == window
+        assert state.mean == pytest.approx(mean)
+        assert state.std == pytest.approx(std)
+
+    def test_update_and_detect_matches_detect_spike(self, detector):
+        """Test streaming detection agrees with the list-based API"""
+        history = [10.0, 11.0, 9.0, 10.0, 10.5]
+        state = SpikeState(window=len(history))
+        for x in history:
+            state.push(x)
+
+        streamed = detector.update_and_detect(50.0, state, "heart_rate")
+        batch = detector.detect_spike(50.0, history, "heart_rate")
+        assert streamed is not None and batch is not None
+        assert streamed.data['z_score'] == pytest.approx(batch.data['z_score'])
+        assert state.n == len(history)
+
+
+class TestTrendDetector:
+    """Test trend deterioration detection"""
+
+    def test_detects_decreasing_trend(self):
+        """Test a steadily decreasing series alerts"""
+        alert = TrendDetector().detect_trend_deterioration(
+            [10.0, 9.0, 8.0, 7.0, 6.0, 5.0, 4.0], "oxygen"
+        )
+        assert alert is not None
+        assert alert.type == AlertType.TREND_DETERIORATION
+        assert alert.severity == AlertSeverity.HIGH
+
+    def test_slope_matches_least_squares(self):
+        """Test the reported slope is the ordinary least-squares slope"""
+        values = [5.0, 4.0, 4.5, 3.0, 2.5, 1.0, 1.5]
+        alert = TrendDetector().detect_trend_deterioration(values)
+        n = len(values)
+        x_mean = (n - 1) / 2
+        y_mean = sum(values) / n
+        expected = (
+            sum((i - x_mean) * (y - y_mean) for i, y in enumerate(values))
+            / sum((i - x_mean) ** 2 for i in range(n))
+        )
+        assert alert.data['slope'] == pytest.approx(expected)
+
+    def test_accepts_typed_array(self):
+        """Test array.array input works and the payload is a plain list"""
+        values = array.array('d', [10.0, 9.0, 8.0, 7.0, 6.0, 5.0, 4.0])
+        alert = TrendDetector().detect_trend_deterioration(values)
+        assert alert.data['recent_values'] == list(values)
+        assert type(alert.data['recent_values']) is list
+
+    def test_ignores_increasing_trend(self):
+        """Test an increasing series does not alert"""
+        assert TrendDetector().detect_trend_deterioration(
+            [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0]
+        ) is None
+
+
+class TestRiskAlertGenerator:
+    """Test risk-score alerts"""
+
+    def test_high_risk_alert(self):
+        """Test high risk produces a critical alert with the score"""
+        alert = RiskAlertGenerator.generate_risk_alert(87.25, "High", "p1")
+        assert alert.severity == AlertSeverity.CRITICAL
+        assert alert.message == (
+            "AI risk assessment indicates HIGH risk level (87.2%). "
+            "Immediate medical consultation recommended."
+        )
+
+    def test_elevated_risk_alert(self):
+        """Test medium risk above 60 produces a high alert"""
+        alert = RiskAlertGenerator.generate_risk_alert(65.0, "Medium")
+        assert alert.severity == AlertSeverity.HIGH
+        assert "(65.0%)" in alert.message
+
+    def test_low_risk_no_alert(self):
+        """Test low risk does not alert"""
+        assert RiskAlertGenerator.generate_risk_alert(20.0, "Low") is None
+
+
+class TestAlertManager:
+    """Test alert management"""
+
+    def test_add_and_acknowledge(self):
+        """Test alerts can be added and acknowledged"""
+        manager = AlertManager()
+        alert = Alert(AlertType.SYSTEM_ERROR, AlertSeverity.LOW, "t", "m")
+        manager.add_alert(alert)
+
+        assert manager.get_active_alerts() == [alert]
+        assert manager.acknowledge_alert(alert.id, "user_1")
+        assert manager.get_active_alerts() == []
+
+    def test_to_dict(self):
+        """Test alert serialization"""
+        alert = Alert(AlertType.SPIKE_DETECTED, AlertSeverity.HIGH, "t", "m")
+        data = alert.to_dict()
+        assert data['type'] == "spike_detected"
+        assert data['severity'] == "high"
+        assert data['acknowledged_at'] is None
+
+    def test_alerts_bounded(self):
+        """Test the oldest alerts are evicted past the cap"""
+        manager = AlertManager(max_alerts=3)
+        alerts = [Alert(AlertType.SYSTEM_ERROR, AlertSeverity.LOW, str(i), "m") for i in range(5)]
+        for alert in alerts:
+            manager.add_alert(alert)
+
+        assert list(manager.alerts) == alerts[2:]
+        assert manager.evicted_count == 2
+        assert not manager.acknowledge_alert(alerts[0].id)
+
+    def test_clear_old_alerts_keeps_cap(self):
+        """Test clearing old alerts keeps the bounded container"""
+        manager = AlertManager(max_alerts=3)
+        manager.add_alert(Alert(AlertType.SYSTEM_ERROR, AlertSeverity.LOW, "t", "m"))
+        assert manager.clear_old_alerts(days=30) == 0
+        assert manager.alerts.maxlen == 3
+
+    def test_scan_metrics_concurrent(self):
+        """Test concurrent scan finds spikes and trends per metric"""
+        manager = AlertManager()
+        alerts = manager.scan_metrics_concurrent({
+            "heart_rate": [10.0, 11.0, 9.0, 10.0, 10.5, 50.0],
+            "oxygen": [10.0, 9.0, 8.0, 7.0, 6.0, 5.0, 4.0],
+            "steady": [5.0, 5.0, 5.0, 5.0],
+        }, max_workers=2)
+
+        kinds = {(a.data['metric'], a.type) for a in alerts}
+        assert ("heart_rate", AlertType.SPIKE_DETECTED) in kinds
+        assert ("oxygen", AlertType.TREND_DETERIORATION) in kinds
+        assert all(a.data['metric'] != "steady" for a in alerts)
+        assert len(manager.alerts) == len(alerts)
@@ -0,0 +1,314 @@
+"""
+Clerk Authentication - Test Suite
+
+Test coverage:
+- JWKS caching (TTL, ETag revalidation, forced refresh rate limit)
+- Token verification by 'kid'
+- Verified-payload cache (expiry and LRU bound)
+- Background JWKS refresher
+- Local user sync
+"""
+
+import json
+import time
+from types import SimpleNamespace
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from flask import Flask
+from jwt.algorithms import RSAAlgorithm
+
+from models import db, User
+from services import auth_service
+from services.auth_service import ClerkAuth, JWKS_FORCE_REFRESH_INTERVAL, _sync_user
+
+ISSUER = 'https://clerk.example.test'
+JWKS_URL = f'{ISSUER}/.well-known/jwks.json'
+
+
+def make_key(kid):
+    """RSA private key plus its public JWK tagged with kid"""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update(kid=kid, use='sig', alg='RS256')
+    return private_key, jwk
+
+
+@pytest.fixture(scope='module')
+def keys():
+    """Two signing keys, generated once for the module"""
+    return {kid: make_key(kid) for kid in ('k1', 'k2')}
+
+
+def sign(keys, kid, sub='user_1', exp=None):
+    """RS256 token from the test issuer"""
+    claims = {'sub': sub, 'iss': ISSUER, 'exp': exp or int(time.time()) + 3600}
+    return jwt.encode(claims, keys[kid][0], algorithm='RS256', headers={'kid': kid})
+
+
+class FakeSession:
+    """Stands in for requests.Session; replays queued JWKS responses"""
+
+    def __init__(self):
+        self.responses = []
+        self.calls = []
+
+    def queue(self, status_code=200, jwks=None, etag=None, max_age=None):
+        headers = {}
+        if etag:
+            headers['ETag'] = etag
+        if max_age is not None:
+            headers['Cache-Control'] = f'public, max-age={max_age}'
+        self.responses.append(SimpleNamespace(
+            status_code=status_code, headers=headers, text='', json=lambda: jwks
+        ))
+
+    def get(self, url, headers=None, **kwargs):
+        self.calls.append((url, dict(headers or {})))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic and wall clocks for the auth module"""
+    now = {'mono': 1000.0, 'wall': time.time()}
+    monkeypatch.setattr(auth_service, 'time', SimpleNamespace(
+        monotonic=lambda: now['mono'], time=lambda: now['wall']
+    ))
+    return now
+
+
+@pytest.fixture
+def auth(clock, monkeypatch):
+    """ClerkAuth wired to a fake HTTP session, with no refresher thread"""
+    monkeypatch.setattr(ClerkAuth, '_start_refresher', lambda self: None)
+    clerk = ClerkAuth()
+    clerk._http = FakeSession()
+    yield clerk
+    clerk.stop_refresher()
+
+
+class TestJwksCache:
+    """Test JWKS fetching and caching"""
+
+    def test_fresh_cache_skips_network(self, auth, keys, clock):
+        """Test keys are fetched once and reused until max-age lapses"""
+        jwks = {'keys': [keys['k1'][1]]}
+        auth._http.queue(jwks=jwks, max_age=60)
+
+        assert auth.get_jwks(JWKS_URL) == jwks
+        assert auth.get_jwks() == jwks
+        assert len(auth._http.calls) == 1
+
+        clock['mono'] += 61
+        auth._http.queue(jwks=jwks, max_age=60)
+        auth.get_jwks()
+        assert len(auth._http.calls) == 2
+        assert auth._http.calls[1][0] == JWKS_URL
+
+    def test_default_ttl_without_max_age(self, auth, keys, clock):
+        """Test responses without Cache-Control use JWKS_TTL_SECONDS"""
+        auth._http.queue(jwks={'keys': [keys['k1'][1]]})
+        auth.get_jwks(JWKS_URL)
+
+        clock['mono'] += auth_service.JWKS_TTL_SECONDS - 1
+        auth.get_jwks()
+        assert len(auth._http.calls) == 1
+
+    def test_not_modified_keeps_keys(self, auth, keys, clock):
+        """Test a 304 revalidation keeps the parsed keys and extends the TTL"""
+        jwks = {'keys': [keys['k1'][1]]}
+        auth._http.queue(jwks=jwks, etag='"v1"', max_age=60)
+        auth.get_jwks(JWKS_URL)
+        parsed = auth._public_keys
+
+        clock['mono'] += 61
+        auth._http.queue(status_code=304, max_age=120)
+        assert auth.get_jwks() is jwks
+        assert auth._http.calls[1][1] == {'If-None-Match': '"v1"'}
+        assert auth._public_keys is parsed
+
+        clock['mono'] += 100
+        auth.get_jwks()
+        assert len(auth._http.calls) == 2
+
+    def test_failed_refresh_serves_cached_keys(self, auth, keys, clock):
+        """Test an error response keeps the stale keys for a retry window"""
+        jwks = {'keys': [keys['k1'][1]]}
+        auth._http.queue(jwks=jwks, max_age=60)
+        auth.get_jwks(JWKS_URL)
+
+        clock['mono'] += 61
+        auth._http.queue(status_code=503)
+        assert auth.get_jwks() is jwks
+        assert 'k1' in auth._public_keys
+
+    def test_forced_refresh_rate_limited(self, auth, keys, clock):
+        """Test forced refreshes are spaced JWKS_FORCE_REFRESH_INTERVAL apart"""
+        jwks = {'keys': [keys['k1'][1]]}
+        auth._http.queue(jwks=jwks, max_age=600)
+        auth.get_jwks(JWKS_URL)
+
+        auth._http.queue(jwks=jwks, max_age=600)
+        auth.get_jwks(force=True)
+        auth.get_jwks(force=True)
+        assert len(auth._http.calls) == 2
+
+        clock['mono'] += JWKS_FORCE_REFRESH_INTERVAL
+        auth._http.queue(jwks=jwks, max_age=600)
+        auth.get_jwks(force=True)
+        assert len(auth._http.calls) == 3
+
+
+class TestVerifyToken:
+    """Test token verification against the JWKS"""
+
+    def test_key_looked_up_by_kid(self, auth, keys):
+        """Test each token is verified with the key its header names"""
+        auth._http.queue(jwks={'keys': [keys['k1'][1], keys['k2'][1]]}, max_age=600)
+
+        assert auth.verify_token(sign(keys, 'k1', sub='a'))['sub'] == 'a'
+        assert auth.verify_token(sign(keys, 'k2', sub='b'))['sub'] == 'b'
+        assert set(auth._public_keys) == {'k1', 'k2'}
+        assert len(auth._http.calls) == 1
+
+    def test_unknown_kid_refreshes_once(self, auth, keys, clock):
+        """Test a rotated key is picked up by a single forced refresh"""
+        auth._http.queue(jwks={'keys': [keys['k1'][1]]}, max_age=600)
+        auth.get_jwks(JWKS_URL)
+        clock['mono'] += JWKS_FORCE_REFRESH_INTERVAL
+
+        auth._http.queue(jwks={'keys': [keys['k1'][1], keys['k2'][1]]}, max_age=600)
+        assert auth.verify_token(sign(keys, 'k2'))['sub'] == 'user_1'
+        assert len(auth._http.calls) == 2
+
+    def test_unknown_kid_does_not_hammer_jwks(self, auth, keys, clock):
+        """Test repeated unknown kids within the interval trigger one fetch"""
+        auth._http.queue(jwks={'keys': [keys['k1'][1]]}, max_age=600)
+        auth.get_jwks(JWKS_URL)
+        clock['mono'] += JWKS_FORCE_REFRESH_INTERVAL
+
+        auth._http.queue(jwks={'keys': [keys['k1'][1]]}, max_age=600)
+        for sub in ('a', 'b', 'c'):
+            assert auth.verify_token(sign(keys, 'k2', sub=sub)) is None
+        assert len(auth._http.calls) == 2
+
+
+class TestVerifiedPayloadCache:
+    """Test the verified-token payload cache"""
+
+    def test_repeat_token_skips_verification(self, auth, keys, monkeypatch):
+        """Test a verified token is served from cache as a fresh copy"""
+        auth._http.queue(jwks={'keys': [keys['k1'][1]]}, max_age=600)
+        token = sign(keys, 'k1')
+        first = auth.verify_token(token)
+        first['role'] = 'admin'
+
+        monkeypatch.setattr(auth_service.jwt, 'get_unverified_header', pytest.fail)
+        second = auth.verify_token(token)
+        assert second['sub'] == 'user_1'
+        assert 'role' not in second
+
+    def test_entry_evicted_at_exp(self, auth, clock):
+        """Test cached payloads are dropped once the token expires"""
+        exp = clock['wall'] + 10
+        auth._remember_payload(b'key', {'sub': 'a', 'exp': exp})
+        assert auth._cached_payload(b'key') == {'sub': 'a', 'exp': exp}
+
+        clock['wall'] = exp
+        assert auth._cached_payload(b'key') is None
+        assert b'key' not in auth._verified
+
+    def test_expired_or_exp_less_payloads_not_cached(self, auth, clock):
+        """Test only payloads with a future numeric exp are remembered"""
+        auth._remember_payload(b'old', {'exp': clock['wall'] - 1})
+        auth._remember_payload(b'none', {'sub': 'a'})
+        assert len(auth._verified) == 0
+
+    def test_lru_size_bound(self, auth, clock, monkeypatch):
+        """Test the least recently used entry goes once the cache is full"""
+        monkeypatch.setattr(auth_service, 'VERIFIED_TOKEN_CACHE_SIZE', 2)
+        exp = clock['wall'] + 60
+        auth._remember_payload(b'a', {'exp': exp})
+        auth._remember_payload(b'b', {'exp': exp})
+        auth._cached_payload(b'a')
+        auth._remember_payload(b'c', {'exp': exp})
+
+        assert list(auth._verified) == [b'a', b'c']
+
+
+class TestJwksRefresher:
+    """Test the background JWKS refresher"""
+
+    def test_stop_event_ends_thread(self, keys, monkeypatch):
+        """Test stop_refresher() ends the refresher loop promptly"""
+        monkeypatch.setattr(auth_service, 'JWKS_REFRESH_INTERVAL', 0.01)
+        clerk = ClerkAuth()
+        clerk._http = FakeSession()
+        clerk._http.queue(jwks={'keys': [keys['k1'][1]]}, max_age=600)
+        clerk.get_jwks(JWKS_URL)
+        assert clerk._refresher.is_alive()
+
+        clerk.stop_refresher()
+        clerk._refresher.join(timeout=1)
+        assert not clerk._refresher.is_alive()
+
+    def test_refreshes_shortly_before_expiry(self, auth, keys, clock):
+        """Test the refresher revalidates only within JWKS_REFRESH_INTERVAL of expiry"""
+        jwks = {'keys': [keys['k1'][1]]}
+        auth._http.queue(jwks=jwks, etag='"v1"', max_age=600)
+        auth.get_jwks(JWKS_URL)
+
+        auth._refresh_jwks_if_stale()
+        assert len(auth._http.calls) == 1
+
+        clock['mono'] += 600 - auth_service.JWKS_REFRESH_INTERVAL
+        auth._http.queue(status_code=304, max_age=600)
+        auth._refresh_jwks_if_stale()
+        assert auth._http.calls[1][1] == {'If-None-Match': '"v1"'}
+
+
+class TestSyncUser:
+    """Test local user sync for verified Clerk users"""
+
+    @pytest.fixture
+    def app(self):
+        app = Flask(__name__)
+        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+        db.init_app(app)
+        with app.app_context():
+            db.create_all()
+            yield app
+            db.session.remove()
+            db.drop_all()
+
+    @pytest.fixture(params=['upsert', 'orm'])
+    def sync_path(self, request, monkeypatch):
+        """Run each test through the ON CONFLICT upsert and the ORM fallback"""
+        if request.param == 'orm':
+            monkeypatch.setattr(auth_service, '_UPSERT_BY_DIALECT', {})
+        return request.param
+
+    def test_creates_user(self, app, sync_path):
+        """Test a first login inserts the user with the default role"""
+        assert _sync_user('u1', 'a@example.com', 'Ada', None) == 'user'
+
+        user = db.session.get(User, 'u1')
+        assert (user.email, user.first_name, user.last_name) == ('a@example.com', 'Ada', None)
+        assert user.last_login is not None
+
+    def test_updates_only_missing_fields(self, app, sync_path):
+        """Test later logins fill blanks, keep existing values and bump last_login"""
+        _sync_user('u1', 'a@example.com', '', None)
+        user = db.session.get(User, 'u1')
+        user.role = 'admin'
+        first_login = user.last_login
+        db.session.commit()
+
+        assert _sync_user('u1', 'b@example.com', 'Ada', 'Lovelace') == 'admin'
+
+        db.session.expire_all()
+        user = db.session.get(User, 'u1')
+        assert (user.email, user.first_name, user.last_name) == ('a@example.com', 'Ada', 'Lovelace')
+        assert user.last_login >= first_login
@@ -0,0 +1,143 @@
+"""
+Cloud Readiness - Test Suite
+
+Test coverage:
+- CloudConfig environment parsing and caching
+- HuaweiCloudIntegration connection info
+- CloudHealthCheck readiness checks
+"""
+
+import dataclasses
+import sys
+
+import pytest
+
+from services.cloud import CloudConfig, CloudHealthCheck, HuaweiCloudIntegration
+
+
+@pytest.fixture(autouse=True)
+def fresh_config():
+    """Drop the cached config so each test parses its own environment"""
+    CloudConfig.get.cache_clear()
+    yield
+    CloudConfig.get.cache_clear()
+
+
+class TestCloudConfig:
+    """Test cloud configuration"""
+
+    def test_from_env(self, monkeypatch):
+        """Test environment variables are parsed into typed fields"""
+        monkeypatch.setenv('CLOUD_PROVIDER', 'huawei')
+        monkeypatch.setenv('ENVIRONMENT', 'production')
+        monkeypatch.setenv('DB_PORT', '6543')
+        monkeypatch.setenv('ECS_AUTO_SCALE', 'False')
+
+        config = CloudConfig.from_env()
+        assert config.is_cloud_deployed()
+        assert config.is_production()
+        assert config.db_port == 6543
+        assert config.ecs_auto_scale is False
+
+    def test_defaults(self, monkeypatch):
+        """Test defaults apply when nothing is configured"""
+        monkeypatch.delenv('CLOUD_PROVIDER', raising=False)
+        monkeypatch.delenv('DB_PROVIDER', raising=False)
+
+        config = CloudConfig.from_env()
+        assert config.cloud_provider == CloudConfig.CLOUD_PROVIDER_LOCAL
+        assert not config.is_cloud_deployed()
+        assert config.to_dict()['db_provider'] == 'sqlite'
+
+    def test_get_is_cached_and_frozen(self):
+        """Test get() parses once and returns an immutable shared instance"""
+        config = CloudConfig.get()
+        assert CloudConfig.get() is config
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.region = 'eu-west-1'
+
+
+class TestHuaweiCloudIntegration:
+    """Test Huawei Cloud connection info"""
+
+    def test_defaults_to_shared_config(self):
+        """Test the integration uses the cached config when none is given"""
+        assert HuaweiCloudIntegration().config is CloudConfig.get()
+
+    def test_obs_connection_info(self, monkeypatch):
+        """Test missing OBS credentials fall back to placeholders"""
+        monkeypatch.delenv('HUAWEI_ACCESS_KEY', raising=False)
+        monkeypatch.setenv('HUAWEI_OBS_BUCKET', 'bucket-1')
+
+        info = HuaweiCloudIntegration(CloudConfig.from_env()).get_obs_connection_info()
+        assert info['access_key'] == 'PLACEHOLDER'
+        assert info['bucket'] == 'bucket-1'
+
+    def test_credentials_resolved_once(self, monkeypatch):
+        """Test connection info is read on first use and then memoized"""
+        monkeypatch.setenv('DCS_PORT', '6380')
+        monkeypatch.setenv('RDS_USER', 'alice')
+        integration = HuaweiCloudIntegration()
+
+        info = integration.get_dcs_connection_info()
+        dsn = integration.get_rds_connection_string()
+        monkeypatch.setenv('DCS_PORT', '7000')
+        monkeypatch.setenv('RDS_USER', 'bob')
+
+        assert info['port'] == 6380
+        assert integration.get_dcs_connection_info() == info
+        assert integration.get_rds_connection_string() == dsn
+        assert dsn.startswith('postgresql://alice:')
+
+        # Callers get a copy, so mutating it leaves the memoized info intact
+        info['port'] = 1
+        assert integration.get_dcs_connection_info()['port'] == 6380
+
+
+class TestCloudHealthCheck:
+    """Test cloud readiness checks"""
+
+    def test_readiness_report(self):
+        """Test the report covers every check with a timezone-aware timestamp"""
+        report = CloudHealthCheck.check_cloud_readiness()
+        assert report['status'] in ('ready', 'needs_setup')
+        assert report['timestamp'].endswith('+00:00')
+        assert set(report['checks']) == {
+            'environment_variables', 'cloud_config', 'database', 'storage', 'dependencies',
+        }
+
+    def test_env_vars_check(self, monkeypatch):
+        """Test missing environment variables are reported by name"""
+        monkeypatch.setenv('FLASK_APP', 'app.py')
+        monkeypatch.delenv('FLASK_ENV', raising=False)
+
+        result = CloudHealthCheck._check_env_vars()
+        assert result['status'] == 'warning'
+        assert result['message'] == 'Missing: FLASK_ENV'
+
+    def test_dependencies_check_reports_missing(self, monkeypatch):
+        """Test missing packages are listed in declaration order"""
+        monkeypatch.setattr('services.cloud._REQUIRED_PACKAGES', ('json', 'no_such_pkg_a', 'no_such_pkg_b'))
+
+        result = CloudHealthCheck._check_dependencies()
+        assert result['status'] == 'error'
+        assert result['message'] == 'Missing packages: no_such_pkg_a, no_such_pkg_b'
+
+    def test_dependencies_check_does_not_import(self, monkeypatch):
+        """Test the probe finds installed packages without importing them"""
+        monkeypatch.setattr('services.cloud._REQUIRED_PACKAGES', ('this',))
+        monkeypatch.delitem(sys.modules, 'this', raising=False)
+
+        assert CloudHealthCheck._check_dependencies()['status'] == 'ok'
+        assert 'this' not in sys.modules
+
+    def test_storage_check(self, tmp_path, monkeypatch):
+        """Test the probe creates the data directory and only writes when deep"""
+        monkeypatch.chdir(tmp_path)
+
+        assert CloudHealthCheck._check_storage()['status'] == 'ok'
+        assert list((tmp_path / 'data').iterdir()) == []
+        assert CloudHealthCheck._check_storage(deep=True)['status'] == 'ok'
+
+        monkeypatch.setattr('services.cloud.os.access', lambda path, mode: False)
+        assert CloudHealthCheck._check_storage()['status'] == 'error'
@@ -0,0 +1,173 @@
+"""
+Data Normalizer - Test Suite
+
+Test coverage:
+- Dashboard metrics
+- Chart data
+- Map data
+- Predictions, alerts and analytics
+- Fallbacks
+"""
+
+import pytest
+
+from services.data_normalizer import DataNormalizer, MapPoint
+
+
+class TestDashboardMetrics:
+    """Test dashboard metric normalization"""
+
+    def test_metrics_use_given_timestamp(self):
+        """Test counts are derived from global stats and now_iso is reused"""
+        metrics = DataNormalizer.normalize_dashboard_metrics(
+            {'cases': 100, 'deaths': 5, 'recovered': 80}, now_iso='2025-01-01T00:00:00Z'
+        )
+
+        assert metrics['valid_records'] == 85
+        assert metrics['active_alerts'] == 15
+        assert metrics['latest_ingestion']['timestamp'] == '2025-01-01T00:00:00Z'
+
+    def test_timestamp_defaults_to_now(self):
+        """Test a UTC timestamp is generated when none is passed"""
+        metrics = DataNormalizer.normalize_dashboard_metrics({'cases': 1})
+        assert metrics['latest_ingestion']['timestamp'].endswith('Z')
+
+
+class TestChartData:
+    """Test historical chart normalization"""
+
+    def test_series_follow_records(self):
+        """Test each dataset lines up with the labels"""
+        chart = DataNormalizer.normalize_chart_data([
+            {'date': '1/1/25', 'cases': 10, 'deaths': 1, 'recovered': 5},
+            {'date': '1/2/25', 'cases': 12},
+        ])
+
+        assert chart['labels'] == ['1/1/25', '1/2/25']
+        cases, deaths, recovered = (d['data'] for d in chart['datasets'])
+        assert cases == [10, 12]
+        assert deaths == [1, 0]
+        assert recovered == [5, 0]
+
+    def test_dataset_styles(self):
+        """Test each series keeps its label, colours and fill"""
+        chart = DataNormalizer.normalize_chart_data([{'date': '1/1/25'}])
+        styles = [(d['label'], d['borderColor'], d['backgroundColor'], d['fill']) for d in chart['datasets']]
+
+        assert styles == [
+            ('Total Cases', 'rgb(59, 130, 246)', 'rgba(59, 130, 246, 0.1)', True),
+            ('Deaths', 'rgb(239, 68, 68)', 'rgba(239, 68, 68, 0.1)', False),
+            ('Recovered', 'rgb(34, 197, 94)', 'rgba(34, 197, 94, 0.1)', False),
+        ]
+
+    def test_empty_history_uses_fallback(self):
+        """Test empty input returns the fallback chart"""
+        assert DataNormalizer.normalize_chart_data([]) == DataNormalizer._get_fallback_chart_data()
+
+
+class TestMapData:
+    """Test regional map normalization"""
+
+    def test_aliases_and_defaults(self):
+        """Test alternate field names resolve and missing fields get defaults"""
+        points = DataNormalizer.normalize_map_data([
+            {'country': 'USA', 'lat': 37.1, 'lng': -95.7, 'riskScore': 78.5, 'severity': 'HIGH'},
+            {'region': 'Europe', 'long': 10.4, 'risk_score': 40.0},
+        ])
+
+        assert points[0]['country'] == 'USA'
+        assert points[0]['lng'] == -95.7
+        assert points[1] == {
+            'country': 'Europe', 'lat': 0, 'lng': 10.4, 'cases': 0, 'deaths': 0,
+            'recovered': 0, 'todayCases': 0, 'riskScore': 40.0, 'severity': 'MEDIUM',
+        }
+
+
+    def test_points_match_dicts(self):
+        """Test MapPoint records carry the same fields as the dicts"""
+        regions = [{'country': 'USA', 'lat': 37.1, 'lng': -95.7, 'cases': 5, 'riskScore': 78.5}]
+        points = DataNormalizer.normalize_map_points(regions)
+
+        assert isinstance(points[0], MapPoint)
+        assert not hasattr(points[0], '__dict__')
+        assert points[0].to_dict() == DataNormalizer.normalize_map_data(regions)[0]
+
+    def test_bad_input_uses_fallback(self):
+        """Test non-list input falls back to the default markers"""
+        points = DataNormalizer.normalize_map_points(None)
+        assert [p.to_dict() for p in points] == DataNormalizer._get_fallback_map_data()
+
+
+class TestPredictions:
+    """Test prediction normalization"""
+
+    def test_average_and_high_risk(self):
+        """Test confidence is averaged and high-risk regions are picked"""
+        result = DataNormalizer.normalize_predictions([
+            {'region': 'USA', 'confidence': 0.9, 'severity': 'CRITICAL'},
+            {'region': 'Peru', 'confidence': 0.8, 'severity': 'LOW'},
+            {'confidence': 0.7, 'severity': 'HIGH'},
+            {'region': 'Chad'},
+        ])
+
+        assert result['confidence_average'] == 0.6
+        assert result['high_risk_regions'] == ['USA', 'Region2']
+
+
+class TestInputValidation:
+    """Test malformed payloads are rejected up front"""
+
+    @pytest.mark.parametrize('method, fallback', [
+        ('normalize_chart_data', '_get_fallback_chart_data'),
+        ('normalize_predictions', '_get_fallback_predictions'),
+        ('normalize_alerts', '_get_fallback_alerts'),
+        ('normalize_analytics', '_get_fallback_analytics'),
+    ])
+    def test_wrong_container_uses_fallback(self, method, fallback):
+        """Test a payload of the wrong type returns the fallback"""
+        assert getattr(DataNormalizer, method)('oops') == getattr(DataNormalizer, fallback)()
+
+    def test_dashboard_rejects_non_dict(self):
+        """Test the dashboard fallback keeps the caller's timestamp"""
+        metrics = DataNormalizer.normalize_dashboard_metrics(None, now_iso='T')
+        assert metrics['total_records'] == 700000000
+        assert metrics['latest_ingestion']['timestamp'] == 'T'
+
+    def test_malformed_rows_raise(self):
+        """Test bad rows surface instead of being masked by a fallback"""
+        with pytest.raises(AttributeError):
+            DataNormalizer.normalize_chart_data([None])
+
+
+class TestAlerts:
+    """Test alert normalization"""
+
+    def test_counts_by_type(self):
+        """Test alerts are counted per type and unknown types are ignored"""
+        alerts = [{'type': 'CRITICAL'}, {'type': 'WARNING'}, {'type': 'WARNING'}, {'type': 'OTHER'}, {}]
+        result = DataNormalizer.normalize_alerts(alerts)
+
+        assert result['critical_count'] == 1
+        assert result['warning_count'] == 2
+        assert result['info_count'] == 0
+        assert result['total_active'] == 3
+        assert result['alerts'] is alerts
+
+
+class TestAnalytics:
+    """Test analytics normalization"""
+
+    def test_values_coerced_to_float(self):
+        """Test nested and top-level values become floats, non-numeric become 0.0"""
+        result = DataNormalizer.normalize_analytics({
+            'heart_rate': {'mean': 78, 'stddev': '12.5', 'note': 'n/a', 'missing': None},
+            'health_risk_index': 68.5,
+            'label': 'high',
+        })
+
+        assert result == {
+            'heart_rate': {'mean': 78.0, 'stddev': 12.5, 'note': 0.0, 'missing': 0.0},
+            'health_risk_index': 68.5,
+            'label': 0.0,
+        }
+        assert type(result['heart_rate']['mean']) is float
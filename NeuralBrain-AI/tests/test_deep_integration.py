@@ -130,7 +130,7 @@ class TestRealDataFetching:
         if 'data_status' in stats:
             status = stats['data_status']
             logger.info(f"📍 Data Status: {status}")
-            assert status in ['FRESH', 'FALLBACK']
+            assert status in ['FRESH', 'CACHED', 'FALLBACK']
         
         if 'data_timestamp' in stats:
             timestamp = stats['data_timestamp']
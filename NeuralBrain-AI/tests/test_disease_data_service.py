@@ -0,0 +1,267 @@
+"""
+Disease Data Service - Test Suite
+
+Test coverage:
+- Regional outbreak risk
+- Response reshaping (countries, historical)
+- Fallback data
+- Response cache
+
+Network access is mocked; see test_deep_integration.py for live tests.
+"""
+
+import pytest
+import requests
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ReadTimeoutError
+
+from services.disease_data_service import MAX_RETRY_AFTER, DiseaseDataService, _risk_score
+
+
+class TestRegionalRisk:
+    """Test regional outbreak risk scoring"""
+
+    def test_risk_score(self):
+        """Test the score combines case rate and fatality rate, capped at 100"""
+        # 1000 per 100k -> 100, 1% CFR -> 2
+        assert _risk_score(1000, 10, 100000) == pytest.approx(100)
+        assert _risk_score(100, 1, 100000) == pytest.approx(10 + 2)
+        assert _risk_score(0, 0, 100000) == 0
+        assert _risk_score(100, 1, 0) == 0
+
+    @patch.object(DiseaseDataService, 'get_countries_data')
+    def test_top_twenty_countries(self, mock_countries):
+        """Test risks are computed for the first 20 countries only"""
+        mock_countries.return_value = [
+            {'country': f'C{i}', 'cases': 50, 'deaths': 1, 'population': 100000, 'data_status': 'FRESH'}
+            for i in range(25)
+        ]
+
+        risks = DiseaseDataService.get_regional_outbreak_risk()
+        mock_countries.assert_called_once_with(limit=20)
+        assert len(risks) == 20
+        assert risks[0] == {
+            'country': 'C0', 'cases': 50, 'deaths': 1, 'riskScore': 9.0, 'data_status': 'FRESH',
+        }
+
+
+class TestCountriesData:
+    """Test per-country reshaping"""
+
+    @patch.object(DiseaseDataService, '_make_request_with_retry')
+    def test_sorted_by_cases(self, mock_request):
+        """Test countries are ordered by cases, descending and stable"""
+        mock_request.return_value = [
+            {'country': 'A', 'cases': 5},
+            {'country': 'B'},
+            {'country': 'C', 'cases': 9},
+            {'country': 'D', 'cases': 5},
+        ], 'SUCCESS', datetime.utcnow()
+
+        countries = DiseaseDataService.get_countries_data()
+        assert [c['country'] for c in countries] == ['C', 'A', 'D', 'B']
+        assert all(c['data_status'] == 'FRESH' for c in countries)
+
+    @patch.object(DiseaseDataService, '_make_request_with_retry')
+    def test_limit_keeps_top_countries(self, mock_request):
+        """Test limit trims to the largest countries before stamping metadata"""
+        rows = [{'country': f'C{i}', 'cases': i} for i in range(30)]
+        mock_request.return_value = rows, 'SUCCESS', datetime.utcnow()
+
+        countries = DiseaseDataService.get_countries_data(limit=3)
+        assert [c['country'] for c in countries] == ['C29', 'C28', 'C27']
+        assert 'data_status' not in rows[3]
+
+
+class TestHistoricalData:
+    """Test historical timeline reshaping"""
+
+    @patch.object(DiseaseDataService, '_make_request_with_retry')
+    def test_timeline_rows(self, mock_request):
+        """Test aligned and misaligned series both combine per date"""
+        mock_request.return_value = {
+            'cases': {'1/1/25': 10, '1/2/25': 12},
+            'deaths': {'1/1/25': 1, '1/2/25': 2},
+            'recovered': {'1/2/25': 7},
+        }, 'SUCCESS', datetime.utcnow()
+
+        rows = DiseaseDataService.get_historical_data(days=2)
+        assert [(r['date'], r['cases'], r['deaths'], r['recovered']) for r in rows] == [
+            ('1/1/25', 10, 1, 0),
+            ('1/2/25', 12, 2, 7),
+        ]
+        assert rows[0]['data_timestamp'] == rows[1]['data_timestamp']
+
+
+class TestFetchStatus:
+    """Test failure statuses travel with each fetch, not through class state"""
+
+    @pytest.fixture(autouse=True)
+    def sibling_succeeded(self, monkeypatch):
+        """Simulate a concurrent fetch that succeeded after ours failed"""
+        monkeypatch.setattr(DiseaseDataService, '_last_fetch_status', 'SUCCESS')
+
+    @patch.object(DiseaseDataService, '_make_request_with_retry', return_value=(None, 'TIMEOUT', None))
+    def test_global_fallback_keeps_own_error(self, mock_request):
+        """Test the global fallback reports its own failure"""
+        stats = DiseaseDataService.get_global_stats()
+        assert (stats['data_status'], stats['data_error']) == ('FALLBACK', 'TIMEOUT')
+
+    @patch.object(DiseaseDataService, '_make_request_with_retry', return_value=(None, 'FAILED_HTTP_503', None))
+    def test_list_fallbacks_keep_own_error(self, mock_request):
+        """Test the countries and historical fallbacks report their own failure"""
+        countries = DiseaseDataService.get_countries_data()
+        history = DiseaseDataService.get_historical_data(days=3)
+        assert {row['data_error'] for row in countries + history} == {'FAILED_HTTP_503'}
+
+
+class TestFallbacks:
+    """Test fallback payloads"""
+
+    def test_fallbacks_are_independent_copies(self):
+        """Test mutating a returned fallback leaves the next one untouched"""
+        countries = DiseaseDataService._get_fallback_countries_data()
+        countries[0]['data_status'] = 'FALLBACK'
+        history = DiseaseDataService._get_fallback_historical_data(5)
+        history[0]['data_status'] = 'FALLBACK'
+
+        assert 'data_status' not in DiseaseDataService._get_fallback_countries_data()[0]
+        assert 'data_status' not in DiseaseDataService._get_fallback_historical_data(5)[0]
+
+    def test_historical_trend(self):
+        """Test the synthetic trend grows daily and ends yesterday"""
+        history = DiseaseDataService._get_fallback_historical_data(3)
+
+        yesterday = (datetime.utcnow() - timedelta(days=1)).strftime('%m/%d/%Y')
+        assert [row['cases'] for row in history] == [600000000, 602700000, 605400000]
+        assert history[0]['deaths'] == 6000000
+        assert history[-1]['date'] == yesterday
+
+
+class TestSession:
+    """Test the shared HTTP session"""
+
+    def test_session_is_shared(self):
+        """Test one pooled session is created and reused"""
+        session = DiseaseDataService._get_session()
+        assert DiseaseDataService._get_session() is session
+        assert session.headers['User-Agent'] == 'NeuralBrain-AI/1.0'
+        assert session.get_adapter('https://disease.sh')._pool_maxsize == 16
+
+    def test_adapter_retries(self):
+        """Test retries and backoff are delegated to the adapter"""
+        retry = DiseaseDataService._get_session().get_adapter('https://disease.sh').max_retries
+        assert retry.total == DiseaseDataService.MAX_RETRIES - 1
+        assert retry.backoff_factor == DiseaseDataService.RETRY_DELAY
+        assert 503 in retry.status_forcelist
+
+    def test_retry_after_capped(self):
+        """Test a long Retry-After cannot park the caller past MAX_RETRY_AFTER"""
+        retry = DiseaseDataService._get_session().get_adapter('https://disease.sh').max_retries
+        response = MagicMock(headers={'Retry-After': '3600'})
+
+        assert retry.get_retry_after(response) == MAX_RETRY_AFTER
+        assert retry.increment('GET', '/all').get_retry_after(response) == MAX_RETRY_AFTER
+        assert retry.get_retry_after(MagicMock(headers={})) is None
+
+
+class TestGetAllData:
+    """Test the concurrent multi-endpoint fetch"""
+
+    @patch.object(DiseaseDataService, 'get_historical_data', return_value=[{'date': '1/1/25'}])
+    @patch.object(DiseaseDataService, 'get_countries_data', return_value=[{'country': 'USA'}])
+    @patch.object(DiseaseDataService, 'get_global_stats', return_value={'cases': 1})
+    def test_combines_endpoints(self, mock_global, mock_countries, mock_historical):
+        """Test each endpoint is fetched once and returned under its key"""
+        data = DiseaseDataService.get_all_data(days=30)
+
+        assert data == {
+            'global_stats': {'cases': 1},
+            'countries': [{'country': 'USA'}],
+            'historical': [{'date': '1/1/25'}],
+        }
+        mock_historical.assert_called_once_with(30)
+        mock_global.assert_called_once()
+        mock_countries.assert_called_once()
+
+
+class TestResponseCache:
+    """Test the in-process TTL cache"""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        DiseaseDataService.clear_cache()
+        yield
+        DiseaseDataService.clear_cache()
+
+    @pytest.fixture
+    def mock_get(self):
+        response = MagicMock(status_code=200)
+        response.content = b'{"cases": 10}'
+        with patch('services.disease_data_service.requests.Session.get', return_value=response) as get:
+            yield get
+
+    def test_repeat_requests_hit_cache(self, mock_get):
+        """Test a fresh response is served from memory and callers get copies"""
+        first, status, fetched_at = DiseaseDataService._make_request_with_retry('/all')
+        first['data_status'] = 'FRESH'
+        second, cached_status, cached_at = DiseaseDataService._make_request_with_retry('/all')
+
+        assert mock_get.call_count == 1
+        assert (status, cached_status) == ('SUCCESS', 'CACHED')
+        assert second == {'cases': 10}
+        assert cached_at == fetched_at
+
+    def test_cache_hits_report_real_age(self, mock_get, monkeypatch):
+        """Test cached responses are stamped CACHED with their fetch time and age"""
+        assert DiseaseDataService.get_global_stats()['data_status'] == 'FRESH'
+        fetched_at = DiseaseDataService._cache['/all'][1] - timedelta(seconds=120)
+        monotonic, _, payload = DiseaseDataService._cache['/all']
+        DiseaseDataService._cache['/all'] = (monotonic, fetched_at, payload)
+        # Another endpoint's later fetch must not leak into this one's stamp
+        monkeypatch.setattr(DiseaseDataService, '_last_fetch_time', datetime.utcnow())
+
+        stats = DiseaseDataService.get_global_stats()
+        assert stats['data_status'] == 'CACHED'
+        assert stats['data_timestamp'] == fetched_at.isoformat()
+        assert 120 <= stats['data_age_seconds'] < 130
+
+    def test_http_error_not_cached(self, mock_get):
+        """Test a failed status is reported and never cached"""
+        mock_get.return_value.status_code = 503
+
+        assert DiseaseDataService._make_request_with_retry('/all')[0] is None
+        assert DiseaseDataService.get_data_status()['last_fetch_status'] == 'FAILED_HTTP_503'
+        assert DiseaseDataService._cache == {}
+
+    def test_invalid_json(self, mock_get):
+        """Test an unparseable body is reported as invalid JSON"""
+        mock_get.return_value.content = b'<html>'
+
+        assert DiseaseDataService._make_request_with_retry('/all')[0] is None
+        assert DiseaseDataService.get_data_status()['last_fetch_status'] == 'INVALID_JSON'
+
+    def test_read_timeout_after_retries(self, mock_get):
+        """Test read timeouts wrapped by the retry adapter still report TIMEOUT"""
+        reason = ReadTimeoutError(None, '/all', 'Read timed out.')
+        mock_get.side_effect = requests.ConnectionError(MaxRetryError(None, '/all', reason))
+
+        assert DiseaseDataService._make_request_with_retry('/all') == (None, 'TIMEOUT', None)
+        assert DiseaseDataService.get_data_status()['last_fetch_status'] == 'TIMEOUT'
+
+    def test_connection_error(self, mock_get):
+        """Test refused connections are reported as connection errors"""
+        reason = NewConnectionError(None, 'Connection refused')
+        mock_get.side_effect = requests.ConnectionError(MaxRetryError(None, '/all', reason))
+
+        assert DiseaseDataService._make_request_with_retry('/all')[0] is None
+        assert DiseaseDataService.get_data_status()['last_fetch_status'] == 'CONNECTION_ERROR'
+
+    def test_expired_entries_refetch(self, mock_get, monkeypatch):
+        """Test entries past CACHE_TTL are fetched again"""
+        monkeypatch.setattr(DiseaseDataService, 'CACHE_TTL', 0)
+        DiseaseDataService._make_request_with_retry('/all')
+        DiseaseDataService._make_request_with_retry('/all')
+
+        assert mock_get.call_count == 2
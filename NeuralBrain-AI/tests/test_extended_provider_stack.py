@@ -8,13 +8,26 @@ Tests for:
 - ExtendedAIProviderOrchestrator with lock system
 """
 
+import json
 import pytest
 import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
+from services import groq_provider as groq_module
 from services.groq_provider import GroqProvider, get_groq_provider
 from services.cloudflare_provider import CloudflareProvider, get_cloudflare_provider
 from services.huggingface_provider import HuggingFaceProvider, get_huggingface_provider
-from services.extended_orchestrator import ExtendedAIProviderOrchestrator, get_extended_orchestrator
+from services.extended_orchestrator import (
+    HEDGE_MAX_IN_FLIGHT,
+    LATENCY_WINDOW_MAX_SAMPLES,
+    ExtendedAIProviderOrchestrator,
+    _backoff_delay,
+    _classify_error,
+    get_extended_orchestrator,
+)
 from services.provider_lock import ProviderLockManager
 
 
@@ -63,6 +76,70 @@ class TestGroqProvider:
         assert response == "Forecast: Cases increasing"
         assert error is None
     
+    def test_groq_streaming_records_ttft(self, groq_provider):
+        """Test stream=True joins the chunks and times the first token"""
+        def chunk(content):
+            return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+        
+        groq_provider.available = True
+        groq_provider.client = MagicMock()
+        groq_provider.client.chat.completions.create.return_value = iter(
+            [SimpleNamespace(choices=[]), chunk(None), chunk("Rise "), chunk("expected ")]
+        )
+        
+        success, response, error = groq_provider.send_request("Test", stream=True)
+        assert (success, response, error) == (True, "Rise expected", None)
+        assert groq_provider.client.chat.completions.create.call_args.kwargs['stream'] is True
+        assert groq_provider.last_ttft is not None and groq_provider.last_ttft >= 0
+        
+        groq_provider.client.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content="ok"))]
+        )
+        groq_provider.send_request("Test")
+        assert groq_provider.last_ttft is None
+    
+    def test_groq_health_check_cached(self, groq_provider, monkeypatch):
+        """Test health probes are reused within the TTL unless forced"""
+        calls = []
+        groq_provider.available = True
+        groq_provider.client = MagicMock()
+        monkeypatch.setattr(
+            groq_provider, 'send_request',
+            lambda **kwargs: calls.append(kwargs) or (True, "ok", None)
+        )
+        
+        first = groq_provider.health_check()
+        first['healthy'] = False
+        assert groq_provider.health_check()['healthy'] is True
+        assert len(calls) == 1
+        
+        groq_provider.health_check(force=True)
+        assert len(calls) == 2
+        
+        monkeypatch.setattr('services.groq_provider.HEALTH_CHECK_TTL', 0.0)
+        groq_provider.health_check()
+        assert len(calls) == 3
+    
+    def test_groq_sdk_imported_only_when_configured(self, monkeypatch):
+        """Test the groq SDK is imported lazily, once, and only with a key"""
+        clients = []
+        
+        class FakeGroq:
+            def __init__(self, api_key):
+                clients.append(api_key)
+        
+        monkeypatch.setattr('services.groq_provider._GROQ_CLS', None)
+        monkeypatch.setitem(sys.modules, 'groq', SimpleNamespace(Groq=FakeGroq))
+        
+        GroqProvider(api_key="")
+        assert groq_module._GROQ_CLS is None
+        
+        assert GroqProvider(api_key="k1").is_available()
+        assert groq_module._GROQ_CLS is FakeGroq
+        monkeypatch.delitem(sys.modules, 'groq')
+        assert GroqProvider(api_key="k2").is_available()
+        assert clients == ['k1', 'k2']
+    
     def test_groq_not_available(self):
         """Test Groq when not configured"""
         provider = GroqProvider(api_key="")
@@ -90,6 +167,12 @@ class TestCloudflareProvider:
         assert cloudflare_provider.provider_name == "Cloudflare"
         assert cloudflare_provider.model == "llama-2-7b"
     
+    def test_cloudflare_slots(self, cloudflare_provider):
+        """Test instances carry no per-instance __dict__"""
+        assert not hasattr(cloudflare_provider, '__dict__')
+        with pytest.raises(AttributeError):
+            cloudflare_provider.unexpected = True
+    
     def test_cloudflare_provider_name(self, cloudflare_provider):
         """Test provider name"""
         assert cloudflare_provider.get_provider_name() == "Cloudflare"
@@ -101,16 +184,16 @@ class TestCloudflareProvider:
         assert 'llama-2-7b' in info['models']
         assert 'Edge-local' in info['speed']
     
-    @patch('services.cloudflare_provider.requests.post')
+    @patch('services.cloudflare_provider.requests.Session.post')
     def test_cloudflare_send_request_success(self, mock_post, cloudflare_provider):
         """Test successful Cloudflare request"""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'result': {
                 'response': 'Forecast: Stable trend'
             }
-        }
+        }).encode()
         mock_post.return_value = mock_response
         
         success, response, error = cloudflare_provider.send_request("Test prompt")
@@ -118,6 +201,47 @@ class TestCloudflareProvider:
         assert success is True
         assert response == "Forecast: Stable trend"
         assert error is None
+        assert mock_post.call_args.kwargs['headers']['Authorization'] == "Bearer test-token"
+        assert mock_post.call_args.args[0].endswith("/accounts/test-account/ai/run/llama-2-7b")
+        
+        cloudflare_provider.send_request("Test prompt", model="mistral-7b")
+        assert mock_post.call_args.args[0].endswith("/ai/run/mistral-7b")
+    
+    @patch('services.cloudflare_provider.requests.Session.post')
+    def test_cloudflare_response_shapes(self, mock_post, cloudflare_provider):
+        """Test 'text' results are accepted and unknown shapes fail cleanly"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+        
+        mock_response.content = json.dumps({'result': {'text': 'Rising\n'}}).encode()
+        assert cloudflare_provider.send_request("Test") == (True, "Rising", None)
+        
+        mock_response.content = json.dumps({'errors': [], 'success': True}).encode()
+        success, response, error = cloudflare_provider.send_request("Test")
+        assert success is False and response is None
+        assert "errors" in error and "success" in error
+    
+    @patch('services.cloudflare_provider.requests.Session.post')
+    def test_cloudflare_send_batch(self, mock_post, cloudflare_provider):
+        """Test batch requests return one result per prompt, in order"""
+        def reply(url, data, headers, timeout):
+            prompt = json.loads(data)['prompt']
+            response = MagicMock()
+            response.status_code = 200
+            response.content = json.dumps({'result': {'response': f"echo {prompt}"}}).encode()
+            return response
+        mock_post.side_effect = reply
+        
+        results = cloudflare_provider.send_batch([f"p{i}" for i in range(5)], max_workers=3)
+        
+        assert [r[1] for r in results] == [f"echo p{i}" for i in range(5)]
+        assert all(success for success, _, _ in results)
+        assert cloudflare_provider.send_batch([]) == []
+        assert {c.args[0] for c in mock_post.call_args_list} == {cloudflare_provider._url_for("llama-2-7b")}
+        
+        offline = CloudflareProvider(account_id="", api_token="")
+        assert [r[0] for r in offline.send_batch(["a", "b"])] == [False, False]
     
     def test_cloudflare_not_available(self):
         """Test Cloudflare when not configured"""
@@ -154,7 +278,7 @@ class TestHuggingFaceProvider:
         assert 'chronos' in info['models'][0].lower()
         assert 'time-series' in info['specialty'].lower()
     
-    @patch('services.huggingface_provider.requests.post')
+    @patch('services.huggingface_provider.requests.Session.post')
     def test_huggingface_send_request_success(self, mock_post, huggingface_provider):
         """Test successful HuggingFace request"""
         mock_response = MagicMock()
@@ -234,6 +358,427 @@ class TestExtendedOrchestrator:
         assert orchestrator.lock_manager is not None
 
 
+class FakeProvider:
+    """Scripted provider: replies after a delay, or fails with an error"""
+    
+    def __init__(self, name, response="ok", error=None, delay=0.0, available=True, fail_first=0):
+        self.provider_name = name
+        self.response = response
+        self.error = error
+        self.delay = delay
+        self.available = available
+        self.fail_first = fail_first
+        self.calls = 0
+        self.models = []
+    
+    def is_available(self):
+        return self.available
+    
+    def get_provider_name(self):
+        return self.provider_name
+    
+    def send_request(self, prompt, model=None, temperature=0.3, max_tokens=500, stream=False):
+        self.calls += 1
+        self.stream_requested = stream
+        self.models.append(model)
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error and (not self.fail_first or self.calls <= self.fail_first):
+            return False, None, self.error
+        return True, self.response, None
+
+
+class TestOrchestratorRouting:
+    """Routing behaviour against scripted providers and an isolated lock file"""
+    
+    @pytest.fixture
+    def lock_manager(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ProviderLockManager, 'LOCK_STATE_FILE', str(tmp_path / 'provider_lock.json'))
+        return ProviderLockManager()
+    
+    @pytest.fixture
+    def orchestrator(self, lock_manager):
+        orchestrator = ExtendedAIProviderOrchestrator()
+        orchestrator.lock_manager = lock_manager
+        orchestrator.providers = {
+            'openai': FakeProvider('OpenAI', error='HTTP 500'),
+            'gemini': FakeProvider('Gemini', response='slow', delay=0.3),
+            'groq': FakeProvider('Groq', response='fast', delay=0.01),
+            'cloudflare': FakeProvider('Cloudflare', available=False),
+            'huggingface': FakeProvider('HuggingFace'),
+        }
+        return orchestrator
+    
+    def test_hedge_returns_first_success(self, orchestrator, lock_manager):
+        """Test the fastest successful candidate wins and failures are skipped"""
+        lock_manager.acquire_lock('openai')
+        
+        start = time.perf_counter()
+        success, response, provider = orchestrator.get_prediction("p", hedge=True)
+        
+        # k=2 races openai (fails) and gemini (slow but succeeds)
+        assert (success, response, provider) == (True, 'slow', 'gemini')
+        assert time.perf_counter() - start < 1.0
+        assert set(orchestrator.last_latency) == {'openai', 'gemini'}
+    
+    def test_hedge_candidates_skip_unavailable(self, orchestrator, lock_manager):
+        """Test candidates start at the lock and skip unconfigured providers"""
+        lock_manager.acquire_lock('groq')
+        assert orchestrator._hedge_candidates(3) == ['groq', 'openai', 'gemini']
+        
+        orchestrator.providers['groq'].available = False
+        orchestrator.invalidate_availability()
+        assert orchestrator._hedge_candidates(3) == ['openai', 'gemini', 'huggingface']
+    
+    def test_hedge_picks_faster_provider(self, orchestrator, lock_manager):
+        """Test a fast responder beats a slow one regardless of order"""
+        lock_manager.acquire_lock('gemini')
+        
+        success, response, provider = orchestrator.get_prediction_hedged("p", k=3)
+        assert (success, response, provider) == (True, 'fast', 'groq')
+    
+    def test_hedge_saturated_pool_goes_single_shot(self, orchestrator, lock_manager):
+        """Test a call that can't reserve k slots is sent to the locked provider alone"""
+        lock_manager.acquire_lock('groq')
+        assert orchestrator._reserve_hedge_slots(HEDGE_MAX_IN_FLIGHT - 1)
+        
+        success, response, provider = orchestrator.get_prediction("p", hedge=True)
+        assert (success, response, provider) == (True, 'fast', 'groq')
+        assert set(orchestrator.last_latency) == {'groq'}
+    
+    def test_hedge_stragglers_hold_slots_until_done(self, orchestrator, lock_manager):
+        """Test a losing request keeps its worker slot until it actually finishes"""
+        lock_manager.acquire_lock('groq')
+        orchestrator.providers['openai'] = FakeProvider('OpenAI', response='late', delay=0.3)
+        
+        success, _, provider = orchestrator.get_prediction_hedged("p", k=2)
+        assert (success, provider) == (True, 'groq')
+        assert orchestrator._hedge_in_flight >= 1  # openai is still running
+        
+        deadline = time.monotonic() + 2.0
+        while orchestrator._hedge_in_flight and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert orchestrator._hedge_in_flight == 0
+    
+    def test_pick_provider_prefers_priority_until_measured(self, orchestrator):
+        """Test unmeasured routing follows priority, then the EWMA takes over"""
+        assert orchestrator._pick_provider() == 'openai'
+        
+        for name, seconds in [('openai', 2.0), ('gemini', 1.0), ('groq', 0.1), ('huggingface', 0.5)]:
+            orchestrator._record_latency(name, seconds, 'x' * 40)
+        assert orchestrator._pick_provider() == 'groq'
+        
+        orchestrator.providers['groq'].available = False
+        orchestrator.invalidate_availability()
+        assert orchestrator._pick_provider() == 'huggingface'
+    
+    def test_availability_cached_until_ttl_or_failover(self, orchestrator, lock_manager, monkeypatch):
+        """Test is_available() is reused within the TTL and re-probed after failover"""
+        assert orchestrator._is_available('groq')
+        orchestrator.providers['groq'].available = False
+        assert orchestrator._is_available('groq')
+        
+        monkeypatch.setattr('services.extended_orchestrator.AVAILABILITY_TTL', 0.0)
+        assert not orchestrator._is_available('groq')
+        
+        monkeypatch.setattr('services.extended_orchestrator.AVAILABILITY_TTL', 60.0)
+        orchestrator.providers['groq'].available = True
+        lock_manager.acquire_lock('gemini')
+        orchestrator._trigger_failover("p", "Global", None, 0.3, 500)
+        assert orchestrator._is_available('groq')
+    
+    def test_unavailable_lock_fails_over_directly(self, orchestrator, lock_manager):
+        """Test an unconfigured locked provider fails over without counting a failure"""
+        lock_manager.acquire_lock('cloudflare')
+        
+        success, response, provider = orchestrator.get_prediction("p")
+        assert (success, response, provider) == (True, 'ok', 'huggingface')
+        assert lock_manager.get_locked_provider() == 'huggingface'
+        assert lock_manager.get_status()['consecutive_failures'] == 0
+    
+    def test_model_route_bypasses_lock(self, orchestrator, lock_manager):
+        """Test a provider-specific model goes straight to its provider"""
+        lock_manager.acquire_lock('openai')
+        
+        success, response, provider = orchestrator.get_prediction("p", model='llama-3.1-8b-instant')
+        assert (success, response, provider) == (True, 'fast', 'groq')
+        assert orchestrator.providers['openai'].calls == 0
+        assert lock_manager.get_locked_provider() == 'openai'
+    
+    def test_failed_model_route_falls_back_to_lock(self, orchestrator, lock_manager):
+        """Test a failed routed call falls back to the locked provider's default model"""
+        lock_manager.acquire_lock('huggingface')
+        orchestrator.providers['groq'].error = "HTTP 400: bad request"
+        
+        success, response, provider = orchestrator.get_prediction("p", model='llama-3.1-8b-instant')
+        assert (success, response, provider) == (True, 'ok', 'huggingface')
+        assert orchestrator.providers['huggingface'].models == [None]
+    
+    def test_model_routes_file(self, lock_manager, tmp_path, monkeypatch):
+        """Test MODEL_ROUTING_FILE extends the defaults and drops unknown providers"""
+        path = tmp_path / 'model_routing.json'
+        path.write_text(json.dumps({'my-model': 'gemini', 'gpt-4o': 'nobody'}))
+        monkeypatch.setenv('MODEL_ROUTING_FILE', str(path))
+        
+        routes = ExtendedAIProviderOrchestrator().model_routes
+        assert routes['my-model'] == 'gemini'
+        assert routes['llama-2-7b'] == 'cloudflare'
+        assert 'gpt-4o' not in routes
+    
+    def test_status_rebuilt_only_on_state_change(self, orchestrator, lock_manager):
+        """Test polls reuse the status until the lock, latency or availability changes"""
+        builds = []
+        real_build = orchestrator._build_provider_status
+        orchestrator._build_provider_status = lambda: builds.append(1) or real_build()
+        
+        first = orchestrator.get_provider_status()
+        assert orchestrator.get_provider_status() == first
+        assert len(builds) == 1
+        
+        lock_manager.acquire_lock('groq')
+        assert orchestrator.get_provider_status()['locked_provider'] == 'groq'
+        orchestrator._record_latency('groq', 0.5, 'x' * 40)
+        assert orchestrator.get_provider_status()['latency']['groq']['samples_last_hour'] == 1
+        orchestrator.providers['gemini'].available = False
+        orchestrator.invalidate_availability()
+        assert orchestrator.get_provider_status()['providers']['gemini']['available'] is False
+        assert len(builds) == 4
+    
+    def test_health_check_all_runs_concurrently(self, orchestrator, monkeypatch):
+        """Test probes run in parallel and slow ones are cut off at the timeout"""
+        def probe(seconds, healthy=True):
+            def health_check():
+                time.sleep(seconds)
+                return {'healthy': healthy}
+            return health_check
+        
+        orchestrator.providers['openai'].health_check = probe(0.2)
+        orchestrator.providers['gemini'].health_check = probe(0.2, healthy=False)
+        orchestrator.providers['groq'].health_check = probe(1.0)
+        monkeypatch.setattr('services.extended_orchestrator.HEALTH_CHECK_TIMEOUT', 0.5)
+        
+        start = time.perf_counter()
+        health = orchestrator.health_check_all()
+        assert time.perf_counter() - start < 0.9
+        
+        assert list(health) == ['openai', 'gemini', 'groq', 'cloudflare', 'huggingface']
+        assert health['openai'] == {'healthy': True}
+        assert health['gemini'] == {'healthy': False}
+        assert health['groq']['healthy'] is False
+        assert 'timed out' in health['groq']['reason']
+        assert health['cloudflare'] == {'healthy': False, 'reason': 'Not configured'}
+        assert health['huggingface'] == {'healthy': True, 'status': 'available'}
+    
+    def test_predictions_batch_fans_out(self, orchestrator, lock_manager):
+        """Test a batch runs on the locked provider and is keyed by region"""
+        lock_manager.acquire_lock('groq')
+        
+        results = orchestrator.get_predictions_batch([('US', 'p1'), ('FR', 'p2'), ('JP', 'p3')])
+        assert results == {region: (True, 'fast', 'groq') for region in ('US', 'FR', 'JP')}
+        assert orchestrator.providers['groq'].calls == 3
+    
+    def test_predictions_batch_uses_native_batch(self, orchestrator, lock_manager):
+        """Test providers with send_batch get the whole batch in one call"""
+        lock_manager.acquire_lock('huggingface')
+        batches = []
+        orchestrator.providers['huggingface'].send_batch = (
+            lambda prompts, **kwargs: batches.append(prompts) or
+            [(True, p.upper(), None) for p in prompts]
+        )
+        
+        results = orchestrator.get_predictions_batch([('US', 'p1'), ('FR', 'p2')])
+        assert batches == [['p1', 'p2']]
+        assert results == {'US': (True, 'P1', 'huggingface'), 'FR': (True, 'P2', 'huggingface')}
+    
+    def test_predictions_batch_retries_failures_singly(self, orchestrator, lock_manager):
+        """Test prompts that fail in the batch fall back to get_prediction"""
+        lock_manager.acquire_lock('huggingface')
+        orchestrator.providers['huggingface'].send_batch = (
+            lambda prompts, **kwargs: [(True, 'ok', None), (False, None, "HTTP 400: bad")]
+        )
+        
+        results = orchestrator.get_predictions_batch([('US', 'p1'), ('FR', 'p2')])
+        assert results == {'US': (True, 'ok', 'huggingface'), 'FR': (True, 'ok', 'huggingface')}
+        assert orchestrator.providers['huggingface'].calls == 1
+        assert orchestrator.get_predictions_batch([]) == {}
+    
+    def test_capabilities_introspected_once(self, orchestrator):
+        """Test capability bits are computed on first use and then reused"""
+        groq = orchestrator.providers['groq']
+        info = orchestrator._info('groq')
+        assert (info.has_health_check, info.has_send_batch, info.streams) == (False, False, False)
+        
+        groq.send_batch = lambda prompts, **kwargs: []
+        assert orchestrator._info('groq') is info
+        assert not orchestrator._info('groq').has_send_batch
+    
+    def test_status_reuses_static_info(self, orchestrator):
+        """Test provider names are looked up once and reported per provider"""
+        orchestrator.get_provider_status()
+        orchestrator.providers['groq'].provider_name = 'Renamed'
+        
+        status = orchestrator.get_provider_status()['providers']
+        assert status['groq'] == {'available': True, 'name': 'Groq', 'model_info': None}
+        assert status['cloudflare']['available'] is False
+    
+    def test_latency_ewma(self, orchestrator):
+        """Test samples are smoothed per token and kept in the hourly window"""
+        orchestrator._record_latency('groq', 1.0, 'x' * 40)
+        orchestrator._record_latency('groq', 2.0, 'x' * 40)
+        
+        assert orchestrator.latency_ewma['groq'] == pytest.approx(0.3 * 0.2 + 0.7 * 0.1)
+        stats = orchestrator.get_latency_stats()['groq']
+        assert stats['samples_last_hour'] == 2
+        assert stats['mean_seconds_last_hour'] == pytest.approx(1.5)
+    
+    def test_latency_window_bounded(self, orchestrator):
+        """Test the sample window keeps at most LATENCY_WINDOW_MAX_SAMPLES"""
+        for _ in range(LATENCY_WINDOW_MAX_SAMPLES + 10):
+            orchestrator._record_latency('groq', 1.0, 'x' * 40)
+        
+        assert orchestrator.latency_window['groq'].maxlen == LATENCY_WINDOW_MAX_SAMPLES
+        assert orchestrator.get_latency_stats()['groq']['samples_last_hour'] == LATENCY_WINDOW_MAX_SAMPLES
+    
+    def test_latency_recorded_concurrently(self, orchestrator):
+        """Test worker threads can record while stats and status are read"""
+        errors = []
+        
+        def record():
+            for _ in range(2000):
+                orchestrator._record_latency('groq', 0.5, 'x' * 40)
+        
+        def read():
+            try:
+                for _ in range(200):
+                    orchestrator.get_latency_stats()
+                    orchestrator.get_provider_status()
+            except RuntimeError as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        threads.append(threading.Thread(target=read))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert errors == []
+        assert orchestrator._latency_version == 8000
+    
+    def test_ttft_feeds_routing(self, orchestrator):
+        """Test streaming providers report TTFT, which the router prices in"""
+        groq = orchestrator.providers['groq']
+        groq.supports_streaming = True
+        groq.last_ttft = 0.008
+        
+        orchestrator._timed_request('groq', "p", None, 0.3, 500)
+        assert groq.stream_requested
+        assert orchestrator.ttft_ewma['groq'] == pytest.approx(0.008)
+        assert orchestrator.get_latency_stats()['groq']['ewma_ttft_seconds'] == pytest.approx(0.008)
+        
+        # Same throughput, but a slow first token loses to a quick one
+        orchestrator.latency_ewma.update(groq=0.001, huggingface=0.001)
+        orchestrator.ttft_ewma['groq'] = 2.0
+        orchestrator.ttft_ewma['huggingface'] = 0.1
+        for name in ('openai', 'gemini'):
+            orchestrator.latency_ewma[name] = 1.0
+        assert orchestrator._pick_provider() == 'huggingface'
+    
+    def test_unlocked_request_locks_fastest(self, orchestrator, lock_manager):
+        """Test an unlocked orchestrator locks the fastest measured provider"""
+        lock_manager.release_lock("test")
+        orchestrator.providers['openai'].error = None
+        orchestrator._record_latency('openai', 3.0, 'x' * 40)
+        orchestrator._record_latency('gemini', 3.0, 'x' * 40)
+        orchestrator._record_latency('groq', 0.1, 'x' * 40)
+        orchestrator._record_latency('huggingface', 3.0, 'x' * 40)
+        
+        success, response, provider = orchestrator.get_prediction("p")
+        assert (success, provider) == (True, 'groq')
+        assert lock_manager.get_locked_provider() == 'groq'
+        assert orchestrator.get_latency_stats()['groq']['samples_last_hour'] == 2
+    
+    def test_classify_error(self):
+        """Test provider error strings are bucketed by retryability"""
+        assert _classify_error("HTTP 429: Too Many Requests") == 'rate_limit'
+        assert _classify_error("Rate limit reached for model") == 'rate_limit'
+        assert _classify_error("HTTP 503: Service Unavailable") == 'transient'
+        assert _classify_error("Cloudflare request timeout") == 'transient'
+        assert _classify_error("HTTP 401: Invalid API key") == 'permanent'
+        assert _classify_error("max_tokens 500 exceeds the model limit") == 'permanent'
+        assert _classify_error(None) == 'permanent'
+    
+    def test_backoff_delay(self):
+        """Test delays grow exponentially, are capped, and honour Retry-After"""
+        assert 0.5 * 0.85 <= _backoff_delay(0, "HTTP 503") <= 0.5 * 1.15
+        assert 2.0 * 0.85 <= _backoff_delay(2, "HTTP 503") <= 2.0 * 1.15
+        assert _backoff_delay(20, "HTTP 503") <= 8.0 * 1.15
+        assert _backoff_delay(0, "HTTP 429: retry-after: 3") == 3.0
+        assert _backoff_delay(0, "Retry-After: 600") == 8.0
+    
+    def test_transient_error_retried_before_failure(self, orchestrator, lock_manager, monkeypatch):
+        """Test a transient blip is retried and never counts as a failure"""
+        sleeps = []
+        monkeypatch.setattr('services.extended_orchestrator.time.sleep', sleeps.append)
+        lock_manager.acquire_lock('openai')
+        orchestrator.providers['openai'].fail_first = 2
+        
+        success, response, provider = orchestrator.get_prediction("p")
+        assert (success, response, provider) == (True, 'ok', 'openai')
+        assert orchestrator.providers['openai'].calls == 3
+        assert len(sleeps) == 2
+        assert lock_manager.get_status()['consecutive_failures'] == 0
+    
+    def test_permanent_error_not_retried(self, orchestrator, lock_manager, monkeypatch):
+        """Test a permanent error returns after one call and counts once"""
+        sleeps = []
+        monkeypatch.setattr('services.extended_orchestrator.time.sleep', sleeps.append)
+        lock_manager.acquire_lock('openai')
+        orchestrator.providers['openai'].error = "HTTP 401: Invalid API key"
+        
+        success, _, _ = orchestrator.get_prediction("p")
+        assert not success
+        assert orchestrator.providers['openai'].calls == 1
+        assert sleeps == []
+        assert lock_manager.get_status()['consecutive_failures'] == 1
+    
+    def test_rate_limit_cools_down_and_fails_over(self, orchestrator, lock_manager, monkeypatch):
+        """Test a 429 puts the provider on cooldown and fails over past it"""
+        sleeps = []
+        monkeypatch.setattr('services.extended_orchestrator.time.sleep', sleeps.append)
+        lock_manager.acquire_lock('openai')
+        orchestrator.providers['openai'].error = "HTTP 429: Retry-After: 120"
+        orchestrator.providers['gemini'].delay = 0
+        
+        success, response, provider = orchestrator.get_prediction("p")
+        assert (success, response, provider) == (True, 'slow', 'gemini')
+        assert orchestrator.providers['openai'].calls == 1
+        assert sleeps == []
+        assert orchestrator._cooling_down('openai')
+        assert orchestrator.cooldowns['openai'] - time.monotonic() == pytest.approx(120, abs=1)
+        assert orchestrator._pick_provider() != 'openai'
+    
+    def test_failover_skips_cooling_and_unavailable(self, orchestrator, lock_manager):
+        """Test failover walks past throttled and unconfigured providers"""
+        lock_manager.acquire_lock('gemini')
+        orchestrator.cooldowns['groq'] = time.monotonic() + 60
+        
+        assert orchestrator._next_usable_provider('gemini') == 'huggingface'
+        assert orchestrator._next_usable_provider('huggingface') == 'openai'
+        
+        success, response, provider = orchestrator._trigger_failover("p", "Global", None, 0.3, 500)
+        assert (success, response, provider) == (True, 'ok', 'huggingface')
+        assert lock_manager.get_locked_provider() == 'huggingface'
+    
+    def test_cooldown_expires_and_clears_on_success(self, orchestrator):
+        """Test an expired cooldown re-admits the provider and success clears it"""
+        orchestrator.cooldowns['groq'] = time.monotonic() - 1
+        assert orchestrator._usable('groq')
+        
+        orchestrator._timed_request('groq', "p", None, 0.3, 500)
+        assert 'groq' not in orchestrator.cooldowns
+
+
 class TestProviderIntegration:
     """Integration tests for all providers with lock system"""
     
@@ -247,6 +792,15 @@ class TestProviderIntegration:
         assert cloudflare is not None
         assert huggingface is not None
     
+    def test_http_providers_share_one_pool(self):
+        """Test Cloudflare and HuggingFace reuse the orchestrator's session"""
+        orchestrator = ExtendedAIProviderOrchestrator()
+        session = orchestrator._http_session
+        
+        assert orchestrator.providers['cloudflare']._session is session
+        assert orchestrator.providers['huggingface']._session is session
+        assert session.get_adapter('https://api.cloudflare.com')._pool_maxsize == 50
+    
     def test_extended_orchestrator_singleton(self):
         """Test extended orchestrator singleton"""
         orch1 = get_extended_orchestrator()
@@ -254,6 +808,11 @@ class TestProviderIntegration:
         
         assert orch1 is orch2  # Same instance
     
+    def test_groq_provider_singleton(self):
+        """Test the Groq factory and orchestrator share one provider and client"""
+        assert get_groq_provider() is get_groq_provider()
+        assert ExtendedAIProviderOrchestrator().providers['groq'] is get_groq_provider()
+    
     def test_all_providers_have_required_methods(self):
         """Test all providers have required methods"""
         providers = [
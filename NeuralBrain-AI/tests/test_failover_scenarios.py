@@ -8,6 +8,7 @@ Comprehensive tests for failover behaviors:
 - Frontend data consistency guarantees
 """
 
+import dataclasses
 import pytest
 from unittest.mock import Mock, patch
 from services.provider_lock import ProviderLockManager
@@ -183,13 +184,21 @@ class TestFrontendDataConsistency:
         forecast = engine.normalize_forecast(provider_output, 'openai', actual_data, historical)
         engine.cache_forecast('USA', forecast)
         
-        # Try to modify original
-        forecast.actual_cases = 999999
+        # Try to modify original - ForecastData is frozen
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            forecast.actual_cases = 999999
         
-        # Retrieve - should have expected value  
-        # Note: ForecastData is a dataclass, references may be shared
+        # Nested forecast points are read-only too
+        with pytest.raises(TypeError):
+            forecast.forecasted_cases[0]['value'] = 999999
+        
+        # Changing the provider output afterwards does not leak into the forecast
+        provider_output['forecasted_cases'][0]['value'] = 1
+        
+        # Retrieve - should have expected value
         cached = engine.get_cached_forecast('USA')
         assert cached.actual_cases == 100000
+        assert cached.forecasted_cases[0]['value'] == 100000
 
 
 class TestProviderPriorityOrdering:
@@ -108,6 +108,79 @@ class TestHealthMetricsCollector:
         history = collector.get_history("provider3", limit=10)
         assert len(history) == 10
     
+    def test_get_history_returns_newest_tail(self, collector):
+        """Test history returns the latest entries, oldest first"""
+        for i in range(5):
+            collector.record_health_check("provider8", True, latency_ms=i + 1)
+        
+        assert [m["latency_ms"] for m in collector.get_history("provider8", limit=3)] == [3, 4, 5]
+        assert len(collector.get_history("provider8", limit=50)) == 5
+    
+    def test_get_last_error(self, collector):
+        """Test the last error only reflects the most recent check"""
+        assert collector.get_last_error("provider9") is None
+        
+        collector.record_health_check("provider9", False, error_message="timeout")
+        assert collector.get_last_error("provider9") == "timeout"
+        
+        collector.record_health_check("provider9", True)
+        assert collector.get_last_error("provider9") is None
+    
+    def test_record_logs_lazily(self, collector, caplog):
+        """Test the record log keeps its arguments unformatted and always includes status"""
+        with caplog.at_level("INFO", logger="services.health_monitor"):
+            collector.record_health_check("provider10", False)
+        
+        record = caplog.records[-1]
+        assert record.args == ("provider10", "❌", None)
+        assert "Provider: provider10 | Status: ❌" in record.getMessage()
+    
+    def test_stats_window_uses_epoch_timestamps(self, collector):
+        """Test the stats window and cleanup compare stored epoch seconds"""
+        collector.record_health_check("provider4", False)
+        collector.record_health_check("provider4", True, latency_ms=50)
+        collector.metrics["provider4"][0].ts -= 600
+        
+        stats = collector.get_provider_stats("provider4", window_seconds=300)
+        assert stats["check_count"] == 1
+        assert stats["error_rate"] == 0.0
+        
+        collector.clear_old_metrics(older_than_seconds=300)
+        assert len(collector.get_history("provider4")) == 1
+    
+    def test_rolling_stats_match_full_scan(self):
+        """Test running totals agree with a rescan after cap evictions"""
+        collector = HealthMetricsCollector(history_size=5)
+        for i in range(12):
+            collector.record_health_check("provider6", i % 3 != 0, latency_ms=i * 10 or None)
+        
+        rolling = collector.get_provider_stats("provider6")
+        rescan = collector.get_provider_stats("provider6", window_seconds=301)
+        assert rolling == rescan
+        assert rolling["check_count"] == 5
+        assert rolling["avg_latency_ms"] == 90.0
+        
+    def test_rolling_stats_expire_with_window(self, collector):
+        """Test entries leaving the window are subtracted from the totals"""
+        collector.record_health_check("provider7", False, latency_ms=500)
+        collector.record_health_check("provider7", True, latency_ms=100)
+        assert collector.get_provider_stats("provider7")["error_rate"] == 50.0
+        
+        collector.metrics["provider7"][0].ts -= 600
+        stats = collector.get_provider_stats("provider7")
+        assert stats["check_count"] == 1
+        assert stats["avg_latency_ms"] == 100.0
+        assert len(collector._windows["provider7"].entries) == 1
+    
+    def test_metric_timestamp_formatted_on_demand(self, collector):
+        """Test to_dict renders the stored epoch as a UTC ISO timestamp"""
+        collector.record_health_check("provider5", True)
+        metric = collector.metrics["provider5"][0]
+        
+        entry = metric.to_dict()
+        assert entry["timestamp"] == datetime.utcfromtimestamp(metric.ts).isoformat()
+        assert abs(datetime.fromisoformat(entry["timestamp"]) - datetime.utcnow()) < timedelta(seconds=5)
+    
     def test_thread_safety(self, collector):
         """Test thread-safe operations"""
         results = []
@@ -126,6 +199,24 @@ class TestHealthMetricsCollector:
         # Should have metrics (exact count depends on deque maxlen timing)
         assert stats["check_count"] > 0
 
+    def test_per_provider_locks(self, collector):
+        """Test each provider gets its own lock and readers don't register providers"""
+        def record_metrics(provider):
+            for i in range(50):
+                collector.record_health_check(provider, i % 2 == 0)
+        
+        threads = [threading.Thread(target=record_metrics, args=(f"p{i}",)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert [collector.get_provider_stats(f"p{i}")["check_count"] for i in range(4)] == [50] * 4
+        assert len({id(lock) for lock in collector.locks.values()}) == 4
+        
+        assert collector.get_history("never_seen") == []
+        assert "never_seen" not in collector.metrics
+
 
 class TestBackgroundHealthMonitor:
     """Test background health monitor"""
@@ -190,7 +281,24 @@ class TestBackgroundHealthMonitor:
         """Test that starting twice doesn't cause issues"""
         monitor.start()
         monitor.start()  # Should not error
+
+        monitor.stop()
+    
+    def test_stop_interrupts_wait(self, mock_orchestrator):
+        """Test stop() wakes the loop instead of waiting out the interval"""
+        monitor = BackgroundHealthMonitor(orchestrator=mock_orchestrator, check_interval_seconds=60)
+        monitor.start()
+        time.sleep(0.1)
         
+        start = time.monotonic()
+        monitor.stop()
+        assert time.monotonic() - start < 1
+        assert not monitor.monitor_thread.is_alive()
+        
+        # A restarted monitor runs again rather than seeing the old stop signal
+        monitor.start()
+        time.sleep(0.1)
+        assert monitor.monitor_thread.is_alive()
         monitor.stop()
     
     def test_check_all_providers(self, monitor, mock_orchestrator):
@@ -302,6 +410,35 @@ class TestBackgroundHealthMonitor:
         # gemini has 100% error rate = unavailable, not degraded
         assert summary["provider_stats"]["unavailable"] >= 1 or summary["provider_stats"]["degraded"] >= 0
     
+    def test_health_reports_cached_until_metrics_change(self, monitor):
+        """Test health reads are reused until a check is recorded"""
+        monitor.metrics_collector.record_health_check("openai", True)
+        
+        all_health = monitor.get_all_providers_health()
+        summary = monitor.get_health_summary()
+        assert monitor.get_all_providers_health() is all_health
+        assert monitor.get_health_summary() is summary
+        
+        monitor.metrics_collector.record_health_check("openai", False)
+        assert monitor.get_all_providers_health() is not all_health
+        refreshed = monitor.get_health_summary()
+        assert refreshed is not summary
+        assert refreshed["providers"][0]["failure_count"] == 1
+    
+    def test_health_cache_expires(self, monitor, monkeypatch):
+        """Test cached reports expire after the TTL and on check cycles"""
+        assert monitor.cache_ttl == 1  # min(check_interval, HEALTH_CACHE_TTL)
+        all_health = monitor.get_all_providers_health()
+        
+        now = time.monotonic()
+        monkeypatch.setattr("services.health_monitor.time.monotonic", lambda: now + 2)
+        expired = monitor.get_all_providers_health()
+        assert expired is not all_health
+        
+        monitor.provider_consecutive_failures["openai"] = 1
+        monitor._check_all_providers()
+        assert monitor.get_all_providers_health()[0].consecutive_failures == 0
+    
     def test_get_metrics_history(self, monitor):
         """Test getting metrics history"""
         for i in range(10):
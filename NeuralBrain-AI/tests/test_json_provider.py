@@ -0,0 +1,62 @@
+"""
+JSON Provider - Test Suite
+
+Test coverage:
+- OrjsonProvider output matches Flask's stdlib provider
+- Types orjson can't serialize natively
+- Stdlib fallback when orjson is not installed
+"""
+
+from datetime import datetime, timezone
+from types import MappingProxyType
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from services import json_provider
+from services.data_normalizer import DataNormalizer
+from services.json_provider import OrjsonProvider
+
+
+@pytest.fixture
+def app():
+    """Flask app serializing through OrjsonProvider"""
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    return app
+
+
+class TestOrjsonProvider:
+    """Test orjson-backed serialization"""
+
+    def test_matches_stdlib_provider(self, app):
+        """Test sorted keys and RFC 822 dates come out as Flask's provider loads them"""
+        payload = {'b': 1, 'a': [1.5, None, 'x'], 'when': datetime(2024, 1, 2, tzinfo=timezone.utc)}
+        stdlib = DefaultJSONProvider(app)
+
+        assert app.json.loads(app.json.dumps(payload)) == stdlib.loads(stdlib.dumps(payload))
+        assert list(app.json.loads(app.json.dumps(payload))) == ['a', 'b', 'when']
+
+    def test_map_points_serialize_like_dicts(self, app):
+        """Test MapPoint records serialize the same as the normalized dicts"""
+        regions = [{'country': 'USA', 'lat': 37.1, 'lng': -95.7, 'cases': 5, 'riskScore': 78.5}]
+        points = DataNormalizer.normalize_map_points(regions)
+
+        assert app.json.loads(app.json.dumps(points)) == DataNormalizer.normalize_map_data(regions)
+
+    def test_non_native_types(self, app):
+        """Test read-only mappings and oversized ints still serialize"""
+        assert app.json.loads(app.json.dumps(MappingProxyType({'a': 1}))) == {'a': 1}
+        assert app.json.loads(app.json.dumps({'n': 2 ** 70})) == {'n': 2 ** 70}
+
+    def test_indent_uses_stdlib(self, app):
+        """Test pretty-printing is handed to the stdlib encoder"""
+        assert app.json.dumps({'a': 1}, indent=2) == '{\n  "a": 1\n}'
+
+    def test_without_orjson(self, app, monkeypatch):
+        """Test the provider falls back to the stdlib when orjson is missing"""
+        monkeypatch.setattr(json_provider, 'orjson', None)
+
+        assert app.json.dumps({'b': 1, 'a': 2}) == DefaultJSONProvider(app).dumps({'b': 1, 'a': 2})
+        assert app.json.loads('{"a": 1}') == {'a': 1}
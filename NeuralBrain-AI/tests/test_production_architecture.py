@@ -11,6 +11,7 @@ Comprehensive tests for:
 """
 
 import pytest
+import dataclasses
 import json
 import os
 import tempfile
@@ -142,6 +143,26 @@ class TestProviderLockManager:
         
         # Should still have only one lock
         assert lock_manager.is_locked('openai')
+    
+    def test_reset_without_failures_skips_write(self, lock_manager):
+        """Test a no-op reset neither audits nor rewrites the state file"""
+        lock_manager.acquire_lock('openai')
+        trail_len = len(lock_manager.get_audit_trail())
+        written = lock_manager._written_version
+        
+        lock_manager.reset_failure_count()
+        assert len(lock_manager.get_audit_trail()) == trail_len
+        assert lock_manager._written_version == written
+    
+    def test_stale_snapshot_not_written(self, lock_manager):
+        """Test a snapshot older than the last write never overwrites it"""
+        lock_manager.acquire_lock('openai')
+        with lock_manager._lock:
+            stale = lock_manager._snapshot_state()
+        lock_manager.acquire_lock('gemini')
+        
+        lock_manager._write_state(stale)
+        assert ProviderLockManager().get_locked_provider() == 'gemini'
 
 
 class TestBottleneckForecastingEngine:
@@ -218,6 +239,21 @@ class TestBottleneckForecastingEngine:
         assert cases[0]['day'] == 1
         assert cases[-1]['value'] == 135000
     
+    def test_extract_cases_forecast_from_json_string(self, engine, sample_forecast_output):
+        """Test JSON string output is parsed, and malformed JSON yields no forecast"""
+        cases = engine._extract_cases_forecast(json.dumps(sample_forecast_output))
+        assert cases == sample_forecast_output['forecasted_cases']
+        assert engine._extract_cases_forecast('{"forecasted_cases": [') == []
+    
+    def test_extract_forecast_alternate_keys(self, engine):
+        """Test alternate provider field names are tried in order"""
+        points = [{'day': 1, 'value': 10}]
+        assert engine._extract_cases_forecast({'predicted_cases': points}) == points
+        assert engine._extract_cases_forecast({'forecast': 'n/a', 'predicted_cases': points}) == points
+        assert engine._extract_cases_forecast({'forecast': 'n/a'}) == []
+        assert engine._extract_deaths_forecast({'deaths_forecast': points}) == points
+        assert engine._extract_deaths_forecast({}) == []
+    
     def test_confidence_calculation(self, engine, sample_actual_data, sample_forecast_output, sample_historical_data):
         """Test confidence score calculation"""
         conf_openai = engine._calculate_confidence(
@@ -338,6 +374,63 @@ class TestBottleneckForecastingEngine:
         engine.clear_cache()
         assert len(engine.get_all_cached_forecasts()) == 0
     
+    def test_cached_forecasts_snapshot(self, engine, sample_actual_data, sample_forecast_output, sample_historical_data):
+        """Test get_all_cached_forecasts is a read-only snapshot unaffected by later writes"""
+        forecast = engine.normalize_forecast(
+            sample_forecast_output,
+            'openai',
+            sample_actual_data,
+            sample_historical_data
+        )
+        
+        engine.cache_forecast('USA', forecast)
+        snapshot = engine.get_all_cached_forecasts()
+        engine.cache_forecast('Chad', forecast)
+        engine.clear_cache()
+        
+        assert dict(snapshot) == {'USA': forecast}
+        with pytest.raises(TypeError):
+            snapshot['Chad'] = forecast
+    
+    def test_assess_all_matches_individual_helpers(self, engine, sample_actual_data, sample_forecast_output):
+        """Test the fused assessment agrees with the per-metric helpers"""
+        forecasts = sample_forecast_output['forecasted_cases']
+        risk_level, risk_score, prob, trend = engine._assess_all(forecasts, sample_actual_data)
+        
+        assert (risk_level, risk_score) == engine._assess_risk(forecasts, sample_actual_data, [])
+        assert prob == engine._calculate_outbreak_probability(forecasts, sample_actual_data, [])
+        assert trend == engine._determine_trend(forecasts, sample_actual_data, [])
+        assert trend == 'increasing'
+    
+    def test_volatility_calculation(self, engine):
+        """Test volatility is the mean absolute day-over-day change"""
+        historical = [{'cases': c} for c in (100, 110, 0, 50, 55)]
+        # 100->110: 0.1, 110->0: 1.0, 0->50 skipped, 50->55: 0.1
+        assert engine._calculate_volatility(historical) == pytest.approx(0.4)
+        assert engine._calculate_volatility([{'cases': 100}]) == 0.0
+        assert engine._calculate_volatility([]) == 0.0
+    
+    def test_normalize_batch(self, engine, sample_actual_data, sample_forecast_output, sample_historical_data):
+        """Test batch normalization matches per-region results and skips bad regions"""
+        flat_output = {'forecasted_cases': [{'day': 1, 'value': 100}], 'forecasted_deaths': []}
+        results = engine.normalize_batch(
+            {'USA': sample_forecast_output, 'Chad': flat_output, 'Nowhere': flat_output,
+             'Broken': {'forecasted_cases': [{'day': 1, 'value': 'many'}]}},
+            {'USA': sample_actual_data, 'Chad': {'cases': 100, 'deaths': 1}, 'Broken': {'cases': 5}},
+            {'USA': sample_historical_data},
+            provider_name='openai'
+        )
+        
+        assert set(results) == {'USA', 'Chad'}
+        assert results['Chad'].region == 'Chad'
+        assert results['Chad'].trend == 'stable'
+        assert results['USA'].timestamp == results['Chad'].timestamp
+        
+        single = engine.normalize_forecast(
+            sample_forecast_output, 'openai', sample_actual_data, sample_historical_data
+        )
+        assert dataclasses.replace(results['USA'], timestamp=single.timestamp) == single
+    
     def test_forecast_to_dict(self, engine, sample_actual_data, sample_forecast_output, sample_historical_data):
         """Test ForecastData conversion to dict"""
         forecast = engine.normalize_forecast(
@@ -352,6 +445,9 @@ class TestBottleneckForecastingEngine:
         assert data_dict['region'] == 'USA'
         assert data_dict['provider'] == 'openai'
         assert 'timestamp' in data_dict
+        assert set(data_dict) == {f.name for f in dataclasses.fields(ForecastData)}
+        assert data_dict['forecasted_cases'] == sample_forecast_output['forecasted_cases']
+        json.dumps(data_dict)
 
 
 class TestProviderLockAndBottleneckIntegration:
@@ -0,0 +1,111 @@
+"""
+Prediction Scheduler - Test Suite
+
+Test coverage:
+- Prediction cache storage
+- In-memory snapshot reuse and refresh
+- Pre-encoded section bodies
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip('apscheduler')
+
+from services.scheduler import PredictionScheduler
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path, monkeypatch):
+    """Point the scheduler at a throwaway cache file"""
+    path = tmp_path / 'cache' / 'latest_predictions.json'
+    monkeypatch.setattr(PredictionScheduler, '_CACHE_FILE', str(path))
+    monkeypatch.setattr(PredictionScheduler, '_snapshot', None)
+    return path
+
+
+class TestPredictionCache:
+    """Test the latest-predictions cache"""
+
+    def test_empty_without_file(self):
+        """Test nothing is cached before the first cycle"""
+        assert PredictionScheduler.get_latest_predictions() == {}
+        assert PredictionScheduler.get_latest_json('alerts') is None
+
+    def test_store_and_read(self, cache_file):
+        """Test stored sections round-trip and are served pre-encoded"""
+        PredictionScheduler._store_predictions({'alerts': {'b': 2, 'a': 1}, 'map_data': []})
+
+        assert PredictionScheduler.get_latest_predictions()['alerts'] == {'a': 1, 'b': 2}
+        assert json.loads(PredictionScheduler.get_latest_json('alerts')) == {'a': 1, 'b': 2}
+        assert PredictionScheduler.get_latest_json('missing') is None
+        assert not (cache_file.parent / 'latest_predictions.json.tmp').exists()
+
+    def test_snapshot_reused_until_file_changes(self, monkeypatch):
+        """Test the file is parsed once per write, not once per request"""
+        PredictionScheduler._store_predictions({'alerts': {'n': 1}})
+        first = PredictionScheduler.get_latest_predictions()
+
+        loads = []
+        real_load = json.load
+        monkeypatch.setattr('services.scheduler.json.load', lambda f: loads.append(f) or real_load(f))
+        assert PredictionScheduler.get_latest_predictions() is first
+        assert loads == []
+
+        PredictionScheduler._store_predictions({'alerts': {'n': 22}})
+        assert PredictionScheduler.get_latest_predictions()['alerts'] == {'n': 22}
+        assert len(loads) == 1
+
+
+class TestPredictionCycle:
+    """Test the hourly cycle's normalize-and-store steps"""
+
+    @pytest.fixture
+    def pipeline(self, monkeypatch):
+        """Stub the data, prediction and alert services with canned outputs"""
+        outputs = {
+            'regional': [{'country': 'USA', 'lat': 1.0, 'lng': 2.0, 'risk_score': 80}],
+            'forecast': [{'day': 1, 'predicted_cases': 10, 'confidence': 0.9}],
+            'alerts': [{'type': 'CRITICAL'}],
+            'analytics': {'heart_rate': {'mean': 70}},
+        }
+
+        class FakePredictionService:
+            def predict_outbreak_7_day(self, *args):
+                return outputs['forecast']
+
+            def predict_regional_risk(self, countries):
+                return outputs['regional']
+
+            def predict_health_analytics(self, *args):
+                return outputs['analytics']
+
+        monkeypatch.setattr('services.disease_data_service.DiseaseDataService.get_all_data', staticmethod(
+            lambda days=60: {
+                'global_stats': {'cases': 100, 'deaths': 1, 'recovered': 50},
+                'countries': [],
+                'historical': [{'date': '1/1/25', 'cases': 100}],
+            }
+        ))
+        monkeypatch.setattr('services.disease_data_service.DiseaseDataService.get_regional_outbreak_risk',
+                            staticmethod(lambda: []))
+        monkeypatch.setattr('services.prediction_service.PredictionService', FakePredictionService)
+        monkeypatch.setattr('services.alert_engine.AlertEngine.generate_alerts',
+                            staticmethod(lambda *args: outputs['alerts']))
+        return outputs
+
+    def test_malformed_section_falls_back_alone(self, pipeline):
+        """Test one bad row replaces only its own section with the fallback"""
+        from services.data_normalizer import DataNormalizer
+
+        pipeline['alerts'] = [None]
+        PredictionScheduler._run_predictions()
+
+        cached = PredictionScheduler.get_latest_predictions()
+        assert cached['alerts'] == DataNormalizer._get_fallback_alerts()
+        assert cached['dashboard_metrics']['total_records'] == 100
+        assert cached['chart_data']['labels'] == ['1/1/25']
+        assert cached['map_data'][0]['country'] == 'USA'
+        assert cached['predictions']['confidence_average'] == 0.9
+        assert cached['analytics'] == {'heart_rate': {'mean': 70.0}}